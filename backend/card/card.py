@@ -45,6 +45,16 @@ class Card:
         """详细字符串表示"""
         return f"Card(suit={self.suit}, rank={self.rank}, name='{self.name}', type={self.card_type})"
     
+    def copy(self) -> 'Card':
+        """复制牌（不重新查询牌属性配置，用于快速复制对局）
+        
+        Returns:
+            属性相同的新牌对象
+        """
+        card = Card.__new__(Card)
+        card.__dict__.update(self.__dict__)
+        return card
+    
     def is_equipment(self) -> bool:
         """是否为装备牌"""
         return self.card_type == CardType.EQUIPMENT
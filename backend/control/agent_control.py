@@ -0,0 +1,110 @@
+# 外部智能体操控模块
+"""把出牌、选目标、响应、弃牌等决策点交给外部智能体（如强化学习环境）的 Control 实现"""
+import queue
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Dict
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.control.control import Control
+from backend.card.card import Card
+from config.enums import ControlType, CardName
+
+
+class DecisionKind:
+    """决策点类型"""
+    SELECT_CARD = 0  # 出牌阶段选牌（可不出）
+    SELECT_TARGET = 1  # 选择目标
+    RESPONSE = 2  # 响应类用牌（可不用）
+    DISCARD = 3  # 弃牌（每次弃一张）
+
+    COUNT = 4
+
+
+@dataclass
+class Decision:
+    """一次决策请求
+
+    外部智能体用 options 的下标作答；options 中的 None 表示不出/不使用。
+    """
+    kind: int
+    options: List[Any]
+    context: str = ""
+    card_name: Optional[CardName] = None  # 响应类决策要求的牌名
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class GameAborted(Exception):
+    """外部智能体放弃当前对局（用于结束等待决策的游戏线程）"""
+
+
+class AgentControl(Control):
+    """外部智能体操控
+
+    游戏在单独的线程中运行。每到决策点，本操控把 Decision 放入请求队列并阻塞，
+    直到外部调用 submit_action 给出选项下标。
+    """
+
+    # 需要等待外部输入（复制对局时替换为规则操控）
+    interactive = True
+
+    def __init__(self, player_id: Optional[int] = None):
+        super().__init__(ControlType.AGENT, player_id)
+        self.requests: "queue.Queue[Optional[Decision]]" = queue.Queue()
+        self._actions: "queue.Queue[Optional[int]]" = queue.Queue()
+
+    def submit_action(self, action: int) -> None:
+        """提交当前决策的选项下标（由外部智能体调用）"""
+        self._actions.put(action)
+
+    def abort(self) -> None:
+        """放弃对局：正在等待决策的游戏线程会抛出 GameAborted"""
+        self._actions.put(None)
+
+    def _decide(self, decision: Decision) -> Any:
+        """发出决策请求并等待外部作答
+
+        Returns:
+            被选中的选项（非法下标按第一个选项处理）
+        """
+        self.requests.put(decision)
+        action = self._actions.get()
+        if action is None:
+            raise GameAborted()
+        if not 0 <= action < len(decision.options):
+            action = 0
+        return decision.options[action]
+
+    def select_card(self, available_cards: List[Card], context: str = "", available_targets: Dict[str, List[int]] = None) -> Optional[Card]:
+        """出牌阶段选牌：选项为可出的牌（来自 Player._get_playable_cards）和不出"""
+        if not available_cards:
+            return None
+        return self._decide(Decision(DecisionKind.SELECT_CARD, list(available_cards) + [None], context))
+
+    def select_targets(self, available_targets: List[int], card: Optional[Card] = None) -> List[int]:
+        """选择一个目标"""
+        if not available_targets:
+            return []
+        target = self._decide(Decision(DecisionKind.SELECT_TARGET, list(available_targets), extra={"card": card}))
+        return [target]
+
+    def ask_use_card_response(self, card_name: CardName, available_cards: List[Card], context: str = "") -> Optional[Card]:
+        """响应类用牌：选项为可用的牌和不使用"""
+        if not available_cards:
+            return None
+        return self._decide(Decision(DecisionKind.RESPONSE, list(available_cards) + [None], context, card_name))
+
+    def select_cards_to_discard(self, hand_cards: List[Card], count: int) -> List[Card]:
+        """弃牌：逐张选择要弃的牌"""
+        if count <= 0:
+            return []
+        if count >= len(hand_cards):
+            return hand_cards.copy()
+        remaining = list(hand_cards)
+        discarded = []
+        for i in range(count):
+            card = self._decide(Decision(DecisionKind.DISCARD, list(remaining), extra={"remaining": count - i}))
+            remaining.remove(card)
+            discarded.append(card)
+        return discarded
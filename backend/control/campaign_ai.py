@@ -9,7 +9,6 @@
 这些AI有明确的阵营意识，不依赖跳忠/跳反机制。
 """
 from typing import List, Optional, Dict, Any
-import random
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -91,11 +90,11 @@ class CanBingAI(Control):
                 target_hp[pid] = player_info.get("current_hp", 999)
         
         if not target_hp:
-            return [random.choice(targets)]
+            return [self.get_rng().choice(targets)]
         
         min_hp = min(target_hp.values())
         weakest = [pid for pid, hp in target_hp.items() if hp == min_hp]
-        return [random.choice(weakest)]
+        return [self.get_rng().choice(weakest)]
     
     def select_cards_for_use(self, available_cards: List[Card], available_targets_dict: Dict[str, List[int]]) -> tuple[Optional[Card], List[int]]:
         """选择出牌：优先使用攻击性卡牌"""
@@ -232,11 +231,11 @@ class AdouAI(Control):
                 target_hp[pid] = player_info.get("current_hp", 999)
         
         if not target_hp:
-            return [random.choice(targets)]
+            return [self.get_rng().choice(targets)]
         
         min_hp = min(target_hp.values())
         weakest = [pid for pid, hp in target_hp.items() if hp == min_hp]
-        return [random.choice(weakest)]
+        return [self.get_rng().choice(weakest)]
     
     def select_cards_for_use(self, available_cards: List[Card], available_targets_dict: Dict[str, List[int]]) -> tuple[Optional[Card], List[int]]:
         """选择出牌：优先自保，其次攻击敌人"""
@@ -364,11 +363,11 @@ class CaoJunAI(Control):
                 target_hp[pid] = player_info.get("current_hp", 999)
         
         if not target_hp:
-            return [random.choice(targets)]
+            return [self.get_rng().choice(targets)]
         
         min_hp = min(target_hp.values())
         weakest = [pid for pid, hp in target_hp.items() if hp == min_hp]
-        return [random.choice(weakest)]
+        return [self.get_rng().choice(weakest)]
     
     def select_cards_for_use(self, available_cards: List[Card], available_targets_dict: Dict[str, List[int]]) -> tuple[Optional[Card], List[int]]:
         """选择出牌：激进策略，优先输出"""
@@ -8,6 +8,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from backend.utils.logger import game_logger
 from config.enums import ControlType, CardName
 from backend.card.card import Card
+from backend.control.decision_budget import DecisionToken
 from communicator.comm_event import CommEvent, DrawCardEvent, PlayCardEvent, HPChangeEvent, DiscardCardEvent, EquipChangeEvent, DeathEvent
 from backend.control.event_handler import (
     EventHandler, DrawCardEventHandler, PlayCardEventHandler, HPChangeEventHandler,
@@ -22,6 +23,9 @@ class Control:
     使用策略模式处理各种事件
     """
     
+    # 是否需要等待外部输入（玩家、外部智能体）；复制对局时这类操控会替换为规则操控
+    interactive = False
+    
     def __init__(self, control_type: ControlType, player_id: Optional[int] = None):
         """初始化操控模块
         
@@ -33,6 +37,10 @@ class Control:
         self.player_id = player_id
         self.game_state: Dict[str, Any] = {}  # 存储当前游戏状态
         self.use_skill = True
+        # 当前决策的截止时间与取消令牌（ControlManager 设置了时间预算时，在决策期间设置）
+        self.decision_token: Optional[DecisionToken] = None
+        # 随机选择使用的随机数源（None表示使用全局random；模拟对局使用独立的random.Random，不影响实际对局）
+        self.decision_rng: Optional[random.Random] = None
         
         # 注册事件处理器（策略模式）
         self.event_handlers: Dict[type, EventHandler] = {
@@ -53,6 +61,26 @@ class Control:
         """
         self.use_skill = use_skill
     
+    def get_rng(self):
+        """获取随机选择使用的随机数源
+        
+        Returns:
+            独立的random.Random，或全局random模块
+        """
+        return self.decision_rng if self.decision_rng is not None else random
+    
+    def prepare_decision(self, decision: str, args: tuple) -> None:
+        """在调用线程上、决策计时开始之前为决策做准备（默认什么都不做）
+        
+        ControlManager 设置了时间预算时，决策在单独的线程中执行，超时后该线程在后台继续运行；
+        需要读取对局的操控（如搜索AI）应在这里复制对局，决策线程只使用复制品。
+        
+        Args:
+            decision: 决策方法名
+            args: 决策参数
+        """
+        pass
+    
     def select_card(self, available_cards: List[Card], context: str = "", available_targets: Dict[str, List[int]] = None) -> Optional[Card]:
         """选择要出的牌（正常出牌阶段）
         
@@ -66,7 +94,7 @@ class Control:
         """
         # 从可选牌中随机选择一张（默认实现）
         if available_cards:
-            return random.choice(available_cards)
+            return self.get_rng().choice(available_cards)
         return None
     
     def ask_use_card_response(self, card_name: CardName, available_cards: List[Card], context: str = "") -> Optional[Card]:
@@ -82,7 +110,7 @@ class Control:
         """
         # 默认实现：随机选择一张（子类可以覆盖）
         if available_cards:
-            return random.choice(available_cards)
+            return self.get_rng().choice(available_cards)
         return None
     
     def select_targets(self, available_targets: List[int], card: Optional[Card] = None) -> List[int]:
@@ -97,7 +125,7 @@ class Control:
         """
         # 从可选目标中随机选择一个
         if available_targets:
-            return [random.choice(available_targets)]
+            return [self.get_rng().choice(available_targets)]
         return []
     
     def filter_attackable_targets(self, targets: List[int], available_targets_dict: Dict[str, List[int]] = None) -> List[int]:
@@ -129,7 +157,7 @@ class Control:
         if count >= len(hand_cards):
             return hand_cards.copy()
         # 随机选择count张牌
-        return random.sample(hand_cards, count)
+        return self.get_rng().sample(hand_cards, count)
 
     def ask_activate_skill(self, skill_name: str, context: dict) -> bool:
         """询问是否发动某个技能。skill_name如"Lvmeng_Discard_NoDrop"，context可包含player_id、hand_cards等信息。
@@ -151,7 +179,7 @@ class Control:
         if target_hand_count <= 0:
             return None
         try:
-            return random.randrange(0, target_hand_count)
+            return self.get_rng().randrange(0, target_hand_count)
         except Exception:
             return None
     
@@ -191,3 +219,21 @@ class Control:
         """
         self.game_state = state
         game_logger.log_debug(f"Control状态已同步: {len(state.get('players', []))} 个其他玩家")
+    
+    def capture_state(self) -> Any:
+        """获取私有状态快照（用于游戏快照，子类有私有推断状态时覆盖）
+        
+        game_state 等可由 sync_state 重建的状态不需要保存
+        
+        Returns:
+            不可变的私有状态，默认无
+        """
+        return None
+    
+    def apply_state(self, state: Any) -> None:
+        """从快照恢复私有状态（与 capture_state 对应）
+        
+        Args:
+            state: capture_state 返回的私有状态
+        """
+        pass
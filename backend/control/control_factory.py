@@ -1,6 +1,6 @@
 # Control工厂模块
 """根据操控类型创建对应的Control实例"""
-from typing import Optional
+from typing import Any, Dict, Optional
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -9,6 +9,8 @@ from backend.control.control import Control
 from backend.control.simple_control import SimpleControl
 from backend.control.human_control import HumanControl
 from backend.control.campaign_ai import CanBingAI, AdouAI, CaoJunAI
+from backend.control.agent_control import AgentControl
+from backend.control.ismcts_control import ISMCTSControl
 from config.enums import ControlType
 
 
@@ -19,12 +21,14 @@ class ControlFactory:
     """
     
     @staticmethod
-    def create_control(control_type: ControlType, player_id: Optional[int] = None) -> Control:
+    def create_control(control_type: ControlType, player_id: Optional[int] = None,
+                       params: Optional[Dict[str, Any]] = None) -> Control:
         """创建Control实例
         
         Args:
             control_type: 操控类型
             player_id: 关联的玩家ID
+            params: 操控模块的参数（目前只有搜索AI使用，如 iterations、time_budget、rollout_turns）
             
         Returns:
             Control实例
@@ -41,13 +45,44 @@ class ControlFactory:
         elif control_type == ControlType.CAOJUN_AI:
             # 曹军AI：第二章专用
             return CaoJunAI(player_id)
+        elif control_type == ControlType.ISMCTS_AI:
+            # 搜索AI：出牌阶段使用信息集蒙特卡洛树搜索（战役中更强、可调的对手）
+            return ISMCTSControl(player_id, **(params or {}))
         elif control_type == ControlType.AI:
             # AI操控：暂时使用基类Control（后续可以实现AIControl）
             return Control(control_type, player_id)
         elif control_type == ControlType.HUMAN:
             # 玩家操控：返回 HumanControl（命令行/前端交互）
             return HumanControl(player_id)
+        elif control_type == ControlType.AGENT:
+            # 外部智能体操控：决策点交给外部（如强化学习环境）
+            return AgentControl(player_id)
         else:
             # 默认使用基类Control
             return Control(control_type, player_id)
 
+    
+    @staticmethod
+    def create_control_like(control: Control, control_type: Optional[ControlType] = None) -> Control:
+        """创建与已有Control同类的新实例（用于复制对局）
+        
+        复制的对局不能等待外部输入，因此玩家操控、外部智能体操控会替换为规则操控
+        
+        Args:
+            control: 原Control实例
+            control_type: 指定新的操控类型（可选，默认与原实例同类）
+            
+        Returns:
+            新的Control实例（不包含原实例的私有状态）
+        """
+        player_id = control.player_id
+        if control_type is not None:
+            new_control = ControlFactory.create_control(control_type, player_id)
+        elif control.interactive:
+            new_control = SimpleControl(player_id)
+        elif type(control) is Control:
+            new_control = Control(control.control_type, player_id)
+        else:
+            new_control = type(control)(player_id)
+        new_control.use_skill = control.use_skill
+        return new_control
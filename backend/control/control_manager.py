@@ -1,11 +1,15 @@
 # Control管理器模块
 """统一管理所有Control实例，负责事件分发和状态同步"""
-from typing import Dict, List, Optional, TYPE_CHECKING
+import time
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from backend.control.control import Control
+from backend.control.simple_control import SimpleControl
+from backend.control.knowledge_board import KnowledgeBoard
+from backend.control.decision_budget import DecisionBudget, run_with_deadline
 from backend.utils.logger import game_logger
 from communicator.comm_event import CommEvent, DrawCardEvent, PlayCardEvent, HPChangeEvent, DiscardCardEvent, EquipChangeEvent, DeathEvent
 
@@ -30,6 +34,9 @@ class ControlManager:
         """
         self.player_controller = player_controller
         self.controls: Dict[int, Control] = {}  # player_id -> Control
+        self.knowledge_board = KnowledgeBoard()  # 全局公开信息板（所有SimpleControl共享）
+        self.decision_budget: Optional[DecisionBudget] = None  # 决策时间预算（None表示不限时）
+        self._fallback_controls: Dict[int, SimpleControl] = {}  # 超时后代为决策的规则操控
         self._initialize_controls()
     
     def _initialize_controls(self) -> None:
@@ -39,8 +46,81 @@ class ControlManager:
         
         for player in self.player_controller.players:
             self.controls[player.player_id] = player.control
+            # 共享公开信息板：跳忠、跳反对所有观察者相同，每个事件只推断一次
+            if hasattr(player.control, 'set_knowledge_board'):
+                player.control.set_knowledge_board(self.knowledge_board)
         game_logger.log_info(f"ControlManager初始化完成，管理 {len(self.controls)} 个Control实例")
     
+    def set_decision_budget(self, per_decision: Optional[float] = None, per_game: Optional[float] = None,
+                            grace: float = 0.05) -> DecisionBudget:
+        """设置AI决策的时间预算（玩家、外部智能体等需要等待输入的操控不受限制）
+        
+        Args:
+            per_decision: 每次决策的时间上限（秒）
+            per_game: 每个座位整局决策的总时间上限（秒）
+            grace: 超时取消后等待操控返回当前结果的时间（秒）
+            
+        Returns:
+            时间预算（可查看各座位已用时间和超时次数）
+        """
+        self.decision_budget = DecisionBudget(per_decision, per_game, grace)
+        return self.decision_budget
+    
+    def decide(self, control: Control, decision: str, *args) -> Any:
+        """让操控模块做一次决策（select_card、select_targets、ask_use_card_response 等）
+        
+        设置了时间预算时，决策期间 control.decision_token 为本次决策的令牌；
+        超时未返回（或本局时间已用完）时改用规则操控（SimpleControl）决策，保证每次决策的延迟有上限。
+        
+        Args:
+            control: 操控模块
+            decision: 决策方法名
+            *args: 决策参数
+            
+        Returns:
+            决策结果
+        """
+        budget = self.decision_budget
+        if budget is None or control.interactive:
+            return getattr(control, decision)(*args)
+        
+        player_id = control.player_id
+        # 在计时开始前、在当前线程上准备（超时后决策线程在后台继续运行，只能使用准备好的复制品）
+        control.prepare_decision(decision, args)
+        token = budget.new_token(player_id)
+        if token.deadline is None:
+            # 预算未设置任何上限：直接决策
+            control.decision_token = token
+            try:
+                return getattr(control, decision)(*args)
+            finally:
+                control.decision_token = None
+        
+        start = time.perf_counter()
+        finished, result = False, None
+        if not token.expired():
+            control.decision_token = token
+            try:
+                finished, result = run_with_deadline(lambda: getattr(control, decision)(*args), token, budget.grace)
+            finally:
+                control.decision_token = None
+        budget.charge(player_id, time.perf_counter() - start)
+        if finished:
+            return result
+        
+        budget.record_timeout(player_id)
+        game_logger.log_warning(f"玩家{player_id} 的 {decision} 决策超时，改用规则操控")
+        return getattr(self._get_fallback_control(player_id), decision)(*args)
+    
+    def _get_fallback_control(self, player_id: int) -> SimpleControl:
+        """获取代为决策的规则操控（同步为当前可见状态）"""
+        fallback = self._fallback_controls.get(player_id)
+        if fallback is None:
+            fallback = self._fallback_controls[player_id] = SimpleControl(player_id)
+            fallback.set_knowledge_board(self.knowledge_board)
+        fallback.sync_state(self._get_visible_state(player_id))
+        return fallback
+    
     def notify_event(self, event: CommEvent) -> None:
         """通知所有Control关于游戏事件
         
@@ -171,92 +251,112 @@ class ControlManager:
         control.sync_state(visible_state)
     
     def _get_visible_state(self, player_id: int) -> Dict:
-        """获取指定玩家能看到的状态
+        """获取指定玩家能看到的状态（见 build_visible_state）
         
         Args:
             player_id: 玩家ID
             
         Returns:
-            可见状态字典，包含：
-            - self: 自己的完整信息（手牌、装备等）
-            - players: 其他玩家的公开信息（血量、装备、手牌数量等）
-            - deck_size: 牌堆剩余数量
-            - discard_pile_size: 弃牌堆数量
+            可见状态字典
         """
-        if not self.player_controller:
-            return {}
-        
-        player = self.player_controller.get_player(player_id)
-        if not player:
-            return {}
-        
-        # 自己的完整信息
-        self_info = {
-            "player_id": player.player_id,
-            "name": player.name,
-            "identity": player.identity.value if player.identity else None,
-            "character": player.character_name.value if player.character_name else None,
-            "max_hp": player.max_hp,
-            "current_hp": player.current_hp,
-            "status": player.status.value if player.status else None,
-            "hand_cards": [self._card_to_dict(card) for card in player.hand_cards],  # 完整手牌信息
-            "hand_count": len(player.hand_cards),
-            "weapon": self._card_to_dict(player.weapon) if player.weapon else None,
-            "armor": self._card_to_dict(player.armor) if player.armor else None,
-            "horse_plus": self._card_to_dict(player.horse_plus) if player.horse_plus else None,
-            "horse_minus": self._card_to_dict(player.horse_minus) if player.horse_minus else None,
-        }
-        
-        # 其他玩家的公开信息
-        players_info = []
-        for other_player in self.player_controller.players:
-            if other_player.player_id == player_id:
-                continue
-            
-            # 其他玩家只能看到公开信息
-            players_info.append({
-                "player_id": other_player.player_id,
-                "name": other_player.name,
-                "identity": other_player.identity.value if other_player.identity else None,
-                "character": other_player.character_name.value if other_player.character_name else None,
-                "max_hp": other_player.max_hp,
-                "current_hp": other_player.current_hp,
-                "status": other_player.status.value if other_player.status else None,
-                "hand_count": len(other_player.hand_cards),  # 只能看到手牌数量，不能看到具体牌
-                "weapon": self._card_to_dict(other_player.weapon) if other_player.weapon else None,
-                "armor": self._card_to_dict(other_player.armor) if other_player.armor else None,
-                "horse_plus": self._card_to_dict(other_player.horse_plus) if other_player.horse_plus else None,
-                "horse_minus": self._card_to_dict(other_player.horse_minus) if other_player.horse_minus else None,
-            })
-        
-        # 牌堆信息
-        deck = self.player_controller.deck
-        deck_info = {
-            "deck_size": len(deck.cards) if deck else 0,
-            "discard_pile_size": len(deck.discard_pile) if deck else 0,
-        }
-        
-        return {
-            "self": self_info,
-            "players": players_info,
-            "deck": deck_info,
-        }
+        return build_visible_state(self.player_controller, player_id)
     
     def _card_to_dict(self, card) -> Optional[Dict]:
-        """将Card对象转换为字典（用于状态同步）
-        
-        Args:
-            card: Card对象
-            
-        Returns:
-            字典表示，如果card为None则返回None
-        """
-        if card is None:
-            return None
-        
-        return {
-            "name": card.name_enum.value if hasattr(card.name_enum, 'value') else str(card.name_enum),
-            "suit": card.suit.value if hasattr(card.suit, 'value') else str(card.suit),
-            "rank": card.rank,
-        }
+        """将Card对象转换为字典（见 card_to_dict）"""
+        return card_to_dict(card)
+
+
+def build_visible_state(player_controller, player_id: int) -> Dict:
+    """获取指定玩家能看到的状态
+
+    ControlManager 同步状态和紧凑状态视图（CompactGameState）共用此函数，
+    player_controller 只需提供 players、get_player 和 deck（cards、discard_pile）。
+    
+    Args:
+        player_controller: 玩家控制器（或提供相同只读接口的对象）
+        player_id: 玩家ID
+
+    Returns:
+        可见状态字典，包含：
+        - self: 自己的完整信息（手牌、装备等）
+        - players: 其他玩家的公开信息（血量、装备、手牌数量等）
+        - deck_size: 牌堆剩余数量
+        - discard_pile_size: 弃牌堆数量
+    """
+    if not player_controller:
+        return {}
+
+    player = player_controller.get_player(player_id)
+    if not player:
+        return {}
+
+    # 自己的完整信息
+    self_info = {
+        "player_id": player.player_id,
+        "name": player.name,
+        "identity": player.identity.value if player.identity else None,
+        "character": player.character_name.value if player.character_name else None,
+        "max_hp": player.max_hp,
+        "current_hp": player.current_hp,
+        "status": player.status.value if player.status else None,
+        "hand_cards": [card_to_dict(card) for card in player.hand_cards],  # 完整手牌信息
+        "hand_count": len(player.hand_cards),
+        "weapon": card_to_dict(player.weapon) if player.weapon else None,
+        "armor": card_to_dict(player.armor) if player.armor else None,
+        "horse_plus": card_to_dict(player.horse_plus) if player.horse_plus else None,
+        "horse_minus": card_to_dict(player.horse_minus) if player.horse_minus else None,
+    }
+
+    # 其他玩家的公开信息
+    players_info = []
+    for other_player in player_controller.players:
+        if other_player.player_id == player_id:
+            continue
+
+        # 其他玩家只能看到公开信息
+        players_info.append({
+            "player_id": other_player.player_id,
+            "name": other_player.name,
+            "identity": other_player.identity.value if other_player.identity else None,
+            "character": other_player.character_name.value if other_player.character_name else None,
+            "max_hp": other_player.max_hp,
+            "current_hp": other_player.current_hp,
+            "status": other_player.status.value if other_player.status else None,
+            "hand_count": len(other_player.hand_cards),  # 只能看到手牌数量，不能看到具体牌
+            "weapon": card_to_dict(other_player.weapon) if other_player.weapon else None,
+            "armor": card_to_dict(other_player.armor) if other_player.armor else None,
+            "horse_plus": card_to_dict(other_player.horse_plus) if other_player.horse_plus else None,
+            "horse_minus": card_to_dict(other_player.horse_minus) if other_player.horse_minus else None,
+        })
+
+    # 牌堆信息
+    deck = player_controller.deck
+    deck_info = {
+        "deck_size": len(deck.cards) if deck else 0,
+        "discard_pile_size": len(deck.discard_pile) if deck else 0,
+    }
+
+    return {
+        "self": self_info,
+        "players": players_info,
+        "deck": deck_info,
+    }
+
+
+def card_to_dict(card) -> Optional[Dict]:
+    """将Card对象转换为字典（用于状态同步）
+
+    Args:
+        card: Card对象
+
+    Returns:
+        字典表示，如果card为None则返回None
+    """
+    if card is None:
+        return None
 
+    return {
+        "name": card.name_enum.value if hasattr(card.name_enum, 'value') else str(card.name_enum),
+        "suit": card.suit.value if hasattr(card.suit, 'value') else str(card.suit),
+        "rank": card.rank,
+    }
@@ -0,0 +1,121 @@
+# 决策时间预算模块
+"""操控模块决策的截止时间、取消令牌和每局时间预算"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+class DecisionToken:
+    """一次决策的截止时间与取消令牌
+
+    决策期间由 ControlManager 设置到 Control.decision_token 上。
+    可随时给出结果的操控（如搜索AI）应在 expired() 为True时尽快返回当前最好的结果，
+    并可通过 report_progress 报告进度（0~1）。
+    """
+
+    def __init__(self, deadline: Optional[float] = None):
+        """初始化令牌
+
+        Args:
+            deadline: 截止时间（time.perf_counter()），None表示不限时
+        """
+        self.deadline = deadline
+        self.progress = 0.0
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已被取消（超时后由 ControlManager 取消）"""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """取消本次决策"""
+        self._cancelled.set()
+
+    def remaining(self) -> float:
+        """距截止时间的剩余秒数（不限时为无穷大，已取消为0）"""
+        if self.cancelled:
+            return 0.0
+        if self.deadline is None:
+            return float("inf")
+        return max(self.deadline - time.perf_counter(), 0.0)
+
+    def expired(self) -> bool:
+        """是否已超时或被取消"""
+        return self.remaining() <= 0.0
+
+    def report_progress(self, progress: float) -> None:
+        """报告决策进度（0~1）"""
+        self.progress = progress
+
+
+class DecisionBudget:
+    """决策时间预算
+
+    - per_decision: 每次决策的时间上限（秒）
+    - per_game: 每个座位整局决策的总时间上限（秒），用完后该座位的决策直接使用规则操控
+    - grace: 超时取消后，等待可随时给出结果的操控返回的时间（秒）
+    """
+
+    def __init__(self, per_decision: Optional[float] = None, per_game: Optional[float] = None, grace: float = 0.05):
+        self.per_decision = per_decision
+        self.per_game = per_game
+        self.grace = grace
+        self.used: Dict[int, float] = {}  # player_id -> 已用的决策时间
+        self.timeouts: Dict[int, int] = {}  # player_id -> 超时改用规则操控的次数
+
+    def new_token(self, player_id: int) -> DecisionToken:
+        """为一次决策创建令牌（截止时间取单次上限和本局剩余时间中较早的一个）"""
+        limits = []
+        if self.per_decision is not None:
+            limits.append(self.per_decision)
+        if self.per_game is not None:
+            limits.append(max(self.per_game - self.used.get(player_id, 0.0), 0.0))
+        if not limits:
+            return DecisionToken()
+        return DecisionToken(time.perf_counter() + min(limits))
+
+    def charge(self, player_id: int, elapsed: float) -> None:
+        """记入一次决策所用的时间"""
+        self.used[player_id] = self.used.get(player_id, 0.0) + elapsed
+
+    def record_timeout(self, player_id: int) -> None:
+        """记录一次超时"""
+        self.timeouts[player_id] = self.timeouts.get(player_id, 0) + 1
+
+
+def run_with_deadline(decide: Callable[[], Any], token: DecisionToken, grace: float) -> tuple:
+    """在单独的线程中执行决策，最多等待到截止时间
+
+    超时后取消令牌，再等待 grace 秒让可随时给出结果的操控返回。
+
+    Args:
+        decide: 决策函数
+        token: 本次决策的令牌
+        grace: 取消后的等待时间（秒）
+
+    Returns:
+        (是否按时完成, 决策结果)；未完成时结果为None，决策线程在后台自行结束
+    """
+    outcome: Dict[str, Any] = {}
+
+    def target():
+        try:
+            outcome["result"] = decide()
+        except BaseException as error:
+            outcome["error"] = error
+
+    thread = threading.Thread(target=target, name="control-decision", daemon=True)
+    thread.start()
+    thread.join(token.remaining() if token.deadline is not None else None)
+    if thread.is_alive():
+        token.cancel()
+        thread.join(grace)
+        if thread.is_alive():
+            return False, None
+    if "error" in outcome:
+        raise outcome["error"]
+    return True, outcome.get("result")
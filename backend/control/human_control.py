@@ -12,53 +12,71 @@ from backend.control.control import Control
 from backend.card.card import Card
 from config.enums import ControlType, CardName, TargetType
 from communicator.communicator import communicator
-from communicator.comm_event import AskPlayCardEvent, PlayCardResponseEvent, AskTargetEvent, TargetResponseEvent
+from communicator.comm_event import AskPlayCardEvent, AskTargetEvent
 from config.simple_card_config import SimpleCardConfig
 
 
 class HumanControl(Control):
     """基于命令行交互的 Control 实现。"""
 
-    def __init__(self, player_id: Optional[int] = None):
+    interactive = True
+
+    def __init__(self, player_id: Optional[int] = None, response_timeout: Optional[float] = None):
+        """
+        Args:
+            player_id: 玩家ID
+            response_timeout: 每次等待前端回复的最长时间（秒），超时后取消请求并采用默认动作
+                （不出牌/不选目标）；None表示一直等待
+        """
         super().__init__(ControlType.HUMAN, player_id)
+        self.response_timeout = response_timeout
+        self.pending_request = None  # 正在等待前端回复的请求（PendingRequest）
+
+    def _request_frontend(self, event) -> Optional[object]:
+        """向前端发出请求并等待按 request_id 对应的回复
+
+        等待期间前端发来的调试指令、ACK 等其他事件留在队列中由各自的消费者处理。
+
+        Returns:
+            回复事件；超时（已取消请求）返回 None，由调用方采用默认动作
+        """
+        pending = communicator.request(event, timeout=self.response_timeout)
+        self.pending_request = pending
+        try:
+            response = pending.wait(self.response_timeout)
+            if response is None and communicator.cancel_request(pending, "timeout"):
+                print("[后端] 等待前端回复超时，采用默认动作")
+                return None
+            # 取消前回复恰好到达时以回复为准
+            return pending.response
+        finally:
+            self.pending_request = None
 
     def _ask_frontend_for_targets(self, available_targets: List[int]) -> List[int]:
-        """请求前端选择目标"""
-        communicator.send_to_frontend(AskTargetEvent(available_targets=available_targets))
-        
+        """请求前端选择目标（超时默认不选）"""
         print("[后端] 等待前端选目标...")
-        while True:
-            event = communicator.get_from_frontend(timeout=None)
-            if isinstance(event, TargetResponseEvent):
-                if event.target_ids is None:
-                    return []
-                # 验证目标有效性
-                valid_targets = [pid for pid in event.target_ids if pid in available_targets]
-                return valid_targets
-            # 忽略其他事件
+        event = self._request_frontend(AskTargetEvent(available_targets=available_targets))
+        if event is None or event.target_ids is None:
+            return []
+        # 验证目标有效性
+        valid_targets = [pid for pid in event.target_ids if pid in available_targets]
+        return valid_targets
 
     def _ask_frontend_for_card(self, available_cards: List[Card]) -> Optional[Card]:
-        """请求前端选择卡牌"""
+        """请求前端选择卡牌（超时默认不出）"""
         # 转换卡牌配置
         simple_cards = []
         for c in available_cards:
             simple_cards.append(SimpleCardConfig(c.name_enum, c.suit, c.rank))
         
-        # 发送请求
-        communicator.send_to_frontend(AskPlayCardEvent(available_cards=simple_cards))
-        
-        # 等待响应
         print("[后端] 等待前端选牌...")
-        while True:
-            event = communicator.get_from_frontend(timeout=None)
-            if isinstance(event, PlayCardResponseEvent):
-                idx = event.card_index
-                if idx == -1:
-                    return None
-                if 0 <= idx < len(available_cards):
-                    return available_cards[idx]
-            # 忽略其他事件（或者应该处理？）
-            # 实际上这里可能会丢弃其他重要事件，但在同步模型下暂时只能这样
+        event = self._request_frontend(AskPlayCardEvent(available_cards=simple_cards))
+        if event is None:
+            return None
+        idx = event.card_index
+        if 0 <= idx < len(available_cards):
+            return available_cards[idx]
+        return None
             
     def _print_cards(self, cards: List[Card]) -> None:
         for i, c in enumerate(cards):
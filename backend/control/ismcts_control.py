@@ -0,0 +1,363 @@
+# 信息集蒙特卡洛树搜索操控模块
+"""出牌阶段使用信息集蒙特卡洛树搜索（ISMCTS）决策的 Control 实现"""
+import math
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Dict, Tuple, Any
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.control.simple_control import SimpleControl
+from backend.control.decision_budget import DecisionToken
+from backend.card.card import Card
+from backend.utils.event_sender import event_routing
+from backend.utils.logger import game_logger
+from config.enums import ControlType, PlayerIdentity
+
+
+# 动作键：(牌名, 花色, 点数, 视作使用的牌名, 目标元组)，同名同花色同点数的牌视为同一动作；不出牌为 None
+ActionKey = Optional[Tuple[Any, Any, int, Any, Tuple[int, ...]]]
+
+
+class SearchNode:
+    """搜索树节点（一个节点对应自己在当前回合出牌阶段的一串决策）"""
+
+    __slots__ = ("visits", "value", "availability", "children")
+
+    def __init__(self):
+        self.visits = 0  # 经过本节点的模拟次数
+        self.value = 0.0  # 模拟结果（自己一方的收益）之和
+        self.availability = 0  # 本节点的动作在确定化后的局面中可选的次数
+        self.children: Dict[ActionKey, 'SearchNode'] = {}
+
+
+class SearchParams:
+    """搜索参数"""
+
+    def __init__(self, iterations: int = 200, time_budget: float = 0.5, rollout_turns: int = 30, exploration: float = 0.7):
+        """初始化搜索参数
+
+        Args:
+            iterations: 每次决策的最大模拟次数
+            time_budget: 每次决策的时间预算（秒）
+            rollout_turns: 每次模拟最多推进的回合数（未分出胜负时按血量估值）
+            exploration: UCB 探索系数
+        """
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.rollout_turns = rollout_turns
+        self.exploration = exploration
+
+
+def action_key(card: Card, as_card_name, targets: Tuple[int, ...]) -> ActionKey:
+    """动作键（不依赖手牌下标，确定化后仍可对应）"""
+    return (card.name_enum, card.suit, card.rank, as_card_name, tuple(targets))
+
+
+def allied_identities(identity: PlayerIdentity) -> Tuple[PlayerIdentity, ...]:
+    """与指定身份同一阵营的身份"""
+    if identity in (PlayerIdentity.LORD, PlayerIdentity.LOYALIST):
+        return (PlayerIdentity.LORD, PlayerIdentity.LOYALIST)
+    return (identity,)
+
+
+def evaluate(game, player_id: int) -> float:
+    """模拟结束后的收益（0~1）
+
+    分出胜负时己方获胜为1、失败为0；未分出胜负时为己方存活血量占全场存活血量的比例。
+    """
+    player_controller = game.player_controller
+    allies = allied_identities(player_controller.get_player(player_id).identity)
+    if player_controller.game_over():
+        winning_identities = player_controller.get_winning_identities()
+        if not winning_identities:
+            return 0.5
+        return 1.0 if allies[0] in winning_identities else 0.0
+    ally_hp = total_hp = 0
+    for player in player_controller.players:
+        if player.is_alive():
+            total_hp += player.current_hp
+            if player.identity in allies:
+                ally_hp += player.current_hp
+    return ally_hp / total_hp if total_hp else 0.5
+
+
+def determinize(game, player_id: int, rng: random.Random) -> None:
+    """确定化：把自己看不到的牌（其他玩家的手牌和牌堆）随机重新分配，手牌数不变
+
+    自己的手牌、所有装备、弃牌堆和身份都是可见信息（见 build_visible_state），保持不变。
+    """
+    hidden_players = [player for player in game.player_controller.players if player.player_id != player_id]
+    pool = list(game.deck.cards)
+    for player in hidden_players:
+        pool.extend(player.hand_cards)
+    rng.shuffle(pool)
+    offset = 0
+    for player in hidden_players:
+        count = len(player.hand_cards)
+        player.hand_cards = pool[offset:offset + count]
+        offset += count
+    game.deck.cards = pool[offset:]
+
+
+class TreeControl(SimpleControl):
+    """模拟中代替搜索方座位的操控
+
+    在当前回合的出牌阶段按搜索树（UCB）选择动作，扩展出一个新节点后，
+    以及之后的所有决策都使用规则操控。
+    """
+
+    def __init__(self, player_id: int, game, root: SearchNode, exploration: float, rng: random.Random):
+        super().__init__(player_id)
+        self.game = game
+        self.turn_number = game.turn_number
+        self.node: Optional[SearchNode] = root
+        self.path: List[SearchNode] = [root]
+        self.exploration = exploration
+        self.rng = rng
+        self._forced: Optional[Tuple[Card, List[int]]] = None
+
+    def select_card(self, available_cards: List[Card], context: str = "", available_targets: Dict[str, List[int]] = None) -> Optional[Card]:
+        node = self.node
+        if node is None or self.game.turn_number != self.turn_number:
+            self.node = None
+            return super().select_card(available_cards, context, available_targets)
+
+        # 本次确定化后的局面中可选的动作
+        player = self.game.player_controller.get_player(self.player_id)
+        hand = player.hand_cards
+        moves: Dict[ActionKey, Tuple[Optional[Card], List[int]]] = {None: (None, [])}
+        for index, as_card_name, targets in player.legal_actions(available_targets):
+            card = hand[index]
+            moves.setdefault(action_key(card, as_card_name, targets), (card, list(targets)))
+
+        for key in moves:
+            child = node.children.get(key)
+            if child is not None:
+                child.availability += 1
+        untried = [key for key in moves if key not in node.children]
+        if untried:
+            # 扩展一个新节点，之后进入规则操控的模拟
+            key = self.rng.choice(untried)
+            child = node.children[key] = SearchNode()
+            child.availability = 1
+            self.node = None
+        else:
+            key = max(moves, key=lambda k: self._ucb(node.children[k], self.exploration))
+            child = node.children[key]
+            self.node = child
+        self.path.append(child)
+
+        card, targets = moves[key]
+        self._forced = (card, targets) if card is not None else None
+        return card
+
+    def select_targets(self, available_targets: List[int], card: Optional[Card] = None) -> List[int]:
+        if self._forced is not None and self._forced[0] is card:
+            targets = self._forced[1]
+            self._forced = None
+            return [t for t in targets if t in available_targets]
+        return super().select_targets(available_targets, card)
+
+    @staticmethod
+    def _ucb(child: SearchNode, exploration: float) -> float:
+        if child.visits == 0:
+            return float("inf")
+        return child.value / child.visits + exploration * math.sqrt(math.log(max(child.availability, 1)) / child.visits)
+
+
+def install_control(game, control: SimpleControl) -> None:
+    """替换模拟对局中某个座位的操控模块（继承原操控的私有状态和共享信息板）"""
+    player = game.player_controller.get_player(control.player_id)
+    control_manager = game.player_controller.control_manager
+    control.apply_state(player.control.capture_state())
+    control.set_knowledge_board(control_manager.knowledge_board)
+    player.control = control
+    control_manager.controls[control.player_id] = control
+
+
+def run_search(game, player_id: int, params: SearchParams, rng: random.Random, deadline: float,
+               token: Optional[DecisionToken] = None) -> SearchNode:
+    """在出牌阶段的决策点上搜索
+
+    每次模拟：复制对局（所有座位使用规则操控）→ 确定化隐藏信息 → 搜索方按搜索树选择本回合的动作 →
+    用规则操控推进至多 rollout_turns 个回合 → 沿路径回传收益。
+
+    只读取 game（每次模拟复制一份），不读写全局random：模拟中规则操控的随机选择使用由 rng 派生的独立随机数源，
+    因此在后台线程中搜索时不会影响正在进行的实际对局。
+
+    Args:
+        game: 停在搜索方出牌阶段决策点上的对局（不会被修改，通常是实际对局的复制品）
+        player_id: 搜索方座位
+        params: 搜索参数
+        rng: 随机数源
+        deadline: 截止时间（time.perf_counter()）
+        token: 决策令牌（可选），被取消时立即停止，并报告搜索进度
+
+    Returns:
+        根节点
+    """
+    root = SearchNode()
+    for i in range(params.iterations):
+        if time.perf_counter() >= deadline or (token is not None and token.cancelled):
+            break
+        if token is not None:
+            token.report_progress(i / params.iterations)
+        simulation = game.clone(ControlType.SIMPLE_AI, sync_controls=False)
+        determinize(simulation, player_id, rng)
+        simulation.deck.rng.seed(rng.getrandbits(64))
+        tree_control = TreeControl(player_id, simulation, root, params.exploration, rng)
+        install_control(simulation, tree_control)
+
+        control_manager = simulation.player_controller.control_manager
+        rollout_rng = random.Random(rng.getrandbits(64))
+        for control in control_manager.controls.values():
+            control.decision_rng = rollout_rng
+        with event_routing(control_manager), game_logger.suppressed():
+            control_manager.sync_game_state()
+            running = simulation.continue_turn()
+            turns = 0
+            while running and not simulation.game_ended and turns < params.rollout_turns:
+                running = simulation.play_turn()
+                turns += 1
+
+        reward = evaluate(simulation, player_id)
+        for node in tree_control.path:
+            node.visits += 1
+            node.value += reward
+    return root
+
+
+def _search_worker(game_bytes: bytes, player_id: int, params: SearchParams, seed: int, time_budget: float) -> Dict[ActionKey, Tuple[int, float]]:
+    """子进程中搜索，返回根节点各动作的 (模拟次数, 收益和)"""
+    game = pickle.loads(game_bytes)
+    root = run_search(game, player_id, params, random.Random(seed), time.perf_counter() + time_budget)
+    return {key: (child.visits, child.value) for key, child in root.children.items()}
+
+
+class ISMCTSControl(SimpleControl):
+    """信息集蒙特卡洛树搜索操控
+
+    出牌阶段选牌时，从自己可见的信息出发（隐藏的手牌和牌堆随机确定化）进行搜索，
+    选择模拟次数最多的动作；响应、弃牌等其他决策使用规则操控。
+
+    每次决策的模拟次数和时间预算可调（iterations、time_budget），超出预算立即停止搜索；
+    ControlManager 设置了决策截止时间（decision_token）时，取两者中较早的一个，被取消时用已有的统计决策；
+    workers > 1 时在多个进程中并行搜索（根并行），汇总各进程的统计后决策。
+    搜索需要对局的引用（GameController 初始化时通过 bind_game 设置），未绑定时退化为规则操控。
+    搜索只使用对局的复制品：设置了时间预算时在 prepare_decision 中（调用线程上、计时开始前）复制，
+    超时后仍在后台运行的搜索线程不会读取或修改实际对局。
+    """
+
+    def __init__(self, player_id: Optional[int] = None, iterations: int = 200, time_budget: float = 0.5,
+                 rollout_turns: int = 30, exploration: float = 0.7, workers: int = 0, seed: Optional[int] = None):
+        """初始化搜索操控
+
+        Args:
+            player_id: 关联的玩家ID
+            iterations: 每次决策的最大模拟次数
+            time_budget: 每次决策的时间预算（秒）
+            rollout_turns: 每次模拟最多推进的回合数
+            exploration: UCB 探索系数
+            workers: 并行搜索的进程数（0或1表示在当前进程中搜索）
+            seed: 搜索随机数种子（可选，用于复现）
+        """
+        super().__init__(player_id)
+        self.control_type = ControlType.ISMCTS_AI
+        self.params = SearchParams(iterations, time_budget, rollout_turns, exploration)
+        self.workers = workers
+        self.rng = random.Random(seed)
+        self.game = None
+        self.last_root: Optional[SearchNode] = None  # 最近一次搜索的根节点（调试、调参用）
+        self._chosen: Optional[Tuple[Card, List[int]]] = None
+        # prepare_decision 准备好的 (可选动作, 对局复制品)
+        self._prepared: Optional[Tuple[Dict[ActionKey, Tuple[Optional[Card], List[int]]], Any]] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def bind_game(self, game) -> None:
+        """设置要搜索的对局（GameController）"""
+        self.game = game
+
+    def close(self) -> None:
+        """关闭并行搜索的进程池"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def prepare_decision(self, decision: str, args: tuple) -> None:
+        """出牌阶段选牌前，在调用线程上列出可选动作并复制对局"""
+        self._prepared = None
+        if decision == "select_card" and self.game is not None and args and args[0]:
+            available_targets = args[2] if len(args) > 2 else None
+            self._prepared = self._prepare_search(available_targets)
+
+    def _prepare_search(self, available_targets: Optional[Dict[str, List[int]]]) -> Tuple[Dict[ActionKey, Tuple[Optional[Card], List[int]]], Any]:
+        """列出可选动作（动作键 -> (实际对局中的牌, 目标)），并复制对局供搜索使用"""
+        player = self.game.player_controller.get_player(self.player_id)
+        moves: Dict[ActionKey, Tuple[Optional[Card], List[int]]] = {None: (None, [])}
+        for index, as_card_name, targets in player.legal_actions(available_targets):
+            card = player.hand_cards[index]
+            moves.setdefault(action_key(card, as_card_name, targets), (card, list(targets)))
+        return moves, self.game.clone(ControlType.SIMPLE_AI, sync_controls=False)
+
+    def select_card(self, available_cards: List[Card], context: str = "", available_targets: Dict[str, List[int]] = None) -> Optional[Card]:
+        """出牌阶段选牌（搜索）"""
+        prepared, self._prepared = self._prepared, None
+        self._chosen = None
+        if not available_cards or self.game is None:
+            return super().select_card(available_cards, context, available_targets)
+
+        if prepared is None:
+            prepared = self._prepare_search(available_targets)
+        moves, snapshot = prepared
+        statistics = self._search(snapshot)
+        visited = [key for key in moves if statistics.get(key, (0, 0.0))[0] > 0]
+        if not visited:
+            # 预算内没有完成任何模拟
+            return super().select_card(available_cards, context, available_targets)
+        best = max(visited, key=lambda key: statistics[key])
+        card, targets = moves[best]
+        if card is not None:
+            self._chosen = (card, targets)
+        return card
+
+    def select_targets(self, available_targets: List[int], card: Optional[Card] = None) -> List[int]:
+        """选择目标（搜索选出的牌使用搜索时确定的目标）"""
+        if self._chosen is not None and self._chosen[0] is card:
+            targets = [t for t in self._chosen[1] if t in available_targets]
+            self._chosen = None
+            if targets:
+                return targets
+        return super().select_targets(available_targets, card)
+
+    def _search(self, snapshot) -> Dict[ActionKey, Tuple[int, float]]:
+        """在对局复制品上搜索，返回根节点各动作的 (模拟次数, 收益和)"""
+        params = self.params
+        token = self.decision_token
+        deadline = time.perf_counter() + params.time_budget
+        if token is not None and token.deadline is not None:
+            deadline = min(deadline, token.deadline)
+        if self.workers <= 1:
+            root = run_search(snapshot, self.player_id, params, self.rng, deadline, token)
+            self.last_root = root
+            return {key: (child.visits, child.value) for key, child in root.children.items()}
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        game_bytes = pickle.dumps(snapshot)
+        worker_params = SearchParams(-(-params.iterations // self.workers), params.time_budget,
+                                     params.rollout_turns, params.exploration)
+        remaining = max(deadline - time.perf_counter(), 0.0)
+        futures = [
+            self._pool.submit(_search_worker, game_bytes, self.player_id, worker_params, self.rng.getrandbits(64), remaining)
+            for _ in range(self.workers)
+        ]
+        statistics: Dict[ActionKey, Tuple[int, float]] = {}
+        for future in futures:
+            for key, (visits, value) in future.result().items():
+                total_visits, total_value = statistics.get(key, (0, 0.0))
+                statistics[key] = (total_visits + visits, total_value + value)
+        return statistics
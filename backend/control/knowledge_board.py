@@ -0,0 +1,188 @@
+# 公开信息板模块
+"""全局共享的公开身份信息（跳忠、跳反），所有SimpleControl共同读取"""
+from typing import Iterator, List, Optional, TYPE_CHECKING
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from communicator.comm_event import PlayCardEvent
+from backend.utils.logger import game_logger
+
+if TYPE_CHECKING:
+    from backend.control.simple_control import SimpleControl
+
+
+class IdentityFlagView:
+    """身份标记的只读集合视图（底层为位掩码）
+
+    支持 `player_id in view`、迭代和 len，便于替代原有的 set。
+    """
+
+    def __init__(self, board: 'KnowledgeBoard', flag: str):
+        self._board = board
+        self._flag = flag
+
+    def _mask(self) -> int:
+        return getattr(self._board, self._flag)
+
+    def __contains__(self, player_id) -> bool:
+        if not isinstance(player_id, int) or player_id < 0:
+            return False
+        return (self._mask() >> player_id) & 1 == 1
+
+    def __iter__(self) -> Iterator[int]:
+        mask = self._mask()
+        player_id = 0
+        while mask:
+            if mask & 1:
+                yield player_id
+            mask >>= 1
+            player_id += 1
+
+    def __len__(self) -> int:
+        return bin(self._mask()).count("1")
+
+    def __repr__(self) -> str:
+        return f"{{{', '.join(str(pid) for pid in self)}}}"
+
+
+class KnowledgeBoard:
+    """公开信息板
+
+    跳忠、跳反由公开的出牌事件推断，对所有观察者都相同，
+    因此整局游戏只维护一份（由ControlManager创建并共享给所有SimpleControl），
+    每个事件只推断一次。类反猪是主猪的私有判断，不在这里维护。
+
+    标记使用位掩码存储：第 player_id 位为1表示该玩家带有对应标记。
+    """
+
+    def __init__(self):
+        self.loyal_mask = 0  # 已跳忠玩家的位掩码
+        self.rebel_mask = 0  # 已跳反玩家的位掩码
+        self._last_event: Optional[PlayCardEvent] = None  # 最近一次已推断的事件（同一事件会被分发给每个Control）
+        self._last_rebels: List[int] = []  # 最近一次事件推断出跳反的玩家
+        self.jumped_loyal = IdentityFlagView(self, "loyal_mask")
+        self.jumped_rebel = IdentityFlagView(self, "rebel_mask")
+
+    def is_jumped_loyal(self, player_id: int) -> bool:
+        """玩家是否已跳忠"""
+        return player_id in self.jumped_loyal
+
+    def is_jumped_rebel(self, player_id: int) -> bool:
+        """玩家是否已跳反"""
+        return player_id in self.jumped_rebel
+
+    def has_jumped(self, player_id: int) -> bool:
+        """玩家是否已跳身份"""
+        return (((self.loyal_mask | self.rebel_mask) >> player_id) & 1) == 1
+
+    def mark_jumped_loyal(self, player_id: int, player_name: str = None) -> bool:
+        """标记玩家跳忠（同时清除跳反标记）
+
+        Returns:
+            是否为新的标记
+        """
+        bit = 1 << player_id
+        if self.loyal_mask & bit:
+            return False
+        self.loyal_mask |= bit
+        self.rebel_mask &= ~bit
+        game_logger.log_info(f"{player_name or f'玩家{player_id}'}跳忠")
+        return True
+
+    def mark_jumped_rebel(self, player_id: int, player_name: str = None) -> bool:
+        """标记玩家跳反（同时清除跳忠标记）
+
+        Returns:
+            是否为新的标记
+        """
+        bit = 1 << player_id
+        if self.rebel_mask & bit:
+            return False
+        self.rebel_mask |= bit
+        self.loyal_mask &= ~bit
+        game_logger.log_info(f"{player_name or f'玩家{player_id}'}跳反")
+        return True
+
+    def observe_play_card(self, event: PlayCardEvent, observer: 'SimpleControl') -> None:
+        """根据出牌事件推断跳忠、跳反（同一事件只推断一次），并更新观察者自己的类反判断
+
+        识别规则：
+        - 跳忠：对主猪或已跳忠的猪献殷勤，或对已跳反的猪表敌意
+        - 跳反：对主猪或已跳忠的猪表敌意，或对已跳反的猪献殷勤
+
+        Args:
+            event: 出牌事件
+            observer: 收到事件的SimpleControl（用于判断主猪和获取玩家名称，这些信息对所有观察者相同）
+        """
+        if event is not self._last_event:
+            self._last_event = event
+            self._last_rebels = self._infer_play_card(event, observer)
+        # 跳反的玩家不再是类反猪；类反是每个观察者私有的，每个观察者都要清除
+        for player_id in self._last_rebels:
+            observer.class_rebel.discard(player_id)
+
+    def _infer_play_card(self, event: PlayCardEvent, observer: 'SimpleControl') -> List[int]:
+        """推断出牌事件的跳忠、跳反并更新标记
+
+        Returns:
+            推断为跳反的玩家列表
+        """
+        rebels = []
+        if not event.card_config:
+            return rebels
+
+        from_player_id = event.from_player
+        to_player_id = event.to_player
+        card_name_str = event.card_config.name.value if hasattr(event.card_config.name, 'value') else str(event.card_config.name)
+
+        # 判断是否是表敌意（杀、决斗，但响应决斗的杀不算表敌意）
+        # 响应类事件不算表敌意或献殷勤，但无懈可击响应需要特殊处理
+        is_response = event.response_type is not None
+
+        # 无懈可击响应需要特殊处理（可以献殷勤或表敌意）
+        is_wu_xie_response = (card_name_str == "无懈可击" and
+                              is_response and
+                              event.response_type == "响应无懈可击")
+
+        if is_response and not is_wu_xie_response:
+            return rebels
+
+        is_hostility = False
+        is_loyalty = False
+
+        if is_wu_xie_response:
+            # 无懈可击响应：is_effective=True表示保护目标（献殷勤），False表示抵消献殷勤（表敌意）
+            # to_player_id是被保护的目标（response_target）
+            if event.is_effective is True:
+                is_loyalty = True  # 保护目标，献殷勤
+                game_logger.log_info(f"{observer._get_player_name(from_player_id)}对{observer._get_player_name(to_player_id)}献殷勤（无懈可击）")
+            elif event.is_effective is False:
+                is_hostility = True  # 抵消献殷勤，表敌意
+                game_logger.log_info(f"{observer._get_player_name(from_player_id)}对{observer._get_player_name(to_player_id)}表敌意（无懈可击抵消）")
+        else:
+            # 非响应类事件：杀、决斗表敌意
+            is_hostility = card_name_str in ["杀", "决斗"]
+            if is_hostility:
+                game_logger.log_info(f"{observer._get_player_name(from_player_id)}对{observer._get_player_name(to_player_id)}表敌意（{card_name_str}）")
+
+        if is_hostility:
+            # 表敌意
+            if observer._is_lord(to_player_id) or to_player_id in self.jumped_loyal:
+                # 对主猪或已跳忠的猪表敌意 -> 跳反
+                observer._mark_jumped_rebel(from_player_id)
+                rebels.append(from_player_id)
+            elif to_player_id in self.jumped_rebel:
+                # 对已跳反的猪表敌意 -> 跳忠
+                observer._mark_jumped_loyal(from_player_id)
+
+        if is_loyalty:
+            # 献殷勤（无懈可击保护目标）
+            if observer._is_lord(to_player_id) or to_player_id in self.jumped_loyal:
+                # 对主猪或已跳忠的猪献殷勤 -> 跳忠
+                observer._mark_jumped_loyal(from_player_id)
+            elif to_player_id in self.jumped_rebel:
+                # 对已跳反的猪献殷勤 -> 跳反
+                observer._mark_jumped_rebel(from_player_id)
+                rebels.append(from_player_id)
+        return rebels
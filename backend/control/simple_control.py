@@ -1,6 +1,6 @@
 # 简单Control实现（规则操控）
 """基于规则的简单Control实现，符合ZHUGUOSHA.md中的规则"""
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Set, FrozenSet
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -17,6 +17,7 @@ from backend.control.simple_event_handler import (
 from backend.control.zhuguosha_event_handler import (
     ZhuguoShaPlayCardEventHandler, ZhuguoShaHPChangeEventHandler
 )
+from backend.control.knowledge_board import KnowledgeBoard, IdentityFlagView
 
 
 class SimpleControl(Control):
@@ -60,8 +61,8 @@ class SimpleControl(Control):
         # 跳忠：对主猪或已跳忠的猪献殷勤，或对已跳反的猪表敌意
         # 跳反：对主猪或已跳忠的猪表敌意，或对已跳反的猪献殷勤
         # 类反：没有跳身份，且用南猪入侵/万箭齐发对主猪造成伤害的猪（主猪认为）
-        self.jumped_loyal: Set[int] = set()  # 已跳忠的玩家ID集合
-        self.jumped_rebel: Set[int] = set()  # 已跳反的玩家ID集合
+        # 跳忠、跳反是公开信息，保存在公开信息板中（ControlManager会替换为全局共享的信息板）
+        self.knowledge_board = KnowledgeBoard()
         self.class_rebel: Set[int] = set()  # 类反猪集合（主猪认为）
         
         # 记录玩家顺序（用于距离计算，逆时针方向）
@@ -73,6 +74,32 @@ class SimpleControl(Control):
         # 注册SimpleControl专用的事件处理器（覆盖默认处理器）
         self._register_simple_handlers()
     
+    @property
+    def jumped_loyal(self) -> IdentityFlagView:
+        """已跳忠的玩家ID集合（只读视图）"""
+        return self.knowledge_board.jumped_loyal
+    
+    @property
+    def jumped_rebel(self) -> IdentityFlagView:
+        """已跳反的玩家ID集合（只读视图）"""
+        return self.knowledge_board.jumped_rebel
+    
+    def set_knowledge_board(self, board: KnowledgeBoard) -> None:
+        """设置共享的公开信息板
+        
+        Args:
+            board: 全局公开信息板
+        """
+        self.knowledge_board = board
+    
+    def capture_state(self) -> FrozenSet[int]:
+        """获取私有状态快照（类反猪是主猪的私有判断；跳忠、跳反由公开信息板保存）"""
+        return frozenset(self.class_rebel)
+    
+    def apply_state(self, state: Optional[FrozenSet[int]]) -> None:
+        """从快照恢复私有状态"""
+        self.class_rebel = set(state) if state else set()
+    
     def _register_simple_handlers(self) -> None:
         """注册SimpleControl专用的事件处理器"""
         # 使用增强的处理器，能够识别跳忠、跳反等行为
@@ -286,12 +313,8 @@ class SimpleControl(Control):
         Args:
             player_id: 玩家ID
         """
-        if player_id not in self.jumped_loyal:
-            self.jumped_loyal.add(player_id)
-            # 如果之前标记为跳反，移除跳反标记
-            self.jumped_rebel.discard(player_id)
-            player_name = self._get_player_name(player_id)
-            game_logger.log_info(f"{player_name}跳忠")
+        # 信息板会同时移除跳反标记
+        self.knowledge_board.mark_jumped_loyal(player_id, self._get_player_name(player_id))
     
     def _mark_jumped_rebel(self, player_id: int) -> None:
         """标记玩家跳反
@@ -299,14 +322,10 @@ class SimpleControl(Control):
         Args:
             player_id: 玩家ID
         """
-        if player_id not in self.jumped_rebel:
-            self.jumped_rebel.add(player_id)
-            # 如果之前标记为跳忠，移除跳忠标记
-            self.jumped_loyal.discard(player_id)
-            # 如果之前标记为类反，移除类反标记（因为已经跳反了）
-            self.class_rebel.discard(player_id)
-            player_name = self._get_player_name(player_id)
-            game_logger.log_info(f"{player_name}跳反")
+        # 信息板会同时移除跳忠标记
+        self.knowledge_board.mark_jumped_rebel(player_id, self._get_player_name(player_id))
+        # 如果之前标记为类反，移除类反标记（因为已经跳反了）
+        self.class_rebel.discard(player_id)
     
     def _mark_class_rebel(self, player_id: int) -> None:
         """标记玩家为类反（仅主猪使用）
@@ -390,8 +409,6 @@ class SimpleControl(Control):
         Returns:
             选择的目标列表
         """
-        import random
-        
         # 优先使用内部状态
         target_hp_map = {}
         if self.internal_state.get("players"):
@@ -411,7 +428,7 @@ class SimpleControl(Control):
                     target_hp_map[player_info["player_id"]] = player_info.get("current_hp", 999)
         
         if not target_hp_map:
-            return [random.choice(available_targets)] if available_targets else []
+            return [self.get_rng().choice(available_targets)] if available_targets else []
         
         # 优先选择名为“赵云”的目标（章节/剧情模式里敌人优先攻击赵云）
         for pid in available_targets:
@@ -425,7 +442,7 @@ class SimpleControl(Control):
         min_hp = min(target_hp_map.values())
         min_hp_targets = [pid for pid, hp in target_hp_map.items() if hp == min_hp]
         
-        return [random.choice(min_hp_targets)]
+        return [self.get_rng().choice(min_hp_targets)]
     
     def _select_targets_as_lord(self, available_targets: List[int]) -> List[int]:
         """主猪选择目标
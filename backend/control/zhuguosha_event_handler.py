@@ -7,7 +7,6 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 from backend.control.event_handler import EventHandler
 from communicator.comm_event import PlayCardEvent, HPChangeEvent
-from backend.utils.logger import game_logger
 from config.enums import CardName
 
 if TYPE_CHECKING:
@@ -31,7 +30,7 @@ class ZhuguoShaPlayCardEventHandler(EventHandler):
     def handle(self, event: PlayCardEvent, player_id: Optional[int] = None) -> None:
         """处理出牌事件
         
-        识别跳忠、跳反行为：
+        更新手牌数量，并交给公开信息板识别跳忠、跳反行为：
         - 跳忠：对主猪或已跳忠的猪献殷勤，或对已跳反的猪表敌意
         - 跳反：对主猪或已跳忠的猪表敌意，或对已跳反的猪献殷勤
         
@@ -40,7 +39,6 @@ class ZhuguoShaPlayCardEventHandler(EventHandler):
             player_id: 关联的玩家ID（观察者）
         """
         from_player_id = event.from_player
-        to_player_id = event.to_player
         
         # 更新手牌数量
         if player_id == from_player_id:
@@ -58,68 +56,8 @@ class ZhuguoShaPlayCardEventHandler(EventHandler):
             self.control.internal_state["players"][from_player_id]["hand_count"] = \
                 max(0, self.control.internal_state["players"][from_player_id].get("hand_count", 0) - 1)
         
-        # 识别跳忠、跳反行为（使用完整的事件信息）
-        if event.card_config:
-            card_name_str = event.card_config.name.value if hasattr(event.card_config.name, 'value') else str(event.card_config.name)
-            
-            # 判断是否是表敌意（杀、决斗，但响应决斗的杀不算表敌意）
-            # 响应类事件不算表敌意或献殷勤，但无懈可击响应需要特殊处理
-            is_response = event.response_type is not None
-            
-            # 无懈可击响应需要特殊处理（可以献殷勤或表敌意）
-            is_wu_xie_response = (card_name_str == "无懈可击" and 
-                                  is_response and 
-                                  event.response_type == "响应无懈可击")
-            
-            if not is_response or is_wu_xie_response:
-                # 非响应类事件或无懈可击响应才判断跳忠、跳反
-                is_hostility = False
-                is_loyalty = False
-                
-                if is_wu_xie_response:
-                    # 无懈可击响应：is_effective=True表示保护目标（献殷勤），False表示抵消献殷勤（表敌意）
-                    # to_player_id是被保护的目标（response_target）
-                    if event.is_effective is True:
-                        is_loyalty = True  # 保护目标，献殷勤
-                        from_player_name = self.control._get_player_name(from_player_id)
-                        target_player_name = self.control._get_player_name(to_player_id)
-                        game_logger.log_info(f"{from_player_name}对{target_player_name}献殷勤（无懈可击）")
-                    elif event.is_effective is False:
-                        is_hostility = True  # 抵消献殷勤，表敌意
-                        from_player_name = self.control._get_player_name(from_player_id)
-                        target_player_name = self.control._get_player_name(to_player_id)
-                        game_logger.log_info(f"{from_player_name}对{target_player_name}表敌意（无懈可击抵消）")
-                else:
-                    # 非响应类事件：杀、决斗表敌意
-                    is_hostility = card_name_str in ["杀", "决斗"]
-                    if is_hostility:
-                        from_player_name = self.control._get_player_name(from_player_id)
-                        target_player_name = self.control._get_player_name(to_player_id)
-                        game_logger.log_info(f"{from_player_name}对{target_player_name}表敌意（{card_name_str}）")
-                
-                if is_hostility:
-                    # 表敌意
-                    if self.control._is_lord(to_player_id):
-                        # 对主猪表敌意 -> 跳反
-                        self.control._mark_jumped_rebel(from_player_id)
-                    elif to_player_id in self.control.jumped_loyal:
-                        # 对已跳忠的猪表敌意 -> 跳反
-                        self.control._mark_jumped_rebel(from_player_id)
-                    elif to_player_id in self.control.jumped_rebel:
-                        # 对已跳反的猪表敌意 -> 跳忠
-                        self.control._mark_jumped_loyal(from_player_id)
-                
-                if is_loyalty:
-                    # 献殷勤（无懈可击保护目标）
-                    if self.control._is_lord(to_player_id):
-                        # 对主猪献殷勤 -> 跳忠
-                        self.control._mark_jumped_loyal(from_player_id)
-                    elif to_player_id in self.control.jumped_loyal:
-                        # 对已跳忠的猪献殷勤 -> 跳忠
-                        self.control._mark_jumped_loyal(from_player_id)
-                    elif to_player_id in self.control.jumped_rebel:
-                        # 对已跳反的猪献殷勤 -> 跳反
-                        self.control._mark_jumped_rebel(from_player_id)
+        # 识别跳忠、跳反行为（公开信息，由共享的信息板对每个事件只推断一次）
+        self.control.knowledge_board.observe_play_card(event, self.control)
 
 
 class ZhuguoShaHPChangeEventHandler(EventHandler):
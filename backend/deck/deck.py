@@ -1,12 +1,13 @@
 # 牌堆模块
 import random
-from typing import List, Optional
+from typing import Dict, List, Optional
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from backend.card.card import Card
 from backend.utils.logger import game_logger
+from backend.utils.zobrist import StateHash
 from config.enums import CardSuit, CardType, CardName
 
 
@@ -28,6 +29,8 @@ class Deck:
         self.cards: List[Card] = []
         self.discard_pile: List[Card] = []
         self.config = config
+        self.rng: Optional[random.Random] = None  # 洗牌使用的独立随机数源（None表示使用全局random，复制的对局使用独立的random.Random）
+        self._discard_counts: Dict[CardName, int] = {}  # 弃牌堆中各牌名的数量（绑定状态哈希时维护）
         self._initialize_deck()
         
         # 根据配置决定是否打乱牌堆
@@ -53,9 +56,105 @@ class Deck:
                 self.cards.append(card)
     
     
+    # ==================== 状态哈希 ====================
+    # 绑定对局状态哈希后：牌堆中自底向上第i张牌为特征 ("deck", i, 牌名)（摸牌只移除最上面一张的特征），
+    # 弃牌堆作为多重集，某牌名的第k张为特征 ("discard", 牌名, k)
+    
+    _state_hash: Optional[StateHash] = None
+    
+    @property
+    def cards(self) -> List[Card]:
+        """牌堆（下标0为最上面一张）"""
+        return self._cards
+    
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        self._toggle_cards()
+        self._cards = cards
+        self._toggle_cards()
+    
+    @property
+    def discard_pile(self) -> List[Card]:
+        """弃牌堆"""
+        return self._discard_pile
+    
+    @discard_pile.setter
+    def discard_pile(self, cards: List[Card]) -> None:
+        self._toggle_discard_pile()
+        self._discard_pile = cards
+        self._count_discard_pile()
+        self._toggle_discard_pile()
+    
+    def attach_state_hash(self, state_hash: Optional[StateHash]) -> None:
+        """绑定对局状态哈希，并把当前牌堆和弃牌堆计入哈希（None表示解除绑定）"""
+        self._state_hash = state_hash
+        self._count_discard_pile()
+        self._toggle_cards()
+        self._toggle_discard_pile()
+    
+    def _toggle_cards(self) -> None:
+        """把牌堆的所有特征异或进/出状态哈希"""
+        state_hash = self._state_hash
+        if state_hash is None:
+            return
+        cards = self._cards
+        size = len(cards)
+        for i, card in enumerate(cards):
+            state_hash.toggle("deck", size - 1 - i, card.name_enum)
+    
+    def _count_discard_pile(self) -> None:
+        """重新统计弃牌堆中各牌名的数量"""
+        counts: Dict[CardName, int] = {}
+        if self._state_hash is not None:
+            for card in self._discard_pile:
+                counts[card.name_enum] = counts.get(card.name_enum, 0) + 1
+        self._discard_counts = counts
+    
+    def _toggle_discard_pile(self) -> None:
+        """把弃牌堆的所有特征异或进/出状态哈希"""
+        state_hash = self._state_hash
+        if state_hash is None:
+            return
+        for name, count in self._discard_counts.items():
+            for k in range(1, count + 1):
+                state_hash.toggle("discard", name, k)
+    
+    def _hash_discard(self, card: Card) -> None:
+        """一张牌进入弃牌堆后更新状态哈希"""
+        name = card.name_enum
+        count = self._discard_counts.get(name, 0) + 1
+        self._discard_counts[name] = count
+        self._state_hash.toggle("discard", name, count)
+    
     def shuffle(self) -> None:
         """洗牌"""
-        random.shuffle(self.cards)
+        self._toggle_cards()
+        self.get_rng().shuffle(self.cards)
+        self._toggle_cards()
+    
+    def get_rng(self):
+        """获取洗牌使用的随机数源
+        
+        Returns:
+            独立的random.Random，或全局random模块
+        """
+        return self.rng if self.rng is not None else random
+    
+    def clone_empty(self, rng: Optional[random.Random] = None) -> 'Deck':
+        """创建使用相同配置的空牌堆（不创建牌，牌由快照恢复时填入）
+        
+        Args:
+            rng: 新牌堆的随机数源，默认与当前牌堆相同
+            
+        Returns:
+            空牌堆
+        """
+        deck = Deck.__new__(Deck)
+        deck.cards = []
+        deck.discard_pile = []
+        deck.config = self.config
+        deck.rng = rng if rng is not None else self.rng
+        return deck
     
     def draw_card(self) -> Optional[Card]:
         """抽一张牌
@@ -67,12 +166,15 @@ class Deck:
             # 如果牌堆为空，将弃牌堆洗牌后重新使用
             if self.discard_pile:
                 self.cards = self.discard_pile.copy()
-                self.discard_pile.clear()
+                self.discard_pile = []
                 self.shuffle()
             else:
                 return None
         
-        return self.cards.pop(0)
+        card = self._cards.pop(0)
+        if self._state_hash is not None:
+            self._state_hash.toggle("deck", len(self._cards), card.name_enum)
+        return card
     
     def draw_cards(self, count: int) -> List[Card]:
         """抽多张牌
@@ -100,7 +202,9 @@ class Deck:
         """
         # 进入弃牌堆时刷新视为属性为原始牌名
         card.reset_regarded_as()
-        self.discard_pile.append(card)
+        self._discard_pile.append(card)
+        if self._state_hash is not None:
+            self._hash_discard(card)
     
     def discard_cards(self, cards: List[Card]) -> None:
         """弃多张牌
@@ -111,7 +215,10 @@ class Deck:
         # 进入弃牌堆时刷新每张牌的视为属性为原始牌名
         for card in cards:
             card.reset_regarded_as()
-        self.discard_pile.extend(cards)
+        self._discard_pile.extend(cards)
+        if self._state_hash is not None:
+            for card in cards:
+                self._hash_discard(card)
     
     def get_deck_size(self) -> int:
         """获取牌堆大小
@@ -0,0 +1,4 @@
+# 环境模块
+from backend.env.zhuguosha_env import ZhuGuoShaEnv
+from backend.env.vector_env import VectorEnv
+from backend.env.observation import encode_observation, action_mask, OBSERVATION_SIZE, MAX_ACTIONS
@@ -0,0 +1,84 @@
+# 观测编码模块
+"""把操控模块的可见状态（build_visible_state 的结果）编码为定长整数数组"""
+from array import array
+from typing import Dict, List, Optional
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.control.agent_control import Decision, DecisionKind
+from config.enums import CardName, PlayerIdentity, PlayerStatus
+
+
+MAX_SEATS = 10  # 最多座位数
+MAX_ACTIONS = 32  # 每个决策点最多的选项数（超出的选项不可选）
+
+# 编码表：0 表示无/未知，其余为枚举下标+1
+CARD_CODES: Dict[str, int] = {card_name.value: code + 1 for code, card_name in enumerate(CardName)}
+IDENTITY_CODES: Dict[str, int] = {identity.value: code + 1 for code, identity in enumerate(PlayerIdentity)}
+
+SEAT_FEATURES = 10  # 存在、存活、当前血量、血量上限、手牌数、身份、武器、防具、+1马、-1马
+HAND_FEATURES = len(CARD_CODES)  # 自己手牌中每种牌的数量
+OBSERVATION_SIZE = MAX_SEATS * SEAT_FEATURES + HAND_FEATURES + 2 + DecisionKind.COUNT
+
+
+def _encode_seat(info: Dict, out: array, offset: int) -> None:
+    """编码一个座位（自己或其他玩家）"""
+    out[offset] = 1
+    out[offset + 1] = 1 if info.get("status") == PlayerStatus.ALIVE.value else 0
+    out[offset + 2] = info.get("current_hp", 0)
+    out[offset + 3] = info.get("max_hp", 0)
+    out[offset + 4] = info.get("hand_count", 0)
+    out[offset + 5] = IDENTITY_CODES.get(info.get("identity"), 0)
+    for i, slot in enumerate(("weapon", "armor", "horse_plus", "horse_minus")):
+        equipment = info.get(slot)
+        out[offset + 6 + i] = CARD_CODES.get(equipment["name"], 0) if equipment else 0
+
+
+def encode_observation(visible_state: Dict, decision: Optional[Decision] = None) -> array:
+    """编码观测
+
+    布局：
+    - MAX_SEATS 个座位 × SEAT_FEATURES：第一个座位是自己，其余按可见状态中的顺序
+    - HAND_FEATURES：自己手牌中每种牌的数量（按 CardName 顺序）
+    - 牌堆剩余数、弃牌堆数
+    - 当前决策点类型的独热编码
+
+    Args:
+        visible_state: 可见状态字典
+        decision: 当前决策请求（游戏结束时为None）
+
+    Returns:
+        长度为 OBSERVATION_SIZE 的 array('h')
+    """
+    out = array('h', bytes(2 * OBSERVATION_SIZE))
+    if not visible_state:
+        return out
+
+    seats: List[Dict] = [visible_state["self"]] + visible_state.get("players", [])
+    for seat, info in enumerate(seats[:MAX_SEATS]):
+        _encode_seat(info, out, seat * SEAT_FEATURES)
+
+    offset = MAX_SEATS * SEAT_FEATURES
+    for card in visible_state["self"].get("hand_cards", []):
+        code = CARD_CODES.get(card["name"], 0)
+        if code:
+            out[offset + code - 1] += 1
+
+    offset += HAND_FEATURES
+    deck_info = visible_state.get("deck", {})
+    out[offset] = deck_info.get("deck_size", 0)
+    out[offset + 1] = deck_info.get("discard_pile_size", 0)
+
+    if decision is not None:
+        out[offset + 2 + decision.kind] = 1
+    return out
+
+
+def action_mask(decision: Optional[Decision]) -> array:
+    """合法动作掩码：第 i 位为1表示可以选择第 i 个选项"""
+    mask = array('b', bytes(MAX_ACTIONS))
+    if decision is not None:
+        for i in range(min(len(decision.options), MAX_ACTIONS)):
+            mask[i] = 1
+    return mask
@@ -0,0 +1,122 @@
+# 向量化环境模块
+"""在多个进程中并行推进 N 个 ZhuGuoShaEnv（对局结束时自动开始新的一局）"""
+import multiprocessing
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.env.zhuguosha_env import ZhuGuoShaEnv
+
+
+def _step_with_autoreset(env: ZhuGuoShaEnv, action: int) -> Tuple[Any, float, bool, bool, Dict]:
+    """推进一步；对局结束时自动开始新的一局，结束时的观测放在 info["final_observation"]"""
+    observation, reward, terminated, truncated, info = env.step(action)
+    if terminated or truncated:
+        final_observation, final_info = observation, info
+        observation, info = env.reset()
+        info["final_observation"] = final_observation
+        info["final_info"] = final_info
+    return observation, reward, terminated, truncated, info
+
+
+def _worker(remote, env_fn: Callable[[], ZhuGuoShaEnv]) -> None:
+    """子进程：执行主进程发来的 reset/step/close 命令"""
+    env = env_fn()
+    try:
+        while True:
+            command, data = remote.recv()
+            if command == "reset":
+                remote.send(env.reset(data))
+            elif command == "step":
+                remote.send(_step_with_autoreset(env, data))
+            elif command == "close":
+                break
+    finally:
+        env.close()
+        remote.close()
+
+
+class VectorEnv:
+    """向量化环境
+
+    每个环境在独立的子进程中运行（各自拥有独立的全局状态，如事件分发和随机数），
+    也可以传 use_processes=False 在当前进程中依次推进（便于调试）。
+    """
+
+    def __init__(self, env_fns: Sequence[Callable[[], ZhuGuoShaEnv]], use_processes: bool = True):
+        """初始化向量化环境
+
+        Args:
+            env_fns: 创建每个环境的函数（使用进程时需要能被子进程调用）
+            use_processes: 是否使用子进程
+        """
+        self.num_envs = len(env_fns)
+        self.use_processes = use_processes
+        self._envs: List[ZhuGuoShaEnv] = []
+        self._remotes = []
+        self._processes = []
+        if use_processes:
+            context = multiprocessing.get_context()
+            for env_fn in env_fns:
+                remote, worker_remote = context.Pipe()
+                process = context.Process(target=_worker, args=(worker_remote, env_fn), daemon=True)
+                process.start()
+                worker_remote.close()
+                self._remotes.append(remote)
+                self._processes.append(process)
+        else:
+            self._envs = [env_fn() for env_fn in env_fns]
+
+    def reset(self, seeds: Optional[Sequence[Optional[int]]] = None) -> Tuple[List[Any], List[Dict]]:
+        """重置所有环境
+
+        Args:
+            seeds: 每个环境的随机种子（可选）
+
+        Returns:
+            (观测列表, info列表)
+        """
+        seeds = list(seeds) if seeds is not None else [None] * self.num_envs
+        if self.use_processes:
+            for remote, seed in zip(self._remotes, seeds):
+                remote.send(("reset", seed))
+            results = [remote.recv() for remote in self._remotes]
+        else:
+            results = [env.reset(seed) for env, seed in zip(self._envs, seeds)]
+        observations, infos = zip(*results)
+        return list(observations), list(infos)
+
+    def step(self, actions: Sequence[int]) -> Tuple[List[Any], List[float], List[bool], List[bool], List[Dict]]:
+        """所有环境各推进一步
+
+        Args:
+            actions: 每个环境的选项下标
+
+        Returns:
+            (观测列表, 奖励列表, 分出胜负列表, 截断列表, info列表)
+        """
+        if self.use_processes:
+            for remote, action in zip(self._remotes, actions):
+                remote.send(("step", int(action)))
+            results = [remote.recv() for remote in self._remotes]
+        else:
+            results = [_step_with_autoreset(env, action) for env, action in zip(self._envs, actions)]
+        observations, rewards, terminated, truncated, infos = zip(*results)
+        return list(observations), list(rewards), list(terminated), list(truncated), list(infos)
+
+    def close(self) -> None:
+        """关闭所有环境"""
+        if self.use_processes:
+            for remote in self._remotes:
+                try:
+                    remote.send(("close", None))
+                except (BrokenPipeError, EOFError):
+                    pass
+            for process in self._processes:
+                process.join(timeout=5.0)
+            self._remotes = []
+            self._processes = []
+        else:
+            for env in self._envs:
+                env.close()
@@ -0,0 +1,167 @@
+# 猪国杀环境模块
+"""Gym 风格的单局环境：reset(seed) / step(action)，在决策点把控制权交给外部智能体"""
+import random
+import threading
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.game_controller.game_controller import GameController
+from backend.control.agent_control import AgentControl, Decision, GameAborted
+from backend.control.control_manager import build_visible_state
+from backend.env.observation import encode_observation, action_mask
+from backend.utils.event_sender import event_routing
+from config.enums import ControlType
+from config.simple_card_config import SimpleGameConfig
+
+
+class ZhuGuoShaEnv:
+    """猪国杀环境
+
+    指定座位由 AgentControl 操控，其余座位按配置中的操控类型行动。
+    游戏在后台线程中运行，每到该座位的决策点（出牌选牌、选目标、响应用牌、弃牌）就暂停，
+    由 step(action) 给出选项下标后继续。
+
+    - 观测：encode_observation 对该座位可见状态的定长编码
+    - 动作：当前决策选项的下标，info["action_mask"] 为合法动作掩码
+    - 奖励：对局结束时己方获胜为1，失败为-1，其余为0
+
+    该座位在第一次决策前就死亡（或对局已结束）时，reset 会重新开一局，
+    保证返回的局面总有一个待决策点。
+    """
+
+    def __init__(self, config: SimpleGameConfig, agent_player_id: int = 0, max_reset_attempts: int = 100):
+        """初始化环境
+
+        Args:
+            config: 游戏配置（agent_player_id 座位的操控类型会被替换为外部智能体操控）
+            agent_player_id: 由外部智能体操控的座位
+            max_reset_attempts: reset 时最多开局的次数（每局都在该座位决策前结束时抛出异常）
+        """
+        players_config = list(config.players_config)
+        players_config[agent_player_id] = replace(players_config[agent_player_id], control_type=ControlType.AGENT)
+        self.config = replace(config, players_config=players_config)
+        self.agent_player_id = agent_player_id
+        self.max_reset_attempts = max_reset_attempts
+        self.skipped_games = 0  # 最近一次 reset 中因该座位没有决策而跳过的对局数
+
+        self.game_controller: Optional[GameController] = None
+        self.control: Optional[AgentControl] = None
+        self._thread: Optional[threading.Thread] = None
+        self._decision: Optional[Decision] = None
+        self._error: Optional[BaseException] = None
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Any, Dict]:
+        """开始新的一局
+
+        Args:
+            seed: 随机种子（洗牌和规则AI的随机选择都使用全局random）
+
+        Returns:
+            (观测, info)
+
+        Raises:
+            RuntimeError: 连续 max_reset_attempts 局都在该座位决策前结束
+        """
+        self.close()
+        if seed is not None:
+            random.seed(seed)
+
+        self.skipped_games = 0
+        for _ in range(self.max_reset_attempts):
+            self._start_game()
+            if self._decision is not None:
+                return self._observe(), self._info()
+            # 该座位还没决策对局就结束了（如在首个决策点之前死亡），继续使用同一随机数序列重新开局
+            self.close()
+            self.skipped_games += 1
+        raise RuntimeError(f"连续 {self.max_reset_attempts} 局都在座位 {self.agent_player_id} 决策前结束")
+
+    def step(self, action: int) -> Tuple[Any, float, bool, bool, Dict]:
+        """对当前决策给出选项下标，推进到下一个决策点或对局结束
+
+        Args:
+            action: 选项下标
+
+        Returns:
+            (观测, 奖励, 是否分出胜负, 是否因回合上限等原因截断, info)
+        """
+        if self._decision is None:
+            raise RuntimeError("对局已结束或尚未开始，请先调用 reset()")
+        self.control.submit_action(int(action))
+        self._decision = self.control.requests.get()
+        self._raise_error()
+
+        reward = 0.0
+        terminated = truncated = False
+        if self._decision is None:
+            winner = self.game_controller.player_controller.get_winner()
+            terminated = winner is not None
+            truncated = not terminated
+            reward = self._reward(winner)
+        return self._observe(), reward, terminated, truncated, self._info()
+
+    def close(self) -> None:
+        """结束正在进行的对局（等待游戏线程退出）"""
+        if self._thread is not None:
+            if self._decision is not None:
+                self.control.abort()
+            self._thread.join()
+        self._thread = None
+        self._decision = None
+
+    def _start_game(self) -> None:
+        """开一局新游戏，运行到该座位的第一个决策点或对局结束"""
+        game_controller = GameController(self.config)
+        game_controller.initialize()
+        self.game_controller = game_controller
+        self.control = game_controller.player_controller.get_player(self.agent_player_id).control
+        self._error = None
+        self._thread = threading.Thread(target=self._run_game, name="zhuguosha-env-game", daemon=True)
+        self._thread.start()
+        self._decision = self.control.requests.get()
+        self._raise_error()
+
+    def _run_game(self) -> None:
+        """游戏线程：运行主循环，结束时发送 None 表示对局结束"""
+        game_controller = self.game_controller
+        try:
+            # 事件只分发给本局的ControlManager，不发送到前端
+            with event_routing(game_controller.player_controller.control_manager):
+                game_controller.start_game()
+        except GameAborted:
+            pass
+        except BaseException as error:
+            self._error = error
+        finally:
+            self.control.requests.put(None)
+
+    def _raise_error(self) -> None:
+        """把游戏线程中的异常抛到调用方"""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _observe(self) -> Any:
+        visible_state = build_visible_state(self.game_controller.player_controller, self.agent_player_id)
+        return encode_observation(visible_state, self._decision)
+
+    def _info(self) -> Dict:
+        decision = self._decision
+        return {
+            "decision_kind": decision.kind if decision else None,
+            "options": [str(option) if option is not None else None for option in decision.options] if decision else [],
+            "action_mask": action_mask(decision),
+        }
+
+    def _reward(self, winner: Optional[str]) -> float:
+        if not winner:
+            return 0.0
+        player_controller = self.game_controller.player_controller
+        winning_identities = player_controller.get_winning_identities()
+        if not winning_identities:
+            return 0.0
+        identity = player_controller.get_player(self.agent_player_id).identity
+        return 1.0 if identity in winning_identities else -1.0
@@ -1,7 +1,7 @@
 # 牌效果处理器模块
 """使用策略模式处理各种牌的效果"""
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -12,6 +12,7 @@ from backend.deck.deck import Deck
 from backend.utils.logger import game_logger
 from backend.utils.event_sender import send_play_card_event
 from config.enums import CardName, CardType, GameEvent, CardSuit, CharacterName
+from config.card_properties import CARD_PROPERTIES
 
 
 class CardEffectHandler(ABC):
@@ -24,10 +25,29 @@ class CardEffectHandler(ABC):
             game_controller: 游戏控制器引用
         """
         self.game_controller = game_controller
-        self.player_controller = game_controller.player_controller
-        self.deck = game_controller.deck
         self.current_player_id = game_controller.current_player_id
     
+    @property
+    def player_controller(self) -> PlayerController:
+        """玩家控制器（从游戏控制器读取，处理器实例可在整局游戏中复用）"""
+        return self.game_controller.player_controller
+    
+    @property
+    def deck(self) -> Deck:
+        """牌堆（从游戏控制器读取）"""
+        return self.game_controller.deck
+    
+    def execute(self, card: Card, targets: List[int], current_player_id: int) -> None:
+        """在显式的回合上下文中处理牌效果
+        
+        Args:
+            card: 出的牌
+            targets: 目标列表
+            current_player_id: 出牌玩家（当前回合玩家）ID
+        """
+        self.current_player_id = current_player_id
+        self.handle(card, targets)
+    
     @abstractmethod
     def handle(self, card: Card, targets: List[int]) -> None:
         """处理牌效果
@@ -91,30 +111,18 @@ class CardEffectHandler(ABC):
         Returns:
             bool: 最终是否生效
         """
-        # 获取所有存活玩家，从使用锦囊的玩家（或使用无懈的玩家）开始按顺时针顺序询问
-        alive_players = [p for p in self.player_controller.players if p.is_alive()]
-        if not alive_players:
+        # 只询问手牌中有无懈可击（或可转化为无懈可击）的存活玩家，
+        # 从使用锦囊的玩家（或使用无懈的玩家）开始按顺时针顺序排列；无人持有时直接返回
+        holders = self.player_controller.get_wu_xie_holders(user_player_id)
+        if not holders:
             return is_effective
         
-        # 找到使用锦囊的玩家（或使用无懈的玩家）在存活玩家中的位置
-        user_index = -1
-        for i, player in enumerate(alive_players):
-            if player.player_id == user_player_id:
-                user_index = i
-                break
+        user_player = self.player_controller.get_player(user_player_id)
+        target_player = self.player_controller.get_player(target_player_id)
+        context = f"{user_player.name if user_player else '玩家' + str(user_player_id)}使用的{original_card.name}对{target_player.name if target_player else '玩家' + str(target_player_id)}即将{'生效' if is_effective else '失效'}，是否使用无懈可击"
         
-        if user_index == -1:
-            return is_effective
-        
-        # 从使用锦囊的玩家（或使用无懈的玩家）开始按顺时针顺序询问无懈可击
-        for i in range(len(alive_players)):
-            player_index = (user_index + i) % len(alive_players)
-            player = alive_players[player_index]
-            
-            # 询问是否使用无懈可击
-            user_player = self.player_controller.get_player(user_player_id)
-            target_player = self.player_controller.get_player(target_player_id)
-            context = f"{user_player.name if user_player else '玩家' + str(user_player_id)}使用的{original_card.name}对{target_player.name if target_player else '玩家' + str(target_player_id)}即将{'生效' if is_effective else '失效'}，是否使用无懈可击"
+        # 按顺时针顺序询问持有者是否使用无懈可击
+        for player in holders:
             wu_xie_card = player.ask_use_wu_xie_ke_ji(context)
             
             if wu_xie_card is not None:
@@ -546,6 +554,32 @@ class WuXieKeJiCardHandler(CardEffectHandler):
 class CardEffectHandlerFactory:
     """牌效果处理器工厂（工厂模式）"""
     
+    @staticmethod
+    def create_handler_table(game_controller) -> Dict[CardName, CardEffectHandler]:
+        """创建整局游戏复用的 牌名 → 处理器 分派表
+        
+        每种处理器只创建一个实例，所有装备牌共用同一个装备处理器。
+        
+        Args:
+            game_controller: 游戏控制器
+            
+        Returns:
+            牌名到处理器实例的字典
+        """
+        table: Dict[CardName, CardEffectHandler] = {
+            CardName.SHA: ShaCardHandler(game_controller),
+            CardName.TAO: TaoCardHandler(game_controller),
+            CardName.JUE_DOU: JueDouCardHandler(game_controller),
+            CardName.NAN_MAN_RU_QIN: NanManRuQinCardHandler(game_controller),
+            CardName.WAN_JIAN_QI_FA: WanJianQiFaCardHandler(game_controller),
+            CardName.WU_XIE_KE_JI: WuXieKeJiCardHandler(game_controller),
+        }
+        equipment_handler = EquipmentCardHandler(game_controller)
+        for card_name, properties in CARD_PROPERTIES.items():
+            if properties.get("card_type") == CardType.EQUIPMENT:
+                table.setdefault(card_name, equipment_handler)
+        return table
+    
     @staticmethod
     def create_handler(card: Card, game_controller) -> CardEffectHandler:
         """根据牌类型创建对应的处理器
@@ -0,0 +1,91 @@
+# 牌效果钩子模块
+"""在牌效果处理器结算完成后执行的技能钩子（如赵云的“冲阵”）"""
+from abc import ABC, abstractmethod
+from typing import List
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.card.card import Card
+from backend.utils.logger import game_logger
+from backend.utils.event_sender import send_steal_card_event
+from config.enums import CharacterName
+
+
+class CardEffectHook(ABC):
+    """牌效果钩子基类
+
+    在 GameController 中注册后，每张牌的效果结算完成后依次调用。
+    """
+
+    def __init__(self, game_controller):
+        """初始化钩子
+
+        Args:
+            game_controller: 游戏控制器引用
+        """
+        self.game_controller = game_controller
+
+    @abstractmethod
+    def after_effect(self, card: Card, targets: List[int], current_player_id: int) -> None:
+        """牌效果结算完成后调用
+
+        Args:
+            card: 出的牌
+            targets: 目标列表
+            current_player_id: 出牌玩家（当前回合玩家）ID
+        """
+        pass
+
+
+class ChongZhenHook(CardEffectHook):
+    """赵云“冲阵”钩子
+
+    出牌是通过龙胆转换（闪转杀/杀转闪）而来，且使用者为赵云2（第二章的赵云）时，
+    从主要目标（targets[0]）处获得一张手牌。
+    """
+
+    def after_effect(self, card: Card, targets: List[int], current_player_id: int) -> None:
+        """处理冲阵夺牌"""
+        # card.converted_from 表示该卡是被龙胆转换过来的（如闪->杀或杀->闪）
+        if getattr(card, 'converted_from', None) is None or not targets:
+            return
+
+        player_controller = self.game_controller.player_controller
+        attacker = player_controller.get_player(current_player_id)
+        if attacker is None or attacker.character_name != CharacterName.ZHAO_YUN_2:
+            return
+
+        # 只对主要目标进行夺牌（如杀的目标或锦囊的指定目标）——使用 targets[0] 作为主目标
+        primary_tid = targets[0]
+        target_player = player_controller.get_player(primary_tid)
+        if target_player is None or not target_player.hand_cards:
+            return
+
+        # 询问操控者要夺取目标的哪张手牌（传入询问时的手牌数量快照）
+        snapshot_count = len(target_player.hand_cards)
+        try:
+            idx = attacker.control.ask_steal_from_target(primary_tid, snapshot_count, context=f"通过冲阵从 玩家{primary_tid} 夺牌")
+        except Exception:
+            idx = None
+        if idx is None:
+            # 玩家选择不夺或发生错误，跳过夺牌但不中断后续流程
+            return
+
+        # 在询问期间目标手牌可能已变化，重新获取当前手牌数并调整索引
+        current_count = len(target_player.hand_cards)
+        if current_count <= 0:
+            # 目标已无手牌，无法夺取
+            return
+        # 如果索引超出当前范围，则使用当前最后一张
+        idx = min(max(idx, 0), current_count - 1)
+        stolen = target_player.hand_cards.pop(idx)
+        attacker.hand_cards.append(stolen)
+
+        # 发送夺牌事件以便前端做动画（从目标玩家到攻击者）
+        try:
+            send_steal_card_event(stolen, primary_tid, attacker.player_id)
+        except Exception:
+            # 如果事件发送失败，也不阻塞游戏逻辑
+            pass
+        game_logger.log_info(f"{attacker.name} 通过冲阵从 {target_player.name} 获得一张手牌 (index {idx})")
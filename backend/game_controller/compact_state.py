@@ -0,0 +1,256 @@
+# 紧凑游戏状态模块
+"""按座次排列的数组式游戏状态（血量、身份、存活、装备、手牌），以及兼容 Player 只读接口的视图"""
+from array import array
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.card.card import Card
+from backend.player.player import Player
+from backend.control.control_manager import build_visible_state
+from backend.game_controller.game_snapshot import GameSnapshot, CardTable, EQUIPMENT_SLOTS
+from config.enums import PlayerIdentity, PlayerStatus
+
+
+# 身份编码（数组中保存下标）
+IDENTITIES: Tuple[PlayerIdentity, ...] = tuple(PlayerIdentity)
+IDENTITY_CODES: Dict[PlayerIdentity, int] = {identity: code for code, identity in enumerate(IDENTITIES)}
+
+# 快照标量在 Player.SNAPSHOT_FIELDS 中的位置
+_STATUS = Player.SNAPSHOT_FIELDS.index("status")
+_CURRENT_HP = Player.SNAPSHOT_FIELDS.index("current_hp")
+_MAX_HP = Player.SNAPSHOT_FIELDS.index("max_hp")
+_IDENTITY = Player.SNAPSHOT_FIELDS.index("identity")
+_CHARACTER_NAME = Player.SNAPSHOT_FIELDS.index("character_name")
+
+_SLOT_COUNT = len(EQUIPMENT_SLOTS)
+
+
+class SeatView:
+    """座位视图：以 Player 的只读接口读取紧凑状态
+
+    提供 player_id、name、identity、character_name、status、current_hp、max_hp、
+    hand_cards、weapon/armor/horse_plus/horse_minus 和 is_alive()，
+    可以直接交给只读取这些属性的代码（如 build_visible_state）使用。
+    """
+
+    def __init__(self, state: 'CompactGameState', player_id: int):
+        self._state = state
+        self.player_id = player_id
+
+    @property
+    def name(self) -> str:
+        return self._state.names[self.player_id]
+
+    @property
+    def character_name(self):
+        return self._state.character_names[self.player_id]
+
+    @property
+    def identity(self) -> PlayerIdentity:
+        return IDENTITIES[self._state.identity[self.player_id]]
+
+    @property
+    def status(self) -> PlayerStatus:
+        return PlayerStatus.ALIVE if self._state.alive[self.player_id] else PlayerStatus.DEAD
+
+    @property
+    def current_hp(self) -> int:
+        return self._state.hp[self.player_id]
+
+    @property
+    def max_hp(self) -> int:
+        return self._state.max_hp[self.player_id]
+
+    @property
+    def hand_cards(self) -> List[Card]:
+        """手牌（从左往右）"""
+        return self._state.card_table.cards_at(self._state.hand_of(self.player_id))
+
+    def _equipment(self, slot: int) -> Optional[Card]:
+        return self._state.card_table.card_at(self._state.equipment[self.player_id * _SLOT_COUNT + slot])
+
+    @property
+    def weapon(self) -> Optional[Card]:
+        return self._equipment(0)
+
+    @property
+    def armor(self) -> Optional[Card]:
+        return self._equipment(1)
+
+    @property
+    def horse_plus(self) -> Optional[Card]:
+        return self._equipment(2)
+
+    @property
+    def horse_minus(self) -> Optional[Card]:
+        return self._equipment(3)
+
+    def is_alive(self) -> bool:
+        return bool(self._state.alive[self.player_id])
+
+    def __repr__(self) -> str:
+        return f"SeatView({self.player_id}, {self.name}, hp={self.current_hp}/{self.max_hp})"
+
+
+class DeckView:
+    """牌堆视图（提供 cards 和 discard_pile）"""
+
+    def __init__(self, state: 'CompactGameState'):
+        self._state = state
+
+    @property
+    def cards(self) -> List[Card]:
+        return self._state.card_table.cards_at(self._state.deck)
+
+    @property
+    def discard_pile(self) -> List[Card]:
+        return self._state.card_table.cards_at(self._state.discard_pile)
+
+
+class CompactGameState:
+    """数组式紧凑游戏状态
+
+    所有座位的数据按座次保存在小整数数组中（array模块，不依赖第三方库）：
+    - hp / max_hp: 当前血量、血量上限（有符号字节）
+    - identity: 身份编码（IDENTITIES 的下标）
+    - alive: 存活标记（1存活，0死亡）
+    - equipment: 装备牌表下标，长度为 座位数*4（武器、防具、+1马、-1马），-1表示空
+    - hands / hand_offsets: 所有座位的手牌牌表下标依次连接，第 i 个座位的手牌为
+      hands[hand_offsets[i]:hand_offsets[i + 1]]
+    - deck / discard_pile: 牌堆、弃牌堆的牌表下标
+
+    数组支持缓冲区协议，需要向量化统计时可以用 numpy.frombuffer 零拷贝转换。
+    players / get_player 返回兼容 Player 只读接口的座位视图，
+    visible_state 生成与 ControlManager 相同格式的可见状态，已有的操控模块可以直接 sync_state。
+    """
+
+    def __init__(self, snapshot: GameSnapshot, card_table: CardTable, names: Tuple[str, ...]):
+        """由游戏快照创建紧凑状态
+
+        Args:
+            snapshot: 游戏快照
+            card_table: 快照使用的牌表
+            names: 按座次排列的玩家名称
+        """
+        self.snapshot = snapshot  # 未展开为数组的其余状态（回合状态、技能状态等）
+        self.card_table = card_table
+        self.names = names
+        self.current_player_id = snapshot.current_player_id
+        self.turn_number = snapshot.turn_number
+
+        player_states = snapshot.players
+        self.character_names = tuple(state.scalars[_CHARACTER_NAME] for state in player_states)
+        self.hp = array('b', [state.scalars[_CURRENT_HP] for state in player_states])
+        self.max_hp = array('b', [state.scalars[_MAX_HP] for state in player_states])
+        self.identity = array('B', [IDENTITY_CODES[state.scalars[_IDENTITY]] for state in player_states])
+        self.alive = array('B', [state.scalars[_STATUS] == PlayerStatus.ALIVE for state in player_states])
+        self.equipment = array('h')
+        self.hands = array('h')
+        self.hand_offsets = array('H', [0])
+        for state in player_states:
+            self.equipment.extend(state.equipment)
+            self.hands.extend(state.hand)
+            self.hand_offsets.append(len(self.hands))
+        self.deck = array('h', snapshot.deck)
+        self.discard_pile = array('h', snapshot.discard_pile)
+
+        self.players = [SeatView(self, player_id) for player_id in range(len(player_states))]
+
+    @property
+    def seat_count(self) -> int:
+        """座位数"""
+        return len(self.hp)
+
+    def get_player(self, player_id: int) -> Optional[SeatView]:
+        """获取座位视图（与 PlayerController.get_player 相同的接口）"""
+        if 0 <= player_id < len(self.players):
+            return self.players[player_id]
+        return None
+
+    @property
+    def deck_view(self) -> DeckView:
+        """牌堆视图"""
+        return DeckView(self)
+
+    def hand_of(self, player_id: int) -> array:
+        """座位的手牌牌表下标"""
+        return self.hands[self.hand_offsets[player_id]:self.hand_offsets[player_id + 1]]
+
+    def hand_count(self, player_id: int) -> int:
+        """座位的手牌数"""
+        return self.hand_offsets[player_id + 1] - self.hand_offsets[player_id]
+
+    def visible_state(self, player_id: int) -> Dict:
+        """获取指定玩家能看到的状态（与 ControlManager 同步给操控模块的格式相同）"""
+        return build_visible_state(_VisibleStateSource(self), player_id)
+
+    def alive_count(self) -> int:
+        """存活人数"""
+        return sum(self.alive)
+
+    def hp_by_identity(self) -> Dict[PlayerIdentity, int]:
+        """按身份统计存活玩家的血量之和"""
+        totals = {identity: 0 for identity in IDENTITIES}
+        for code, hp, alive in zip(self.identity, self.hp, self.alive):
+            if alive:
+                totals[IDENTITIES[code]] += hp
+        return totals
+
+    def key(self) -> bytes:
+        """状态键（数组内容的字节串，可用于哈希和比较局面）"""
+        return b"".join((
+            self.hp.tobytes(), self.max_hp.tobytes(), self.identity.tobytes(), self.alive.tobytes(),
+            self.equipment.tobytes(), self.hand_offsets.tobytes(), self.hands.tobytes(),
+            array('H', [len(self.deck)]).tobytes(), self.deck.tobytes(), self.discard_pile.tobytes(),
+        ))
+
+    def copy(self) -> 'CompactGameState':
+        """复制紧凑状态（只复制数组，牌表和快照共享）"""
+        state = CompactGameState.__new__(CompactGameState)
+        state.snapshot = self.snapshot
+        state.card_table = self.card_table
+        state.names = self.names
+        state.current_player_id = self.current_player_id
+        state.turn_number = self.turn_number
+        state.character_names = self.character_names
+        for field in ("hp", "max_hp", "identity", "alive", "equipment", "hands", "hand_offsets", "deck", "discard_pile"):
+            setattr(state, field, getattr(self, field)[:])
+        state.players = [SeatView(state, player_id) for player_id in range(len(state.hp))]
+        return state
+
+    def to_snapshot(self) -> GameSnapshot:
+        """将数组中的状态写回游戏快照（可用于 GameController.restore）"""
+        players = []
+        for player_id, player_state in enumerate(self.snapshot.players):
+            scalars = list(player_state.scalars)
+            scalars[_CURRENT_HP] = self.hp[player_id]
+            scalars[_MAX_HP] = self.max_hp[player_id]
+            scalars[_IDENTITY] = IDENTITIES[self.identity[player_id]]
+            scalars[_STATUS] = PlayerStatus.ALIVE if self.alive[player_id] else PlayerStatus.DEAD
+            start = player_id * _SLOT_COUNT
+            players.append(replace(
+                player_state,
+                scalars=tuple(scalars),
+                hand=tuple(self.hand_of(player_id)),
+                equipment=tuple(self.equipment[start:start + _SLOT_COUNT]),
+            ))
+        return replace(
+            self.snapshot,
+            current_player_id=self.current_player_id,
+            turn_number=self.turn_number,
+            deck=tuple(self.deck),
+            discard_pile=tuple(self.discard_pile),
+            players=tuple(players),
+        )
+
+
+class _VisibleStateSource:
+    """为 build_visible_state 提供 PlayerController 的只读接口"""
+
+    def __init__(self, state: CompactGameState):
+        self.players = state.players
+        self.get_player = state.get_player
+        self.deck = state.deck_view
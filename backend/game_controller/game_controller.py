@@ -1,17 +1,22 @@
 # 游戏控制盘模块
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import sys
 import os
+import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from backend.player_controller.player_controller import PlayerController
 from backend.deck.deck import Deck
 from backend.card.card import Card
 from backend.utils.logger import game_logger
-from backend.game_controller.card_effect_handler import CardEffectHandlerFactory
-from config.enums import CardName, CardType, GameEvent, CardSuit
+from backend.game_controller.card_effect_handler import CardEffectHandler, CardEffectHandlerFactory
+from backend.game_controller.card_effect_hook import CardEffectHook, ChongZhenHook
+from backend.game_controller.game_snapshot import GameSnapshot, CardTable
+from backend.game_controller.compact_state import CompactGameState
+from config.enums import CardName, CardType, GameEvent, CardSuit, ControlType, GameOutcome
 from config.simple_card_config import SimpleGameConfig
-from backend.utils.event_sender import send_draw_card_event, send_game_over_event
+from backend.utils.event_sender import send_draw_card_event, send_game_over_event, send_turn_start, is_frontend_enabled
+from backend.utils.zobrist import StateHash
 from communicator.communicator import communicator
 from communicator.comm_event import DebugEvent
 from config.enums import PlayerIdentity
@@ -24,6 +29,9 @@ class GameController:
     负责游戏的主循环和牌效果处理
     """
     
+    # 对局状态哈希（初始化后绑定到玩家和牌堆，见 rehash_state）
+    state_hash: Optional[StateHash] = None
+    
     def __init__(self, config: SimpleGameConfig):
         """初始化函数
         
@@ -34,7 +42,121 @@ class GameController:
         self.player_controller = None
         self.deck = None
         self.current_player_id = None
+        self.state_hash = StateHash()
         self.game_ended = False
+        self.turn_number = 1  # 当前回合数（保存在对象上，便于快照恢复后继续游戏）
+        
+        # 对局终止条件（回合之间由 check_limits 检查，None表示不限制）
+        self.max_turns: Optional[int] = 1000  # 最大回合数
+        self.time_limit: Optional[float] = None  # 整局的时间上限（秒）
+        self.repetition_limit: Optional[int] = None  # 同一局面在回合之间出现的次数达到该值时判定为循环（默认关闭）
+        self.max_play_cards = 100  # 每个出牌阶段最多出牌数（防止无限出牌）
+        self.termination: Optional[GameOutcome] = None  # 因终止条件结束时的原因
+        self._position_counts: Dict[tuple, int] = {}
+        self._started_at: Optional[float] = None
+        
+        # 牌表：快照中的牌以牌表下标表示（首次快照时建立）
+        self.card_table: Optional[CardTable] = None
+        
+        # 牌效果处理器分派表（整局游戏复用同一组处理器实例）
+        self.card_effect_handlers: Dict[CardName, CardEffectHandler] = CardEffectHandlerFactory.create_handler_table(self)
+        # 牌效果结算后的技能钩子
+        self.card_effect_hooks: List[CardEffectHook] = [ChongZhenHook(self)]
+    
+    @property
+    def current_player_id(self) -> Optional[int]:
+        """当前回合玩家ID"""
+        return self._current_player_id
+    
+    @current_player_id.setter
+    def current_player_id(self, player_id: Optional[int]) -> None:
+        if self.state_hash is not None:
+            self.state_hash.replace(("turn", self._current_player_id), ("turn", player_id))
+        self._current_player_id = player_id
+    
+    @property
+    def outcome(self) -> Optional[GameOutcome]:
+        """对局结果（未结束时为None）"""
+        if self.player_controller is not None and self.player_controller.game_over():
+            return GameOutcome.FINISHED
+        if self.termination is not None:
+            return self.termination
+        return GameOutcome.ABORTED if self.game_ended else None
+    
+    def position_key(self) -> tuple:
+        """局面的键：状态哈希、公开信息板上的跳忠跳反标记和各操控模块的私有推断状态
+        
+        回合之间局面的键相同，且操控模块的决策只取决于局面时，之后的对局会重复同样的过程。
+        """
+        board = self.player_controller.control_manager.knowledge_board
+        controls = tuple(player.control.capture_state() for player in self.player_controller.players)
+        return (self.state_hash.value, board.loyal_mask, board.rebel_mask, controls)
+    
+    def check_limits(self) -> bool:
+        """在回合之间检查终止条件，满足时结束对局并记录原因（见 outcome）
+        
+        - 回合数超过 max_turns
+        - 对局时间超过 time_limit
+        - 同一局面（position_key）出现 repetition_limit 次：position_key 不包括随机数状态，
+          规则操控在并列时的随机选择和玩家的选择也不确定，局面重复并不能证明对局循环，
+          因此默认关闭，只在确定性的对局或自我对弈中开启
+        
+        因终止条件结束时向前端发送游戏结束事件（未分胜负），等待结果的前端和玩家不会一直等下去。
+        
+        Returns:
+            是否因终止条件结束
+        """
+        if self.game_ended:
+            return False
+        reason = None
+        if self.max_turns is not None and self.turn_number > self.max_turns:
+            reason = GameOutcome.TURN_LIMIT
+            game_logger.log_error(f"游戏超过最大回合数 {self.max_turns}，强制结束")
+        elif self.time_limit is not None and self._started_at is not None \
+                and time.perf_counter() - self._started_at > self.time_limit:
+            reason = GameOutcome.TIME_LIMIT
+            game_logger.log_error(f"游戏超过时间上限 {self.time_limit} 秒，强制结束")
+        elif self.repetition_limit is not None:
+            key = self.position_key()
+            count = self._position_counts.get(key, 0) + 1
+            self._position_counts[key] = count
+            if count >= self.repetition_limit:
+                reason = GameOutcome.REPETITION
+                game_logger.log_warning(f"第 {self.turn_number} 回合：同一局面已出现 {count} 次，判定为循环，提前结束")
+        if reason is None:
+            return False
+        self.termination = reason
+        self.game_ended = True
+        send_game_over_event(f"对局结束（{reason.value}），未分胜负")
+        return True
+    
+    def rehash_state(self) -> int:
+        """整体遍历一次对局，重新计算状态哈希并绑定到玩家和牌堆
+        
+        之后血量、存活状态、是否已出杀、手牌、装备、牌堆、弃牌堆和当前回合玩家的每次修改都会增量更新
+        state_hash，可以 O(1) 地比较两个局面是否相同（回合数、随机数状态和操控模块的推断不计入）。
+        
+        Returns:
+            状态哈希值
+        """
+        state_hash = self.state_hash
+        self.deck.attach_state_hash(None)
+        for player in self.player_controller.players:
+            player.attach_state_hash(None)
+        state_hash.value = 0
+        self.deck.attach_state_hash(state_hash)
+        for player in self.player_controller.players:
+            player.attach_state_hash(state_hash)
+        state_hash.toggle("turn", self._current_player_id)
+        return state_hash.value
+    
+    def register_card_effect_hook(self, hook: CardEffectHook) -> None:
+        """注册牌效果结算后的技能钩子
+        
+        Args:
+            hook: 钩子实例
+        """
+        self.card_effect_hooks.append(hook)
     
     def initialize(self) -> None:
         """初始化游戏
@@ -50,16 +172,25 @@ class GameController:
         # 创建玩家控制器
         self.player_controller = PlayerController(self.config, self.deck)
         game_logger.log_info(f"玩家控制器创建完成，玩家数量: {len(self.player_controller.players)}")
+        self.bind_controls()
         
         # 获取初始玩家
         self.current_player_id = self.player_controller.get_initial_player()
         game_logger.log_info(f"初始玩家ID: {self.current_player_id}")
+        self.rehash_state()
         
         game_logger.log_info("游戏初始化完成")
     
+    def bind_controls(self) -> None:
+        """让需要在决策时搜索对局的操控模块（如ISMCTS）持有本对局的引用（初始化后替换了玩家时需要重新调用）"""
+        for player in self.player_controller.players:
+            if hasattr(player.control, 'bind_game'):
+                player.control.bind_game(self)
+    
     def _check_debug_events(self):
         """检查调试事件（一键胜利/失败）"""
-        if not communicator:
+        # 模拟对局（不向前端发送事件）不读取前端的调试指令
+        if not communicator or not is_frontend_enabled():
             return
         
         # 尝试获取所有待处理的调试事件
@@ -131,124 +262,274 @@ class GameController:
         if self.player_controller is None:
             self.initialize()
         
-        # 检查所有玩家是否已有初始手牌，如果没有则发牌（确保只发一次）
+        self._deal_initial_cards()
+        
+        game_logger.log_info("游戏主循环开始")
+        
+        # 主循环：每个回合结束后检查回合数、时间和局面重复
+        while not self.game_ended:
+            if not self.play_turn() or self.check_limits():
+                break
+        
+        # 善后工作
+        self._cleanup()
+    
+    def _deal_initial_cards(self) -> None:
+        """检查所有玩家是否已有初始手牌，如果没有则发牌（确保只发一次），并开始计时"""
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
         for player in self.player_controller.players:
             if player.deck is not None and len(player.hand_cards) == 0:
                 player._draw_initial_cards()
+    
+    def play_turn(self) -> bool:
+        """进行一个回合（主循环的一次迭代）
         
-        game_logger.log_info("游戏主循环开始")
+        当前玩家已死亡时只切换到下一个玩家，不计回合数。
         
-        # 主循环
-        turn_number = 1
-        max_turns = 1000  # 防止无限循环
-        while not self.game_ended and turn_number <= max_turns:
-            # 检查调试事件
-            self._check_debug_events()
-            if self.game_ended:
-                break
+        Returns:
+            是否继续游戏（False表示游戏已结束）
+        """
+        # 检查调试事件
+        self._check_debug_events()
+        if self.game_ended:
+            return False
 
-            current_player = self.player_controller.get_player(self.current_player_id)
+        current_player = self.player_controller.get_player(self.current_player_id)
+        
+        # 检查当前玩家是否有效
+        if current_player is None:
+            game_logger.log_error(f"当前玩家ID {self.current_player_id} 无效，强制结束游戏")
+            self.game_ended = True
+            return False
+        
+        # 检查当前玩家是否存活
+        if not current_player.is_alive():
+            # 如果当前玩家已死亡，跳到下一个玩家
+            self.current_player_id = self.player_controller.next_player(self.current_player_id)
+            return True
+        
+        # 记录回合开始
+        game_logger.log_turn_start(current_player.name, self.turn_number)
+        send_turn_start(self.turn_number, self.player_controller.players)
+        
+        # 记录所有玩家状态
+        game_logger.log_all_players_status(self.player_controller.players)
+        
+        # 记录牌堆状态
+        game_logger.log_deck_status(self.deck)
+        
+        # 准备阶段
+        game_logger.log_phase_start(current_player.name, "准备")
+        self.player_controller.event(self.current_player_id, GameEvent.PREPARE)
+        # 同步状态
+        self.player_controller.control_manager.sync_game_state()
+        
+        # 摸牌阶段
+        game_logger.log_phase_start(current_player.name, "摸牌")
+        self.player_controller.event(self.current_player_id, GameEvent.DRAW_CARD)
+        # 同步状态（摸牌后状态变化）
+        self.player_controller.control_manager.sync_player_state(self.current_player_id)
+        
+        return self._finish_turn(current_player)
+    
+    def continue_turn(self) -> bool:
+        """从出牌阶段继续当前回合（用于在出牌阶段中途复制出的对局）
+        
+        Returns:
+            是否继续游戏（False表示游戏已结束）
+        """
+        current_player = self.player_controller.get_player(self.current_player_id)
+        if current_player is None or not current_player.is_alive():
+            return self.play_turn()
+        return self._finish_turn(current_player)
+    
+    def _finish_turn(self, current_player) -> bool:
+        """出牌、弃牌阶段及回合结束的处理
+        
+        Args:
+            current_player: 当前回合的玩家
             
-            # 检查当前玩家是否有效
-            if current_player is None:
-                game_logger.log_error(f"当前玩家ID {self.current_player_id} 无效，强制结束游戏")
-                self.game_ended = True
+        Returns:
+            是否继续游戏（False表示游戏已结束）
+        """
+        # 出牌阶段
+        game_logger.log_phase_start(current_player.name, "出牌")
+        play_card_count = 0
+        while play_card_count < self.max_play_cards:
+            card, targets = self.player_controller.event(
+                self.current_player_id, GameEvent.PLAY_CARD
+            )
+            if card is None:
                 break
-            
-            # 检查当前玩家是否存活
-            if not current_player.is_alive():
-                # 如果当前玩家已死亡，跳到下一个玩家
-                self.current_player_id = self.player_controller.next_player(self.current_player_id)
-                continue
-            
-            # 记录回合开始
-            game_logger.log_turn_start(current_player.name, turn_number)
-            
-            # 记录所有玩家状态
-            game_logger.log_all_players_status(self.player_controller.players)
-            
-            # 记录牌堆状态
-            game_logger.log_deck_status(self.deck)
-            
-            # 准备阶段
-            game_logger.log_phase_start(current_player.name, "准备")
-            self.player_controller.event(self.current_player_id, GameEvent.PREPARE)
-            # 同步状态
+            play_card_count += 1
+            game_logger.log_info(f"玩家 {current_player.name} 打出牌: {card.name}")
+            # 处理牌效果（预留接口）
+            self._handle_card_effect(card, targets)
+            # 同步状态（出牌后状态变化）
             self.player_controller.control_manager.sync_game_state()
             
-            # 摸牌阶段
-            game_logger.log_phase_start(current_player.name, "摸牌")
-            self.player_controller.event(self.current_player_id, GameEvent.DRAW_CARD)
-            # 同步状态（摸牌后状态变化）
-            self.player_controller.control_manager.sync_player_state(self.current_player_id)
-            
-            # 出牌阶段
-            game_logger.log_phase_start(current_player.name, "出牌")
-            play_card_count = 0
-            max_play_cards = 100  # 防止无限出牌
-            while play_card_count < max_play_cards:
-                card, targets = self.player_controller.event(
-                    self.current_player_id, GameEvent.PLAY_CARD
-                )
-                if card is None:
-                    break
-                play_card_count += 1
-                game_logger.log_info(f"玩家 {current_player.name} 打出牌: {card.name}")
-                # 处理牌效果（预留接口）
-                self._handle_card_effect(card, targets)
-                # 同步状态（出牌后状态变化）
-                self.player_controller.control_manager.sync_game_state()
-                
-                # 检查游戏是否在出牌过程中结束
-                if self.player_controller.game_over():
-                    self.game_ended = True
-                    break
-            
-            # 弃牌阶段
-            self.player_controller.event(self.current_player_id, GameEvent.DISCARD_CARD)
-            # 同步状态（弃牌后状态变化）
-            self.player_controller.control_manager.sync_player_state(self.current_player_id)
-            
-            # 记录回合结束
-            game_logger.log_turn_end(current_player.name)
-            
-            # 检查游戏是否结束
+            # 检查游戏是否在出牌过程中结束
             if self.player_controller.game_over():
-                # 输出胜利方
-                winner = self.player_controller.get_winner()
-                if winner:
-                    game_logger.log_info(f" 游戏结束！{winner}")
-                    print(f" 游戏结束！{winner}")
-                    send_game_over_event(winner)
-                break
-            
-            # 检查调试事件（回合结束时也检查一次）
-            self._check_debug_events()
-            if self.game_ended:
-                break
-
-            # 检查是否还有存活玩家
-            alive_players = [p for p in self.player_controller.players if p.is_alive()]
-            if not alive_players:
-                self.game_ended = True
-                break
-            
-            # 下一个玩家
-            next_player_id = self.player_controller.next_player(self.current_player_id)
-            if next_player_id == self.current_player_id and len(alive_players) > 1:
-                # 如果下一个玩家还是自己，说明有问题，强制结束
-                game_logger.log_warning(f"next_player返回了相同的玩家ID: {next_player_id}，强制结束游戏")
                 self.game_ended = True
                 break
-            self.current_player_id = next_player_id
-            turn_number += 1
         
-        if turn_number > max_turns:
-            game_logger.log_error(f"游戏超过最大回合数 {max_turns}，强制结束")
+        # 弃牌阶段
+        self.player_controller.event(self.current_player_id, GameEvent.DISCARD_CARD)
+        # 同步状态（弃牌后状态变化）
+        self.player_controller.control_manager.sync_player_state(self.current_player_id)
+        
+        # 记录回合结束
+        game_logger.log_turn_end(current_player.name)
+        
+        # 检查游戏是否结束
+        if self.player_controller.game_over():
+            # 输出胜利方
+            winner = self.player_controller.get_winner()
+            if winner:
+                game_logger.log_info(f" 游戏结束！{winner}")
+                # 模拟对局（不向前端发送事件）不在控制台输出
+                if is_frontend_enabled():
+                    print(f" 游戏结束！{winner}")
+                send_game_over_event(winner)
+            self.game_ended = True
+            return False
+        
+        # 检查调试事件（回合结束时也检查一次）
+        self._check_debug_events()
+        if self.game_ended:
+            return False
+
+        # 检查是否还有存活玩家
+        alive_players = [p for p in self.player_controller.players if p.is_alive()]
+        if not alive_players:
             self.game_ended = True
+            return False
         
-        # 善后工作
-        self._cleanup()
+        # 下一个玩家
+        next_player_id = self.player_controller.next_player(self.current_player_id)
+        if next_player_id == self.current_player_id and len(alive_players) > 1:
+            # 如果下一个玩家还是自己，说明有问题，强制结束
+            game_logger.log_warning(f"next_player返回了相同的玩家ID: {next_player_id}，强制结束游戏")
+            self.game_ended = True
+            return False
+        self.current_player_id = next_player_id
+        self.turn_number += 1
+        return True
+    
+    def snapshot(self) -> GameSnapshot:
+        """获取当前游戏状态的快照
+        
+        快照只包含不可变的元组和整数（牌以牌表下标表示），不复制任何牌对象，
+        可以保存任意多份并多次恢复。
+        
+        Returns:
+            游戏快照
+        """
+        if self.card_table is None:
+            self.card_table = CardTable()
+        table = self.card_table
+        deck = self.deck
+        players = self.player_controller.players
+        board = self.player_controller.control_manager.knowledge_board
+        
+        deck_cards = table.indices(deck.cards)
+        discard_pile = table.indices(deck.discard_pile)
+        player_states = tuple(player.capture_state(table) for player in players)
+        return GameSnapshot(
+            current_player_id=self.current_player_id,
+            game_ended=self.game_ended,
+            turn_number=self.turn_number,
+            deck=deck_cards,
+            discard_pile=discard_pile,
+            players=player_states,
+            # 所有牌都已登记后再比较牌面
+            card_faces=table.changed_faces(),
+            controls=tuple(player.control.capture_state() for player in players),
+            knowledge=(board.loyal_mask, board.rebel_mask),
+            rng_state=deck.get_rng().getstate(),
+        )
+    
+    def compact_state(self) -> CompactGameState:
+        """获取当前游戏状态的数组式紧凑表示
+        
+        Returns:
+            紧凑游戏状态（修改后可以通过 to_snapshot() 和 restore() 写回本对局）
+        """
+        names = tuple(player.name for player in self.player_controller.players)
+        return CompactGameState(self.snapshot(), self.card_table, names)
+    
+    def restore(self, snapshot: GameSnapshot, sync_controls: bool = True) -> None:
+        """恢复到快照时的游戏状态
+        
+        Args:
+            snapshot: 由本对局（或复制出本对局的原对局）的 snapshot() 生成的快照
+            sync_controls: 是否立即向操控模块同步可见状态。
+                恢复后直接从回合开始继续 start_game 时可以传 False（准备阶段后主循环会同步）
+        """
+        table = self.card_table
+        table.apply_faces(snapshot.card_faces)
+        deck = self.deck
+        deck.cards = table.cards_at(snapshot.deck)
+        deck.discard_pile = table.cards_at(snapshot.discard_pile)
+        deck.get_rng().setstate(snapshot.rng_state)
+        
+        player_controller = self.player_controller
+        for player, player_state, control_state in zip(player_controller.players, snapshot.players, snapshot.controls):
+            player.apply_state(player_state, table)
+            player.control.apply_state(control_state)
+        player_controller._targets_cache_key = None
+        
+        board = player_controller.control_manager.knowledge_board
+        board.loyal_mask, board.rebel_mask = snapshot.knowledge
+        board._last_event = None
+        
+        self.current_player_id = snapshot.current_player_id
+        self.game_ended = snapshot.game_ended
+        self.turn_number = snapshot.turn_number
+        self.termination = None
+        self._position_counts = {}
+        # 牌面恢复后牌名可能变化，整体重新计算状态哈希
+        self.rehash_state()
+        
+        # 操控模块的可见状态由当前局面重新同步
+        if sync_controls:
+            player_controller.control_manager.sync_game_state()
+    
+    def clone(self, control_type: Optional[ControlType] = None, sync_controls: bool = True) -> 'GameController':
+        """复制当前对局
+        
+        复制出的对局使用新的牌、玩家和操控模块对象，以及独立的洗牌随机数源，
+        之后两局互不影响。不会重新初始化牌堆和玩家，也不会向前端发送事件。
+        
+        Args:
+            control_type: 统一指定新对局的操控类型（可选，默认与原对局同类，玩家操控替换为规则操控）
+            sync_controls: 是否立即向新的操控模块同步可见状态（见 restore）
+            
+        Returns:
+            新的游戏控制盘
+        """
+        snapshot = self.snapshot()
+        
+        game_controller = GameController.__new__(GameController)
+        game_controller.config = self.config
+        game_controller.current_player_id = snapshot.current_player_id
+        game_controller.state_hash = StateHash()
+        game_controller.game_ended = snapshot.game_ended
+        game_controller.turn_number = snapshot.turn_number
+        game_controller.max_turns = self.max_turns
+        game_controller.time_limit = self.time_limit
+        game_controller.repetition_limit = self.repetition_limit
+        game_controller.max_play_cards = self.max_play_cards
+        game_controller._started_at = None
+        game_controller.card_table = self.card_table.copy()
+        game_controller.deck = self.deck.clone_empty(random.Random())
+        game_controller.player_controller = self.player_controller.clone_shell(game_controller.deck, control_type)
+        game_controller.card_effect_handlers = CardEffectHandlerFactory.create_handler_table(game_controller)
+        game_controller.card_effect_hooks = [type(hook)(game_controller) for hook in self.card_effect_hooks]
+        game_controller.restore(snapshot, sync_controls)
+        game_controller.bind_controls()
+        return game_controller
     
     def _handle_card_effect(self, card: Card, targets: list) -> None:
         """处理牌效果（使用策略模式）
@@ -257,64 +538,20 @@ class GameController:
             card: 出的牌
             targets: 目标列表
         """
-        # 使用工厂模式创建对应的处理器
-        handler = CardEffectHandlerFactory.create_handler(card, self)
-        if handler:
-            handler.handle(card, targets)
-            # 处理赵云的“冲阵”技能：如果出牌是通过龙胆转换（闪转杀/杀转闪）而来，且使用者为赵云2（第二章的赵云）
-            try:
-                from config.enums import CharacterName
-                attacker = self.player_controller.get_player(self.current_player_id)
-                if attacker and getattr(attacker, 'character_name', None) == CharacterName.ZHAO_YUN_2:
-                    # card.converted_from 表示该卡是被龙胆转换过来的（如闪->杀或杀->闪）
-                    if hasattr(card, 'converted_from') and card.converted_from is not None:
-                        # 只对主要目标进行夺牌（如杀的目标或锦囊的指定目标）——使用 targets[0] 作为主目标
-                        try:
-                            if not targets:
-                                return
-                            primary_tid = targets[0]
-                            target_player = self.player_controller.get_player(primary_tid)
-                            if target_player and hasattr(target_player, 'hand_cards') and target_player.hand_cards:
-                                # 询问操控者要夺取目标的哪张手牌（传入询问时的手牌数量快照）。
-                                try:
-                                    snapshot_count = len(target_player.hand_cards)
-                                    idx = attacker.control.ask_steal_from_target(primary_tid, snapshot_count, context=f"通过冲阵从 玩家{primary_tid} 夺牌")
-                                except Exception:
-                                    idx = None
-                                if idx is None:
-                                    # 玩家选择不夺或发生错误，跳过夺牌但不中断后续流程
-                                    pass
-                                else:
-                                    # 在询问期间目标手牌可能已变化，重新获取当前手牌数并调整索引
-                                    current_count = len(target_player.hand_cards)
-                                    if current_count <= 0:
-                                        # 目标已无手牌，无法夺取
-                                        pass
-                                    else:
-                                        # 如果索引超出当前范围，则使用当前最后一张
-                                        if idx < 0:
-                                            idx = 0
-                                        if idx >= current_count:
-                                            idx = current_count - 1
-                                        stolen = target_player.hand_cards.pop(idx)
-                                        attacker.hand_cards.append(stolen)
-                                # 发送夺牌事件以便前端做动画（从目标玩家到攻击者）
-                                try:
-                                    from backend.utils.event_sender import send_steal_card_event
-                                    send_steal_card_event(stolen, primary_tid, attacker.player_id)
-                                except Exception:
-                                    # 如果事件发送失败，也不阻塞游戏逻辑
-                                    pass
-                                game_logger.log_info(f"{attacker.name} 通过冲阵从 {target_player.name} 获得一张手牌 (index {idx})")
-                        except Exception:
-                            pass
-            except Exception:
-                # 不应阻塞游戏流程
-                pass
-        else:
+        # 从分派表中取出对应的处理器，并传入当前回合上下文
+        handler = self.card_effect_handlers.get(card.name_enum)
+        if handler is None:
             game_logger.log_warning(f"未知的牌类型或牌名: {card.name}")
+            return
+        handler.execute(card, targets, self.current_player_id)
+        
+        # 依次执行已注册的技能钩子（如赵云的“冲阵”）
+        for hook in self.card_effect_hooks:
+            hook.after_effect(card, targets, self.current_player_id)
     
     def _cleanup(self) -> None:
         """善后工作（回收内存等）"""
-        # 预留接口，具体实现待补充
-        pass
+        # 释放操控模块持有的资源（如搜索AI并行搜索的进程池）
+        for player in self.player_controller.players:
+            if hasattr(player.control, 'close'):
+                player.control.close()
@@ -0,0 +1,27 @@
+# 游戏快照模块
+"""紧凑的不可变游戏状态表示，用于快照、回滚和复制对局"""
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.utils.card_table import CARD_FACE_FIELDS, EQUIPMENT_SLOTS, PlayerState, CardTable
+
+
+@dataclass(frozen=True)
+class GameSnapshot:
+    """整局游戏的快照
+
+    只保存不可变的元组和整数，创建后不会被修改，多个快照之间可以安全共享（写时复制）。
+    """
+    current_player_id: Optional[int]
+    game_ended: bool
+    turn_number: int
+    deck: Tuple[int, ...]  # 牌堆（从顶到底）的牌表下标，牌堆顶即下一张要摸的牌
+    discard_pile: Tuple[int, ...]  # 弃牌堆的牌表下标
+    players: Tuple[PlayerState, ...]  # 按座次排列的玩家状态
+    card_faces: Tuple[Tuple[int, Tuple[Any, ...]], ...]  # 与初始牌面不同的牌：(下标, 牌面)
+    controls: Tuple[Any, ...]  # 按座次排列的操控模块私有状态
+    knowledge: Tuple[int, int]  # 公开信息板（跳忠、跳反位掩码）
+    rng_state: Any  # 牌堆随机数状态
@@ -0,0 +1,82 @@
+# 并行对局模块
+"""把多局完整的游戏分片到进程池中并行运行（用于平衡性测试等）
+
+每局仍然逐回合运行同一套规则代码，单局速度不变；吞吐量的提升来自多核并行和关闭对局日志。
+"""
+import contextlib
+import multiprocessing
+import random
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.game_controller.game_controller import GameController
+from backend.utils.event_sender import event_routing
+from backend.utils.logger import game_logger
+from config.enums import GameOutcome
+from config.simple_card_config import SimpleGameConfig
+
+
+class GameResult(NamedTuple):
+    """一局对局的结果（子进程返回给主进程，只包含可序列化的摘要）"""
+    winner: Optional[str]
+    outcome: Optional[GameOutcome]
+    turns: int
+
+
+def _run_game(task: Tuple[SimpleGameConfig, Optional[int], int, bool]) -> GameResult:
+    """运行一局完整的游戏（子进程中执行）
+
+    种子在初始化前设置到全局random（洗牌和规则AI的随机选择都使用它），
+    因此结果只取决于配置和种子，与分片方式和进程数无关。
+    对局结束后恢复全局random原来的状态（processes<=1 时在调用方进程中运行）。
+    """
+    config, seed, max_turns, quiet = task
+    with contextlib.ExitStack() as stack:
+        if seed is not None:
+            stack.callback(random.setstate, random.getstate())
+            random.seed(seed)
+        if quiet:
+            stack.enter_context(game_logger.suppressed())
+            devnull = stack.enter_context(open(os.devnull, "w", encoding="utf-8"))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+        game_controller = GameController(config)
+        game_controller.max_turns = max_turns
+        with event_routing(None):
+            game_controller.initialize()
+        with event_routing(game_controller.player_controller.control_manager):
+            game_controller.start_game()
+    return GameResult(game_controller.player_controller.get_winner(), game_controller.outcome,
+                      game_controller.turn_number)
+
+
+def run_parallel(configs: Sequence[SimpleGameConfig], seeds: Optional[Sequence[Optional[int]]] = None,
+                 processes: Optional[int] = None, max_turns: int = 1000,
+                 chunksize: Optional[int] = None, quiet: bool = True) -> List[GameResult]:
+    """把多局游戏分片到进程池中并行运行
+
+    每个子进程拥有独立的全局状态（事件分发、随机数），逐局运行与 start_game 相同的规则代码。
+
+    Args:
+        configs: 每局的游戏配置
+        seeds: 每局的随机种子（可选，用于复现）
+        processes: 进程数，默认为CPU核数；为1时在当前进程中依次运行
+        max_turns: 每局的最大回合数
+        chunksize: 每次分给子进程的局数，默认按进程数均分为若干片
+        quiet: 是否关闭对局的日志和控制台输出（批量对局时它们占了相当一部分耗时）
+
+    Returns:
+        每局的结果（与 configs 顺序相同）
+    """
+    seeds = list(seeds) if seeds is not None else [None] * len(configs)
+    tasks = [(config, seed, max_turns, quiet) for config, seed in zip(configs, seeds)]
+    processes = processes or multiprocessing.cpu_count()
+    if processes <= 1 or len(tasks) <= 1:
+        return [_run_game(task) for task in tasks]
+    processes = min(processes, len(tasks))
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (processes * 4))
+    with multiprocessing.get_context().Pool(processes) as pool:
+        return pool.map(_run_game, tasks, chunksize)
+
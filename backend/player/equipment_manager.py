@@ -8,6 +8,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from backend.card.card import Card
 from backend.deck.deck import Deck
 from backend.utils.logger import game_logger
+from backend.utils.zobrist import StateHash
 from backend.utils.event_sender import send_discard_card_event, send_equip_change_event
 from config.enums import CardName, EquipmentType
 
@@ -40,6 +41,9 @@ class EquipmentManager:
         "horse_minus": "进攻马",
     }
     
+    # 对局状态哈希（由 Player.attach_state_hash 绑定，装备槽修改时增量更新）
+    _state_hash: Optional[StateHash] = None
+    
     def __init__(self, player_id: int, player_name: str, deck: Deck):
         """初始化装备管理器
         
@@ -76,7 +80,25 @@ class EquipmentManager:
             slot_name: 槽位名称
             card: 装备牌或None（卸下装备）
         """
-        setattr(self, slot_name, card)
+        if self._state_hash is not None:
+            self._toggle_slot(slot_name)
+            setattr(self, slot_name, card)
+            self._toggle_slot(slot_name)
+        else:
+            setattr(self, slot_name, card)
+    
+    def _toggle_slot(self, slot_name: str) -> None:
+        """把装备槽当前的特征异或进/出状态哈希"""
+        card = getattr(self, slot_name, None)
+        if card is not None:
+            self._state_hash.toggle("equip", self.player_id, slot_name, card.name_enum)
+    
+    def attach_state_hash(self, state_hash: Optional[StateHash]) -> None:
+        """绑定对局状态哈希，并把当前装备计入哈希（None表示解除绑定）"""
+        self._state_hash = state_hash
+        if state_hash is not None:
+            for slot_name in ["weapon", "armor", "horse_plus", "horse_minus"]:
+                self._toggle_slot(slot_name)
     
     def get_all_equipment(self) -> List[Card]:
         """获取所有装备
@@ -0,0 +1,191 @@
+# 手牌模块
+import itertools
+from typing import Dict, Iterable, List, Optional
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.card.card import Card
+from backend.utils.zobrist import StateHash, zobrist_key
+from config.enums import CardName
+
+
+# 全局递增的版本号：任何一手牌被修改后都会取得一个新的（所有 HandCards 之间唯一的）版本号
+_versions = itertools.count(1)
+
+
+class HandCards(list):
+    """手牌列表
+
+    仍然是一个按从左往右顺序排列的 list（输出与 AI 选择都依赖该顺序），
+    额外维护一个按牌名分组的索引，使“是否持有某种牌”为 O(1)，
+    按牌名取牌时无需再扫描整手牌。
+
+    索引记录的是牌入手时的牌名：龙胆等技能会在牌仍在手中时临时修改 name_enum，
+    移除时按入手时的牌名从索引中删除，避免索引残留。
+
+    version 在每次修改后更新（全局唯一），可作为依赖手牌的缓存的键。
+
+    绑定对局状态哈希后（attach_state_hash），按索引中的牌名把手牌作为多重集增量更新哈希：
+    某牌名的第k张对应特征 ("hand", 座位, 牌名, k)。
+    """
+
+    _state_hash: Optional[StateHash] = None
+    _seat: Optional[int] = None
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        super().__init__(cards)
+        self._index: Dict[CardName, List[Card]] = {}
+        self._names: Dict[int, CardName] = {}
+        self._rebuild_index()
+
+    # ==================== 索引维护 ====================
+
+    def _rebuild_index(self) -> None:
+        """按当前顺序重建索引"""
+        self.version = next(_versions)
+        self._toggle_all()
+        self._index = {}
+        self._names = {}
+        for card in list.__iter__(self):
+            self._index_add(card)
+
+    def _index_add(self, card: Card) -> None:
+        """将一张牌加入索引（加在同名牌的末尾）"""
+        self.version = next(_versions)
+        name = getattr(card, 'name_enum', None)
+        self._names[id(card)] = name
+        bucket = self._index.setdefault(name, [])
+        bucket.append(card)
+        if self._state_hash is not None:
+            self._state_hash.value ^= zobrist_key("hand", self._seat, name, len(bucket))
+
+    def _index_remove(self, card: Card) -> None:
+        """将一张牌从索引中移除（按入手时记录的牌名）"""
+        self.version = next(_versions)
+        name = self._names.get(id(card), getattr(card, 'name_enum', None))
+        bucket = self._index.get(name)
+        if not bucket:
+            return
+        for i, c in enumerate(bucket):
+            if c is card:
+                if self._state_hash is not None:
+                    self._state_hash.value ^= zobrist_key("hand", self._seat, name, len(bucket))
+                del bucket[i]
+                break
+        if not any(c is card for c in bucket):
+            self._names.pop(id(card), None)
+        if not bucket:
+            del self._index[name]
+
+    def _toggle_all(self) -> None:
+        """把当前手牌的所有特征异或进/出状态哈希"""
+        state_hash = self._state_hash
+        if state_hash is None:
+            return
+        for name, bucket in self._index.items():
+            for k in range(1, len(bucket) + 1):
+                state_hash.toggle("hand", self._seat, name, k)
+
+    def attach_state_hash(self, state_hash: Optional[StateHash], seat: Optional[int] = None) -> None:
+        """绑定（或传None解除绑定）对局状态哈希，并把当前手牌计入（或移出）哈希
+
+        Args:
+            state_hash: 对局状态哈希
+            seat: 手牌所属的座位
+        """
+        self._toggle_all()
+        self._state_hash = state_hash
+        self._seat = seat
+        self._toggle_all()
+
+    # ==================== 查询接口 ====================
+
+    def has_card(self, card_name: CardName) -> bool:
+        """是否持有指定牌名的牌（O(1)）"""
+        return any(card.name_enum == card_name for card in self._index.get(card_name, ()))
+
+    def count_of(self, card_name: CardName) -> int:
+        """持有指定牌名的牌的数量"""
+        return len(self.cards_of(card_name))
+
+    def cards_of(self, card_name: CardName) -> List[Card]:
+        """按从左往右的顺序返回指定牌名的所有牌"""
+        bucket = self._index.get(card_name)
+        if not bucket:
+            return []
+        return [card for card in bucket if card.name_enum == card_name]
+
+    def first_of(self, card_name: CardName) -> Optional[Card]:
+        """返回最左边的一张指定牌名的牌，没有则返回None"""
+        for card in self._index.get(card_name, ()):
+            if card.name_enum == card_name:
+                return card
+        return None
+
+    def __contains__(self, card) -> bool:
+        return id(card) in self._names
+
+    # ==================== list 修改操作（同步索引） ====================
+
+    def append(self, card: Card) -> None:
+        super().append(card)
+        self._index_add(card)
+
+    def extend(self, cards: Iterable[Card]) -> None:
+        for card in cards:
+            self.append(card)
+
+    def __iadd__(self, cards: Iterable[Card]):
+        self.extend(cards)
+        return self
+
+    def insert(self, index: int, card: Card) -> None:
+        super().insert(index, card)
+        self._rebuild_index()
+
+    def remove(self, card: Card) -> None:
+        for i, c in enumerate(list.__iter__(self)):
+            if c is card:
+                super().__delitem__(i)
+                self._index_remove(card)
+                return
+        super().remove(card)
+        self._rebuild_index()
+
+    def pop(self, index: int = -1) -> Card:
+        card = super().pop(index)
+        self._index_remove(card)
+        return card
+
+    def clear(self) -> None:
+        super().clear()
+        self.version = next(_versions)
+        self._toggle_all()
+        self._index = {}
+        self._names = {}
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self._rebuild_index()
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self._rebuild_index()
+
+    def __imul__(self, n: int):
+        super().__imul__(n)
+        self._rebuild_index()
+        return self
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._rebuild_index()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._rebuild_index()
+
+    def __reduce_ex__(self, protocol):
+        # 索引以 id 为键，复制/序列化时按牌列表重建
+        return (self.__class__, (list(self),))
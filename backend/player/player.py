@@ -1,5 +1,6 @@
 # 玩家模块
 from typing import List, Optional, Tuple, Dict, Any
+import copy
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -10,8 +11,11 @@ from config.card_properties import get_card_properties
 from backend.control.control import Control
 from backend.control.control_factory import ControlFactory
 from backend.player.equipment_manager import EquipmentManager
+from backend.player.hand_cards import HandCards
+from backend.utils.card_table import PlayerState, CardTable, EQUIPMENT_SLOTS
 from backend.player.phase_skill_handler import PhaseSkillManager
 from backend.utils.logger import game_logger
+from backend.utils.zobrist import StateHash, zobrist_key
 from backend.utils.event_sender import send_draw_card_event, send_play_card_event, send_hp_change_event, send_discard_card_event, send_equip_change_event, send_death_event
 from config.enums import CardName, CardType, ControlType, PlayerStatus, PlayerIdentity, CharacterName, TargetType, GameEvent, EquipmentType, CardSuit
 
@@ -25,6 +29,9 @@ class Player:
     
     # 武将基础血量上限映射（子类可以覆盖 get_base_max_hp 方法来自定义）
     
+    # 对局状态哈希（GameController 绑定后，血量、存活状态、是否已出杀、手牌和装备的修改都会增量更新哈希）
+    _state_hash: Optional[StateHash] = None
+    
     def get_base_max_hp(self) -> int:
         """获取武将的基础血量上限（子类可以覆盖此方法来自定义）
         
@@ -63,8 +70,8 @@ class Player:
         
         self.deck = deck
         
-        # 手牌
-        self.hand_cards: List[Card] = []
+        # 手牌（按牌名建立索引的有序列表）
+        self.hand_cards = HandCards()
         
         # 装备管理器
         self.equipment_manager = EquipmentManager(player_id, name, deck)
@@ -77,6 +84,13 @@ class Player:
         
         # 回合状态跟踪
         self.sha_used_this_turn = False  # 当前回合是否已使用杀
+        
+        # 可出牌判定缓存：按牌的种类缓存 _can_play_card 的结果，状态键变化时整体失效
+        self._playable_state_key: Optional[tuple] = None
+        self._playable_verdicts: Dict[tuple, bool] = {}
+        # 合法动作缓存（legal_actions）
+        self._legal_actions_key: Optional[tuple] = None
+        self._legal_actions: tuple = ()
         self.player_controller = player_controller  # 玩家控制器引用
         
         # 伤害来源追踪
@@ -92,6 +106,72 @@ class Player:
             GameEvent.EQUIP: None,
         }
     
+    @property
+    def hand_cards(self) -> HandCards:
+        """手牌（从左往右的顺序，附带按牌名的索引）"""
+        return self._hand_cards
+    
+    @hand_cards.setter
+    def hand_cards(self, cards: List[Card]) -> None:
+        # 直接赋值普通列表时转换为 HandCards，保证索引始终有效
+        hand_cards = cards if isinstance(cards, HandCards) else HandCards(cards)
+        if self._state_hash is not None:
+            old_hand_cards = self.__dict__.get('_hand_cards')
+            if old_hand_cards is not None:
+                old_hand_cards.attach_state_hash(None)
+            hand_cards.attach_state_hash(self._state_hash, self.player_id)
+        self._hand_cards = hand_cards
+    
+    # 计入状态哈希的标量状态：赋值时更新哈希
+    @property
+    def current_hp(self) -> int:
+        """当前血量"""
+        return self._current_hp
+    
+    @current_hp.setter
+    def current_hp(self, value: int) -> None:
+        if self._state_hash is not None:
+            self._state_hash.replace(("hp", self.player_id, self._current_hp), ("hp", self.player_id, value))
+        self._current_hp = value
+    
+    @property
+    def status(self) -> PlayerStatus:
+        """存活状态"""
+        return self._status
+    
+    @status.setter
+    def status(self, value: PlayerStatus) -> None:
+        if self._state_hash is not None:
+            self._state_hash.replace(("status", self.player_id, self._status), ("status", self.player_id, value))
+        self._status = value
+    
+    @property
+    def sha_used_this_turn(self) -> bool:
+        """当前回合是否已使用杀"""
+        return self._sha_used_this_turn
+    
+    @sha_used_this_turn.setter
+    def sha_used_this_turn(self, value: bool) -> None:
+        value = bool(value)
+        if self._state_hash is not None and value != self._sha_used_this_turn:
+            self._state_hash.value ^= zobrist_key("sha", self.player_id)
+        self._sha_used_this_turn = value
+    
+    def attach_state_hash(self, state_hash: Optional[StateHash]) -> None:
+        """绑定对局状态哈希，并把当前的血量、存活状态、是否已出杀、手牌和装备计入哈希
+        
+        Args:
+            state_hash: 对局状态哈希（None表示解除绑定，不再更新）
+        """
+        self._state_hash = state_hash
+        if state_hash is not None:
+            state_hash.toggle("hp", self.player_id, self._current_hp)
+            state_hash.toggle("status", self.player_id, self._status)
+            if self._sha_used_this_turn:
+                state_hash.toggle("sha", self.player_id)
+        self._hand_cards.attach_state_hash(state_hash, self.player_id)
+        self.equipment_manager.attach_state_hash(state_hash)
+    
     # 装备属性（只读，向后兼容，从 EquipmentManager 获取）
     # 注意：只能通过 equipment_manager.equip() 来装备，不能直接修改这些属性
     @property
@@ -202,23 +282,12 @@ class Player:
             return None, []
         
         # 让操控模块选择牌（传入available_targets以便检查是否有合法目标）
-        selected_card = self.control.select_card(playable_cards, "", available_targets)
+        selected_card = self._decide("select_card", playable_cards, "", available_targets)
         if selected_card is None:
             return None, []
         
-        # 根据牌的类型和可用目标确定可选目标
-        targets = self._get_targets_for_card(selected_card, available_targets)
-        
-        # 确保目标列表中不包含自己（除了SELF类型的牌）
-        if selected_card.target_type != TargetType.SELF:
-            targets = [t for t in targets if t != self.player_id]
-        
-        # 如果是杀，需要在Control中重新过滤攻击范围内的目标（使用逆时针距离）
-        # 因为player_controller的get_targets使用的是最小距离，而猪国杀应该只使用逆时针距离
-        if selected_card.name_enum == CardName.SHA and selected_card.target_type == TargetType.ATTACKABLE:
-            # 对于杀，让Control重新过滤攻击范围内的目标
-            if hasattr(self.control, 'filter_attackable_targets'):
-                targets = self.control.filter_attackable_targets(targets, available_targets)
+        # 根据牌的类型和可用目标确定可选目标（不含自己，杀按逆时针距离过滤）
+        _, targets = self._get_action_targets(selected_card, available_targets)
         
         # 如果是自己类型的牌，直接使用自己
         if selected_card.target_type == TargetType.SELF:
@@ -229,7 +298,7 @@ class Player:
             # - 决斗：只选择一个目标
             if selected_card.name_enum == CardName.JUE_DOU:
                 # 决斗只选择一个目标
-                selected_targets = self.control.select_targets(targets, selected_card)
+                selected_targets = self._decide("select_targets", targets, selected_card)
                 # 确保只选择一个目标
                 if selected_targets:
                     selected_targets = [selected_targets[0]]
@@ -240,7 +309,7 @@ class Player:
                 selected_targets = targets
         else:
             # 让操控模块选择目标
-            selected_targets = self.control.select_targets(targets, selected_card)
+            selected_targets = self._decide("select_targets", targets, selected_card)
         
         # 从手牌中移除已出的牌
         if selected_card in self.hand_cards:
@@ -303,7 +372,7 @@ class Player:
         
         # 让操控模块选择要弃的牌
         discard_count = len(self.hand_cards) - self.current_hp
-        selected_cards = self.control.select_cards_to_discard(self.hand_cards, discard_count)
+        selected_cards = self._decide("select_cards_to_discard", self.hand_cards, discard_count)
         
         # 确保selected_cards不为None
         if selected_cards is None:
@@ -485,6 +554,22 @@ class Player:
             # 发送血量变化事件到前端
             send_hp_change_event(self.player_id, self.current_hp)
     
+    def _decide(self, decision: str, *args) -> Any:
+        """向操控模块请求决策（经由ControlManager，设置了时间预算时超时改用规则操控）
+        
+        Args:
+            decision: 决策方法名（select_card、select_targets、ask_use_card_response、select_cards_to_discard）
+            *args: 决策参数
+            
+        Returns:
+            决策结果
+        """
+        player_controller = self.player_controller
+        control_manager = getattr(player_controller, 'control_manager', None) if player_controller else None
+        if control_manager is None:
+            return getattr(self.control, decision)(*args)
+        return control_manager.decide(self.control, decision, *args)
+    
     def equip(self, card: Card) -> bool:
         """装备（使用装备管理器）
         
@@ -502,14 +587,45 @@ class Player:
         Args:
             available_targets: 可用目标字典，用于检查是否有合法目标
         """
-        playable_cards = []
+        # 同一出牌阶段内通常只有一张牌离开手牌，其余判定条件不变：
+        # 按牌的种类缓存判定结果，只有状态键（是否已出杀、血量、装备、可选目标等）变化时才重新判定
+        state_key = self._get_playable_state_key(available_targets)
+        if state_key != self._playable_state_key:
+            self._playable_state_key = state_key
+            self._playable_verdicts = {}
+        verdicts = self._playable_verdicts
         
+        playable_cards = []
         for card in self.hand_cards:
-            if self._can_play_card(card, available_targets):
+            kind = (card.name_enum, card.card_type, card.target_type)
+            verdict = verdicts.get(kind)
+            if verdict is None:
+                verdict = verdicts[kind] = self._can_play_card(card, available_targets)
+            if verdict:
                 playable_cards.append(card)
         
         return playable_cards
     
+    def _get_playable_state_key(self, available_targets: Dict[str, List[int]] = None) -> tuple:
+        """可出牌判定所依赖的状态（子类的 _can_play_card 依赖额外状态时应覆盖并扩展）
+        
+        Args:
+            available_targets: 可用目标字典
+            
+        Returns:
+            可比较的状态元组
+        """
+        targets_key = None
+        if available_targets is not None:
+            targets_key = tuple((key, tuple(value)) for key, value in available_targets.items())
+        return (
+            self.sha_used_this_turn,
+            self.current_hp,
+            self.max_hp,
+            self.weapon.name_enum if self.weapon else None,
+            targets_key,
+        )
+    
     def _can_play_card(self, card: Card, available_targets: Dict[str, List[int]] = None) -> bool:
         """判断是否可以出指定牌
         
@@ -576,6 +692,76 @@ class Player:
         
         return True
     
+    def _get_action_targets(self, card: Card, available_targets: Dict[str, List[int]] = None) -> Tuple[CardName, List[int]]:
+        """获取出牌阶段使用这张牌时实际可选的目标（子类的转化技能应覆盖）
+        
+        Args:
+            card: 要出的牌
+            available_targets: 可用目标字典
+            
+        Returns:
+            (视作使用的牌名, 可选目标列表)
+        """
+        targets = self._get_targets_for_card(card, available_targets)
+        
+        # 确保目标列表中不包含自己（除了SELF类型的牌）
+        if card.target_type != TargetType.SELF:
+            targets = [t for t in targets if t != self.player_id]
+        
+        # 如果是杀，需要在Control中重新过滤攻击范围内的目标（使用逆时针距离）
+        # 因为player_controller的get_targets使用的是最小距离，而猪国杀应该只使用逆时针距离
+        if card.name_enum == CardName.SHA and card.target_type == TargetType.ATTACKABLE:
+            if hasattr(self.control, 'filter_attackable_targets'):
+                targets = self.control.filter_attackable_targets(targets, available_targets)
+        return card.name_enum, targets
+    
+    def legal_actions(self, available_targets: Dict[str, List[int]] = None) -> Tuple[Tuple[int, CardName, Tuple[int, ...]], ...]:
+        """枚举出牌阶段的所有合法动作（供搜索、模拟使用）
+        
+        每个动作为 (手牌下标, 视作使用的牌名, 目标元组)：
+        - SELF 类型的牌目标为自己，南蛮入侵、万箭齐发为全部目标（各一个动作）
+        - 其余牌（含决斗、龙胆转化的杀）每个可选目标一个动作
+        不出牌（结束出牌阶段）总是合法的，不在列表中。
+        
+        结果按手牌版本和可出牌判定状态缓存，状态未变化时直接返回上次的结果。
+        
+        Args:
+            available_targets: 可用目标字典（PlayerController.get_targets 的结果）
+            
+        Returns:
+            动作元组
+        """
+        cache_key = (self.hand_cards.version, self._get_playable_state_key(available_targets))
+        if cache_key == self._legal_actions_key:
+            return self._legal_actions
+        
+        playable = {id(card) for card in self._get_playable_cards(available_targets)}
+        # 同种牌的目标相同，按牌的种类只计算一次
+        options_by_kind: Dict[tuple, List[Tuple[CardName, Tuple[int, ...]]]] = {}
+        actions = []
+        for index, card in enumerate(self.hand_cards):
+            if id(card) not in playable:
+                continue
+            kind = (card.name_enum, card.card_type, card.target_type)
+            options = options_by_kind.get(kind)
+            if options is None:
+                options = options_by_kind[kind] = self._get_action_options(card, available_targets)
+            for as_card_name, targets in options:
+                actions.append((index, as_card_name, targets))
+        
+        self._legal_actions_key = cache_key
+        self._legal_actions = tuple(actions)
+        return self._legal_actions
+    
+    def _get_action_options(self, card: Card, available_targets: Dict[str, List[int]] = None) -> List[Tuple[CardName, Tuple[int, ...]]]:
+        """一张可出的牌的所有 (视作使用的牌名, 目标元组) 组合（与 play_card_default 的目标规则一致）"""
+        as_card_name, targets = self._get_action_targets(card, available_targets)
+        if card.target_type == TargetType.SELF and as_card_name == card.name_enum:
+            return [(as_card_name, (self.player_id,))]
+        if card.target_type == TargetType.ALL and as_card_name != CardName.JUE_DOU:
+            return [(as_card_name, tuple(targets))]
+        return [(as_card_name, (target,)) for target in targets]
+    
     def _get_targets_for_card(self, card: Card, available_targets: Dict[str, List[int]] = None) -> List[int]:
         """获取牌的目标列表
         
@@ -617,14 +803,15 @@ class Player:
         Returns:
             选择的牌或None（不使用）
         """
-        # 查找手牌中是否有指定牌名的牌（使用枚举匹配，保持从左往右的顺序）
-        available_cards = [card for card in self.hand_cards if card.name_enum == card_name]
-        
-        if not available_cards:
+        # 通过手牌索引判断是否持有指定牌名的牌（O(1)，没有时无需询问操控模块）
+        if not self.hand_cards.has_card(card_name):
             return None
         
+        # 查找手牌中指定牌名的牌（使用枚举匹配，保持从左往右的顺序）
+        available_cards = self.hand_cards.cards_of(card_name)
+        
         # 使用专门的响应类查询方法（与正常出牌分开）
-        selected_card = self.control.ask_use_card_response(card_name, available_cards, context)
+        selected_card = self._decide("ask_use_card_response", card_name, available_cards, context)
         
         if selected_card is not None:
             # 如果选择了使用牌，从手牌中移除
@@ -677,6 +864,14 @@ class Player:
         """
         return self.ask_use_card(CardName.WU_XIE_KE_JI, context)
     
+    def can_use_wu_xie_ke_ji(self) -> bool:
+        """是否可能响应无懈可击（用于跳过不可能响应的玩家，不询问操控模块）
+        
+        Returns:
+            手牌中是否有无懈可击（子类可覆盖以考虑转化技能）
+        """
+        return self.hand_cards.has_card(CardName.WU_XIE_KE_JI)
+    
     def reset_turn_state(self) -> None:
         """重置回合状态"""
         self.sha_used_this_turn = False
@@ -690,6 +885,84 @@ class Player:
                 return False
         return False
 
+    # 快照中保存的标量属性（不可变值，直接保存）
+    SNAPSHOT_FIELDS: Tuple[str, ...] = (
+        "status", "current_hp", "max_hp", "identity", "character_name",
+        "sha_used_this_turn", "last_damage_source",
+    )
+
+    def capture_state(self, card_table: CardTable) -> PlayerState:
+        """获取玩家状态快照
+
+        Args:
+            card_table: 牌表（牌以下标保存）
+
+        Returns:
+            玩家状态
+        """
+        equipment_manager = self.equipment_manager
+        return PlayerState(
+            scalars=tuple(getattr(self, field) for field in self.SNAPSHOT_FIELDS),
+            hand=card_table.indices(self._hand_cards),
+            equipment=tuple(card_table.index_of(getattr(equipment_manager, slot)) for slot in EQUIPMENT_SLOTS),
+            extra=self._capture_extra_state(card_table),
+        )
+
+    def apply_state(self, state: PlayerState, card_table: CardTable) -> None:
+        """从快照恢复玩家状态
+
+        Args:
+            state: 玩家状态
+            card_table: 牌表
+        """
+        for field, value in zip(self.SNAPSHOT_FIELDS, state.scalars):
+            setattr(self, field, value)
+        self.hand_cards = HandCards(card_table.cards_at(state.hand))
+        equipment_manager = self.equipment_manager
+        for slot, index in zip(EQUIPMENT_SLOTS, state.equipment):
+            equipment_manager.set_slot(slot, card_table.card_at(index))
+        self._apply_extra_state(state.extra, card_table)
+        self._playable_state_key = None
+        self._playable_verdicts = {}
+        self._legal_actions_key = None
+
+    def _capture_extra_state(self, card_table: CardTable) -> tuple:
+        """获取武将技能的额外状态（子类覆盖）"""
+        return ()
+
+    def _apply_extra_state(self, extra: tuple, card_table: CardTable) -> None:
+        """恢复武将技能的额外状态（子类覆盖）"""
+        pass
+
+    def clone_shell(self, deck: Deck, player_controller, control: Control) -> 'Player':
+        """复制玩家对象，但不复制手牌、装备等对局状态（由 apply_state 填入）
+
+        不重新执行 __init__，因此不会摸牌、不会打印日志，也不会向前端发送事件。
+
+        Args:
+            deck: 新对局的牌堆
+            player_controller: 新对局的玩家控制器
+            control: 新对局的操控模块
+
+        Returns:
+            新的玩家对象
+        """
+        player = copy.copy(self)
+        player.deck = deck
+        player.player_controller = player_controller
+        player.control = control
+        player._state_hash = None
+        player.equipment_manager = copy.copy(self.equipment_manager)
+        player.equipment_manager.deck = deck
+        player.equipment_manager._state_hash = None
+        player.skill_activate_time_with_skill = dict(self.skill_activate_time_with_skill)
+        player._hand_cards = HandCards()
+        player._playable_state_key = None
+        player._playable_verdicts = {}
+        player._legal_actions_key = None
+        player._legal_actions = ()
+        return player
+
 
 class ZhangFeiPlayer(Player):
     """张飞武将：出的杀不限次数，技能咆哮"""
@@ -906,6 +1179,14 @@ class ZhaoyunPlayer(Player):
             return CardName.WU_XIE_KE_JI
         return None
 
+    def can_use_wu_xie_ke_ji(self) -> bool:
+        """是否可能响应无懈可击（考虑龙魂：黑桃当无懈可击）"""
+        if super().can_use_wu_xie_ke_ji():
+            return True
+        if self.longhun_evolved and self.is_skill_unlocked("龙胆"):
+            return any(card.suit == CardSuit.SPADES for card in self.hand_cards)
+        return False
+
     def _apply_longhun_effect(self, cards_used: List[Card]) -> None:
         """应用龙魂使用两张卡牌的额外效果
         
@@ -1006,7 +1287,7 @@ class ZhaoyunPlayer(Player):
 
         # 让操控模块选择要弃的牌
         discard_count = len(self.hand_cards) - hand_limit
-        selected_cards = self.control.select_cards_to_discard(self.hand_cards, discard_count)
+        selected_cards = self._decide("select_cards_to_discard", self.hand_cards, discard_count)
 
         # 确保selected_cards不为None
         if selected_cards is None:
@@ -1067,6 +1348,21 @@ class ZhaoyunPlayer(Player):
         self.longdan_cards_used_this_turn = []
         self.chongzhen_triggered_this_turn = False
 
+    def _capture_extra_state(self, card_table: CardTable) -> tuple:
+        """获取赵云技能状态（技能解锁、龙魂进化、本回合龙胆/冲阵记录）"""
+        return (
+            tuple(self.skill_unlock_status.items()),
+            self.longhun_evolved,
+            card_table.indices(self.longdan_cards_used_this_turn),
+            self.chongzhen_triggered_this_turn,
+        )
+
+    def _apply_extra_state(self, extra: tuple, card_table: CardTable) -> None:
+        """恢复赵云技能状态"""
+        unlock_status, self.longhun_evolved, longdan_cards, self.chongzhen_triggered_this_turn = extra
+        self.skill_unlock_status = dict(unlock_status)
+        self.longdan_cards_used_this_turn = card_table.cards_at(longdan_cards)
+
     def ask_use_card(self, card_name: CardName, context: str = "") -> Optional[Card]:
         """询问玩家是否使用指定牌（考虑龙胆转化）
         
@@ -1080,7 +1376,7 @@ class ZhaoyunPlayer(Player):
             选择的牌或None（不使用）
         """
         # 查找手牌中是否有指定牌名的牌
-        available_cards = [card for card in self.hand_cards if card.name_enum == card_name]
+        available_cards = self.hand_cards.cards_of(card_name)
         
         # 记录是否使用龙胆转化
         is_longdan_conversion = False
@@ -1091,13 +1387,13 @@ class ZhaoyunPlayer(Player):
             if card_name == CardName.SHAN:
                 # 如果要求闪，但没有闪，可以用杀代替（龙胆）
                 if not available_cards:
-                    available_cards = [card for card in self.hand_cards if card.name_enum == CardName.SHA]
+                    available_cards = self.hand_cards.cards_of(CardName.SHA)
                     is_longdan_conversion = True
                     original_card_name = CardName.SHA  # 原始牌是杀
             elif card_name == CardName.SHA:
                 # 如果要求杀，但没有杀，可以用闪代替（龙胆）
                 if not available_cards:
-                    available_cards = [card for card in self.hand_cards if card.name_enum == CardName.SHAN]
+                    available_cards = self.hand_cards.cards_of(CardName.SHAN)
                     is_longdan_conversion = True
                     original_card_name = CardName.SHAN  # 原始牌是闪
         
@@ -1105,7 +1401,7 @@ class ZhaoyunPlayer(Player):
             return None
         
         # 使用专门的响应类查询方法
-        selected_card = self.control.ask_use_card_response(card_name, available_cards, context)
+        selected_card = self._decide("ask_use_card_response", card_name, available_cards, context)
         
         if selected_card is not None:
             # 如果选择了使用牌，从手牌中移除
@@ -1135,7 +1431,7 @@ class ZhaoyunPlayer(Player):
             return None, []
         
         # 让操控模块选择牌
-        selected_card = self.control.select_card(playable_cards, "", available_targets)
+        selected_card = self._decide("select_card", playable_cards, "", available_targets)
         if selected_card is None:
             return None, []
         
@@ -1184,7 +1480,7 @@ class ZhaoyunPlayer(Player):
             selected_targets = [self.player_id]
         elif selected_card.target_type == TargetType.ALL:
             if selected_card.name_enum == CardName.JUE_DOU:
-                selected_targets = self.control.select_targets(targets, selected_card)
+                selected_targets = self._decide("select_targets", targets, selected_card)
                 if selected_targets:
                     selected_targets = [selected_targets[0]]
                 else:
@@ -1193,7 +1489,7 @@ class ZhaoyunPlayer(Player):
                 selected_targets = targets
         else:
             # 对于龙胆转化的闪，也需要选择目标
-            selected_targets = self.control.select_targets(targets, selected_card)
+            selected_targets = self._decide("select_targets", targets, selected_card)
         
         # 从手牌中移除已出的牌
         if selected_card in self.hand_cards:
@@ -1258,6 +1554,19 @@ class ZhaoyunPlayer(Player):
         # 其他情况使用基类逻辑
         return super()._can_play_card(card, available_targets)
     
+    def _get_playable_state_key(self, available_targets: Dict[str, List[int]] = None) -> tuple:
+        """可出牌判定状态（龙胆是否解锁会影响闪能否当杀使用）"""
+        return super()._get_playable_state_key(available_targets) + (self.is_skill_unlocked("龙胆"),)
+
+    def _get_action_targets(self, card: Card, available_targets: Dict[str, List[int]] = None) -> Tuple[CardName, List[int]]:
+        """出牌阶段的目标（龙胆：闪当作杀，使用杀的目标逻辑）"""
+        if card.name_enum == CardName.SHAN and self.is_skill_unlocked("龙胆"):
+            targets = [t for t in self._get_targets_for_card_with_longdan(card, available_targets) if t != self.player_id]
+            if hasattr(self.control, 'filter_attackable_targets'):
+                targets = self.control.filter_attackable_targets(targets, available_targets)
+            return CardName.SHA, targets
+        return super()._get_action_targets(card, available_targets)
+
     def _get_targets_for_card_with_longdan(self, card: Card, available_targets: Dict[str, List[int]] = None) -> List[int]:
         """获取龙胆转化后的目标（闪当作杀时）"""
         if card.name_enum != CardName.SHAN or not self.is_skill_unlocked("龙胆"):
@@ -1284,15 +1593,14 @@ class ZhaoyunPlayer(Player):
             return super().ask_use_shan(context)
         
         # 龙胆已解锁，可以选择闪或杀
+        if not (self.hand_cards.has_card(CardName.SHAN) or self.hand_cards.has_card(CardName.SHA)):
+            return None
         available_cards = [card for card in self.hand_cards 
                           if card.name_enum in [CardName.SHAN, CardName.SHA]]
         
-        if not available_cards:
-            return None
-        
         # 使用专门的响应类查询方法
         # 这里我们用SHAN作为主要请求类型，但可用卡牌包含闪和杀
-        selected_card = self.control.ask_use_card_response(CardName.SHAN, available_cards, context)
+        selected_card = self._decide("ask_use_card_response", CardName.SHAN, available_cards, context)
         
         if selected_card is not None:
             # 如果选择了使用牌，从手牌中移除
@@ -1322,15 +1630,14 @@ class ZhaoyunPlayer(Player):
             return super().ask_use_sha(context)
         
         # 龙胆已解锁，可以选择杀或闪
+        if not (self.hand_cards.has_card(CardName.SHA) or self.hand_cards.has_card(CardName.SHAN)):
+            return None
         available_cards = [card for card in self.hand_cards 
                           if card.name_enum in [CardName.SHA, CardName.SHAN]]
         
-        if not available_cards:
-            return None
-        
         # 使用专门的响应类查询方法
         # 这里我们用SHA作为主要请求类型，但可用卡牌包含杀和闪
-        selected_card = self.control.ask_use_card_response(CardName.SHA, available_cards, context)
+        selected_card = self._decide("ask_use_card_response", CardName.SHA, available_cards, context)
         
         if selected_card is not None:
             # 如果选择了使用牌，从手牌中移除
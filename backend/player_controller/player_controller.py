@@ -9,6 +9,7 @@ from backend.deck.deck import Deck
 from backend.utils.logger import game_logger
 from backend.player_controller.player_factory import PlayerFactory
 from backend.control.control_manager import ControlManager
+from backend.control.control_factory import ControlFactory
 from backend.utils.event_sender import set_control_manager
 from config.enums import GameEvent, ControlType, PlayerIdentity, CharacterName, TargetType
 
@@ -31,6 +32,10 @@ class PlayerController:
         self.players: List[Player] = []
         self._initialize_players()
         
+        # 目标列表缓存：座次、存活状态和马/武器不变时，出牌阶段内重复的 get_targets 直接复用
+        self._targets_cache_key: Optional[tuple] = None
+        self._targets_cache: Dict[str, List[int]] = {}
+        
         # 创建ControlManager并注册到event_sender
         self.control_manager = ControlManager(self)
         set_control_manager(self.control_manager)
@@ -38,6 +43,31 @@ class PlayerController:
         # 初始化时同步一次状态
         self.control_manager.sync_game_state()
     
+    def clone_shell(self, deck: Deck, control_type: Optional[ControlType] = None) -> 'PlayerController':
+        """复制玩家控制器（用于复制对局）
+        
+        玩家和操控模块都是新的对象，手牌、装备等对局状态由快照恢复时填入。
+        新的ControlManager不会注册到event_sender，不影响当前对局的事件分发。
+        
+        Args:
+            deck: 新对局的牌堆
+            control_type: 统一指定新对局的操控类型（可选，默认与原对局同类，玩家操控替换为规则操控）
+            
+        Returns:
+            新的玩家控制器
+        """
+        player_controller = PlayerController.__new__(PlayerController)
+        player_controller.config = self.config
+        player_controller.deck = deck
+        player_controller.players = [
+            player.clone_shell(deck, player_controller, ControlFactory.create_control_like(player.control, control_type))
+            for player in self.players
+        ]
+        player_controller._targets_cache_key = None
+        player_controller._targets_cache = {}
+        player_controller.control_manager = ControlManager(player_controller)
+        return player_controller
+    
     def _initialize_players(self) -> None:
         """根据配置信息生成玩家列表"""
         game_logger.log_info("开始初始化玩家...")
@@ -54,6 +84,10 @@ class PlayerController:
                 identity=player_config.identity,
                 player_controller=self
             )
+            if player_config.control_params:
+                # 带参数的操控模块（如可调的搜索AI）
+                player.control = ControlFactory.create_control(player_config.control_type, player_id,
+                                                               player_config.control_params)
             game_logger.log_info(
                 f"创建玩家 {player_id}: {player_config.name} "
                 f"(身份: {player_config.identity.value}, "
@@ -142,6 +176,30 @@ class PlayerController:
         next_index = (current_index + 1) % len(alive_players)
         return alive_players[next_index].player_id
     
+    def get_wu_xie_holders(self, start_player_id: int) -> List[Player]:
+        """获取可能响应无懈可击的存活玩家
+        
+        从指定玩家开始按顺时针（座次）顺序排列，只包含手牌中有无懈可击
+        （或可通过技能转化为无懈可击）的玩家，无人持有时返回空列表。
+        
+        Args:
+            start_player_id: 开始询问的玩家ID（使用锦囊或使用无懈的玩家）
+            
+        Returns:
+            按询问顺序排列的玩家列表；如果开始玩家不在存活玩家中，返回空列表
+        """
+        alive_players = [p for p in self.players if p.is_alive()]
+        start_index = -1
+        for i, player in enumerate(alive_players):
+            if player.player_id == start_player_id:
+                start_index = i
+                break
+        if start_index == -1:
+            return []
+        
+        ordered = alive_players[start_index:] + alive_players[:start_index]
+        return [p for p in ordered if p.can_use_wu_xie_ke_ji()]
+    
     def game_over(self) -> bool:
         """判断游戏是否结束
         
@@ -245,6 +303,24 @@ class PlayerController:
         
         return "平局"
     
+    def get_winning_identities(self) -> Tuple[PlayerIdentity, ...]:
+        """获取胜利方的身份（与 get_winner 的判定相同）
+        
+        Returns:
+            胜利方身份元组；游戏未结束或平局时为空
+        """
+        if not self.game_over():
+            return ()
+        alive_players = [p for p in self.players if p.is_alive()]
+        if len(alive_players) == 1 and alive_players[0].identity == PlayerIdentity.TRAITOR:
+            return (PlayerIdentity.TRAITOR,)
+        lord = self.get_lord()
+        if lord and not lord.is_alive():
+            return (PlayerIdentity.REBEL,)
+        if lord and not any(p.is_alive() and p.identity in (PlayerIdentity.REBEL, PlayerIdentity.TRAITOR) for p in self.players):
+            return (PlayerIdentity.LORD, PlayerIdentity.LOYALIST)
+        return ()
+    
     def get_initial_player(self) -> int:
         """获取初始玩家ID
         
@@ -332,6 +408,41 @@ class PlayerController:
     def get_targets(self, player_id: int) -> Dict[str, List[int]]:
         """获取目标列表
         
+        Args:
+            player_id: 玩家ID
+            
+        Returns:
+            目标字典，包含attackable、all、dis1等键
+        """
+        # 距离只取决于座次、存活状态和马，攻击距离只取决于武器
+        cache_key = (
+            player_id,
+            self.get_attack_range(player_id),
+            tuple((p.player_id, p.is_alive(), bool(p.horse_plus), bool(p.horse_minus)) for p in self.players),
+        )
+        if cache_key != self._targets_cache_key:
+            self._targets_cache_key = cache_key
+            self._targets_cache = self._compute_targets(player_id)
+        # 返回副本，避免调用方修改缓存
+        return {key: list(value) for key, value in self._targets_cache.items()}
+    
+    def legal_actions(self, player_id: int) -> tuple:
+        """获取玩家出牌阶段的所有合法动作
+        
+        Args:
+            player_id: 玩家ID
+            
+        Returns:
+            (手牌下标, 视作使用的牌名, 目标元组) 组成的元组，见 Player.legal_actions
+        """
+        player = self.get_player(player_id)
+        if player is None or not player.is_alive():
+            return ()
+        return player.legal_actions(self.get_targets(player_id))
+    
+    def _compute_targets(self, player_id: int) -> Dict[str, List[int]]:
+        """计算目标列表（get_targets 的实际计算）
+        
         Args:
             player_id: 玩家ID
             
@@ -0,0 +1,109 @@
+# 牌表模块
+"""对局中牌的下标表和座位状态，供玩家层和游戏控制层的快照共用"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from backend.card.card import Card
+
+
+# 牌面中可能在对局中被修改的属性（龙胆转化会临时改写牌名等）
+CARD_FACE_FIELDS: Tuple[str, ...] = ("name_enum", "name", "card_type", "target_type", "regarded_as", "converted_from")
+
+# 装备槽位顺序
+EQUIPMENT_SLOTS: Tuple[str, ...] = ("weapon", "armor", "horse_plus", "horse_minus")
+
+
+@dataclass(frozen=True)
+class PlayerState:
+    """单个座位的状态（全部为不可变值，牌以牌表下标表示）"""
+    scalars: Tuple[Any, ...]  # Player.SNAPSHOT_FIELDS 对应的值
+    hand: Tuple[int, ...]  # 手牌（从左往右）的牌表下标
+    equipment: Tuple[int, ...]  # 武器、防具、+1马、-1马的牌表下标，-1表示空
+    extra: Tuple[Any, ...] = ()  # 子类（武将技能）额外状态
+
+
+class CardTable:
+    """牌表：为对局中出现过的每张牌分配固定下标
+
+    快照中的牌都以下标表示，因此复制对局时只需要按下标换成新的牌对象。
+    同时记录每张牌登记时的牌面，用于只保存被修改过的牌面。
+    """
+
+    def __init__(self):
+        self.cards: List[Card] = []
+        self.pristine_faces: List[Tuple[Any, ...]] = []
+        self._index: Dict[int, int] = {}
+
+    @staticmethod
+    def face_of(card: Card) -> Tuple[Any, ...]:
+        """获取牌面（可变属性）"""
+        return tuple(getattr(card, field, None) for field in CARD_FACE_FIELDS)
+
+    @staticmethod
+    def set_face(card: Card, face: Tuple[Any, ...]) -> None:
+        """设置牌面（可变属性）"""
+        for field, value in zip(CARD_FACE_FIELDS, face):
+            setattr(card, field, value)
+
+    def register(self, card: Card) -> int:
+        """登记一张牌并返回其下标（已登记的直接返回）"""
+        index = self._index.get(id(card))
+        if index is None:
+            index = len(self.cards)
+            self._index[id(card)] = index
+            self.cards.append(card)
+            self.pristine_faces.append(self.face_of(card))
+        return index
+
+    def index_of(self, card: Optional[Card]) -> int:
+        """获取牌的下标，None 返回 -1"""
+        if card is None:
+            return -1
+        index = self._index.get(id(card))
+        return index if index is not None else self.register(card)
+
+    def indices(self, cards) -> Tuple[int, ...]:
+        """将一组牌转换为下标元组"""
+        index = self._index
+        result = []
+        for card in cards:
+            i = index.get(id(card))
+            result.append(i if i is not None else self.register(card))
+        return tuple(result)
+
+    def card_at(self, index: int) -> Optional[Card]:
+        """按下标获取牌，-1 返回 None"""
+        return self.cards[index] if index >= 0 else None
+
+    def cards_at(self, indices: Tuple[int, ...]) -> List[Card]:
+        """按下标元组获取牌列表"""
+        cards = self.cards
+        return [cards[i] for i in indices]
+
+    def changed_faces(self) -> Tuple[Tuple[int, Tuple[Any, ...]], ...]:
+        """与登记时不同的牌面"""
+        changed = []
+        pristine = self.pristine_faces
+        for i, card in enumerate(self.cards):
+            face = pristine[i]
+            if card.name_enum is not face[0] or getattr(card, "converted_from", None) is not None or card.regarded_as != face[4]:
+                changed.append((i, self.face_of(card)))
+        return tuple(changed)
+
+    def apply_faces(self, faces: Tuple[Tuple[int, Tuple[Any, ...]], ...]) -> None:
+        """恢复牌面：先把被修改过的牌还原为初始牌面，再应用快照中的牌面"""
+        for i, _ in self.changed_faces():
+            self.set_face(self.cards[i], self.pristine_faces[i])
+        for i, face in faces:
+            self.set_face(self.cards[i], face)
+
+    def copy(self) -> 'CardTable':
+        """复制牌表（每张牌都复制为新的对象）"""
+        table = CardTable()
+        table.cards = [card.copy() for card in self.cards]
+        table.pristine_faces = list(self.pristine_faces)
+        table._index = {id(card): i for i, card in enumerate(table.cards)}
+        return table
@@ -2,11 +2,13 @@
 """后端向前端发送事件的工具函数"""
 import sys
 import os
+import threading
+from contextlib import contextmanager
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from backend.card.card import Card
 from communicator.communicator import communicator
-from communicator.comm_event import DrawCardEvent, PlayCardEvent, HPChangeEvent, DiscardCardEvent, EquipChangeEvent, DeathEvent, GameOverEvent
+from communicator.comm_event import DrawCardEvent, PlayCardEvent, HPChangeEvent, DiscardCardEvent, EquipChangeEvent, DeathEvent, GameOverEvent, KeyframeEvent
 from config.simple_card_config import SimpleCardConfig
 from config.enums import CardName, EquipmentType
 
@@ -17,6 +19,15 @@ _wait_for_ack: bool = False
 # 全局ControlManager引用（由PlayerController设置）
 _control_manager = None
 
+# 是否向前端发送事件（模拟对局时关闭，事件只分发给ControlManager）
+_frontend_enabled: bool = True
+
+# event_routing 的临时分发目标按线程保存，不同线程中的模拟对局互不影响
+_routing = threading.local()
+
+# 全局事件日志（EventJournal），为None时不记录
+_journal = None
+
 
 def set_wait_for_ack(wait_for_ack: bool) -> None:
     """设置全局的 wait_for_ack 配置
@@ -53,7 +64,103 @@ def get_control_manager():
     Returns:
         ControlManager实例或None
     """
-    return _control_manager
+    override = getattr(_routing, "override", None)
+    return override[0] if override else _control_manager
+
+
+def set_event_journal(journal) -> None:
+    """设置全局的事件日志（记录主对局发往前端的每个事件，None表示不记录）
+    
+    Args:
+        journal: EventJournal实例或None
+    """
+    global _journal
+    _journal = journal
+
+
+def get_event_journal():
+    """当前的事件日志（event_routing 隔离的模拟对局中为其指定的日志，默认不记录）
+    
+    Returns:
+        EventJournal实例或None
+    """
+    override = getattr(_routing, "override", None)
+    return override[2] if override else _journal
+
+
+def is_frontend_enabled() -> bool:
+    """当前是否向前端发送事件（在 event_routing 隔离的模拟对局中为False）
+    
+    Returns:
+        是否发送到前端
+    """
+    override = getattr(_routing, "override", None)
+    return override[1] if override else _frontend_enabled
+
+
+@contextmanager
+def event_routing(control_manager, send_to_frontend: bool = False, journal=None):
+    """临时切换事件分发目标（用于在同一进程中推进多局游戏）
+    
+    with 块内发送的事件只通知给指定的ControlManager，默认不发送到前端，
+    退出时恢复原来的ControlManager和前端发送设置。切换只对当前线程生效。
+    
+    Args:
+        control_manager: 本次要通知的ControlManager实例
+        send_to_frontend: 是否仍然发送到前端
+        journal: 记录本局事件的事件日志（默认不记录）
+    """
+    previous = getattr(_routing, "override", None)
+    _routing.override = (control_manager, is_frontend_enabled() and send_to_frontend, journal)
+    try:
+        yield control_manager
+    finally:
+        _routing.override = previous
+
+
+def _send_to_frontend(event, wait_for_ack: bool) -> tuple:
+    """发送事件到前端（前端发送已关闭时直接返回），并写入事件日志"""
+    journal = get_event_journal()
+    if journal is not None:
+        journal.append(event)
+    if not is_frontend_enabled():
+        return None, None
+    return communicator.send_to_frontend(event, wait_for_ack=wait_for_ack)
+
+
+def send_turn_start(turn_number: int, players: list) -> None:
+    """通知事件日志新回合开始，需要时记录关键帧（不发送到前端）
+    
+    Args:
+        turn_number: 回合数
+        players: 所有玩家
+    """
+    journal = get_event_journal()
+    if journal is not None:
+        journal.begin_turn(turn_number, lambda: build_keyframe(turn_number, players))
+
+
+def build_keyframe(turn_number: int, players: list) -> KeyframeEvent:
+    """生成前端回放所需的局面关键帧（血量、手牌、装备、是否死亡）
+    
+    Args:
+        turn_number: 回合数
+        players: 所有玩家
+        
+    Returns:
+        KeyframeEvent
+    """
+    states = []
+    for player in players:
+        states.append({
+            "player_id": player.player_id,
+            "hp": player.current_hp,
+            "hand": [card_to_simple_config(card) for card in player.hand_cards],
+            "equipment": {_get_equipment_type(card.name_enum): card.name_enum
+                          for card in player.equipment_manager.get_all_equipment()},
+            "dead": not player.is_alive(),
+        })
+    return KeyframeEvent(turn_number, states)
 
 
 def card_to_simple_config(card: Card) -> SimpleCardConfig:
@@ -87,11 +194,12 @@ def send_draw_card_event(card: Card, to_player_id: int) -> tuple:
         if communicator:
             card_config = card_to_simple_config(card)
             event = DrawCardEvent(card_config, to_player_id)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
+            result = _send_to_frontend(event, _wait_for_ack)
         
         # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
+        control_manager = get_control_manager()
+        if control_manager and event:
+            control_manager.notify_event(event)
         
         if communicator and event:
             return result if _wait_for_ack else (None, None)
@@ -120,11 +228,12 @@ def send_steal_card_event(card: Card, from_player_id: int, to_player_id: int) ->
             event = None
             from communicator.comm_event import StealCardEvent
             event = StealCardEvent(card_config, from_player_id, to_player_id)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
+            result = _send_to_frontend(event, _wait_for_ack)
 
         # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
+        control_manager = get_control_manager()
+        if control_manager and event:
+            control_manager.notify_event(event)
 
         if communicator and event:
             return result if _wait_for_ack else (None, None)
@@ -182,13 +291,14 @@ def send_play_card_event(card: Card, from_player_id: int, to_player_ids: list,
                     is_effective=is_effective
                 )
                 events.append(event)
-                result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack and i == len(to_player_ids) - 1)
+                result = _send_to_frontend(event, _wait_for_ack and i == len(to_player_ids) - 1)
                 if _wait_for_ack and i == len(to_player_ids) - 1:
                     success, message = result
 
             # 通知ControlManager（只通知一次，因为所有Control都能看到）
-            if _control_manager and events:
-                _control_manager.notify_event(events[0])
+            control_manager = get_control_manager()
+            if control_manager and events:
+                control_manager.notify_event(events[0])
 
             if _wait_for_ack:
                 return success, message
@@ -223,11 +333,12 @@ def send_hp_change_event(player_id: int, new_hp: int, source_player_id: int = No
                 damage_type=damage_type,
                 original_card_name=original_card_name
             )
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
+            result = _send_to_frontend(event, _wait_for_ack)
         
         # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
+        control_manager = get_control_manager()
+        if control_manager and event:
+            control_manager.notify_event(event)
         
         if communicator and event:
             return result if _wait_for_ack else (None, None)
@@ -254,11 +365,12 @@ def send_discard_card_event(card: Card, player_id: int) -> tuple:
         if communicator:
             card_config = card_to_simple_config(card)
             event = DiscardCardEvent(card_config, player_id)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
+            result = _send_to_frontend(event, _wait_for_ack)
         
         # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
+        control_manager = get_control_manager()
+        if control_manager and event:
+            control_manager.notify_event(event)
         
         if communicator and event:
             return result if _wait_for_ack else (None, None)
@@ -307,11 +419,12 @@ def send_equip_change_event(player_id: int, equip_name: CardName, equip_type: Eq
         event = None
         if communicator:
             event = EquipChangeEvent(player_id, equip_name, equip_type)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
+            result = _send_to_frontend(event, _wait_for_ack)
         
         # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
+        control_manager = get_control_manager()
+        if control_manager and event:
+            control_manager.notify_event(event)
         
         if communicator and event:
             return result if _wait_for_ack else (None, None)
@@ -336,11 +449,12 @@ def send_death_event(player_id: int) -> tuple:
         event = None
         if communicator:
             event = DeathEvent(player_id)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
+            result = _send_to_frontend(event, _wait_for_ack)
         
         # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
+        control_manager = get_control_manager()
+        if control_manager and event:
+            control_manager.notify_event(event)
         
         if communicator and event:
             return result if _wait_for_ack else (None, None)
@@ -365,11 +479,12 @@ def send_game_over_event(winner_info: str) -> tuple:
         event = None
         if communicator:
             event = GameOverEvent(winner_info=winner_info)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
+            result = _send_to_frontend(event, _wait_for_ack)
         
         # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
+        control_manager = get_control_manager()
+        if control_manager and event:
+            control_manager.notify_event(event)
         
         if communicator and event:
             return result if _wait_for_ack else (None, None)
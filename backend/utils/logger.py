@@ -1,11 +1,23 @@
 # 日志系统模块
 import logging
 import os
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
 import threading
 
 
+# 按线程记录是否暂停日志（模拟对局时暂停，不影响其他线程中正在进行的对局）
+_suppressed = threading.local()
+
+
+class _SuppressedFilter(logging.Filter):
+    """暂停日志期间丢弃当前线程的所有记录"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not getattr(_suppressed, "active", False)
+
+
 class GameLogger:
     """游戏日志系统
     
@@ -41,6 +53,7 @@ class GameLogger:
         # 清除已有的处理器
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
+        self.logger.addFilter(_SuppressedFilter())
     
     def start_game_session(self, is_test: bool = False) -> str:
         """开始新的游戏会话
@@ -113,35 +126,49 @@ class GameLogger:
             self.logger.info(f"模式: {'测试模式' if self.is_test_mode else '正常模式'}")
             self.logger.info("=" * 50)
     
+    @contextmanager
+    def suppressed(self):
+        """暂停当前线程的日志（用于搜索、模拟对局，避免模拟的过程写入游戏日志）"""
+        previous = getattr(_suppressed, "active", False)
+        _suppressed.active = True
+        try:
+            yield
+        finally:
+            _suppressed.active = previous
+    
+    def _enabled(self) -> bool:
+        """当前线程是否记录日志（暂停时直接跳过，不再拼接消息、创建日志记录）"""
+        return self.logger is not None and not getattr(_suppressed, "active", False)
+    
     def log_info(self, message: str):
         """记录信息日志"""
-        if self.logger:
+        if self._enabled():
             self.logger.info(message)
     
     def log_warning(self, message: str):
         """记录警告日志"""
-        if self.logger:
+        if self._enabled():
             self.logger.warning(message)
     
     def log_error(self, message: str):
         """记录错误日志"""
-        if self.logger:
+        if self._enabled():
             self.logger.error(message)
     
     def log_debug(self, message: str):
         """记录调试日志"""
-        if self.logger:
+        if self._enabled():
             self.logger.debug(message)
     
     def log_player_draw_cards(self, player_name: str, cards: list):
         """记录玩家摸牌"""
-        if self.logger and cards:
+        if self._enabled() and cards:
             card_names = [card.name for card in cards]
             self.logger.info(f"{player_name} 摸牌: {', '.join(card_names)}")
     
     def log_player_play_card(self, player_name: str, card_name: str, targets: list = None, target_names: list = None):
         """记录玩家出牌"""
-        if self.logger:
+        if self._enabled():
             if targets and target_names:
                 self.logger.info(f"{player_name} 使用 {card_name}，目标: {', '.join(target_names)}")
             elif targets:
@@ -152,7 +179,7 @@ class GameLogger:
     
     def log_player_use_card(self, player_name: str, card_name: str, targets: list = None, target_names: list = None):
         """记录玩家使用牌（响应）"""
-        if self.logger:
+        if self._enabled():
             if targets and target_names:
                 self.logger.info(f"{player_name} 使用 {card_name} 响应，目标: {', '.join(target_names)}")
             elif targets:
@@ -163,22 +190,22 @@ class GameLogger:
     
     def log_player_damage(self, player_name: str, damage: int, current_hp: int, max_hp: int):
         """记录玩家受伤"""
-        if self.logger:
+        if self._enabled():
             self.logger.info(f"{player_name} 受到 {damage} 点伤害，当前血量: {current_hp}/{max_hp}")
     
     def log_player_heal(self, player_name: str, heal: int, current_hp: int, max_hp: int):
         """记录玩家治疗"""
-        if self.logger:
+        if self._enabled():
             self.logger.info(f"{player_name} 恢复 {heal} 点血量，当前血量: {current_hp}/{max_hp}")
     
     def log_player_dying(self, player_name: str):
         """记录玩家濒死"""
-        if self.logger:
+        if self._enabled():
             self.logger.warning(f"{player_name} 濒死！")
     
     def log_player_death(self, player_name: str, identity: str = None):
         """记录玩家死亡"""
-        if self.logger:
+        if self._enabled():
             if identity:
                 self.logger.warning(f"{player_name} ({identity}) 死亡！")
             else:
@@ -186,32 +213,32 @@ class GameLogger:
     
     def log_player_equip(self, player_name: str, equipment_name: str, equipment_type: str):
         """记录玩家装备"""
-        if self.logger:
+        if self._enabled():
             self.logger.info(f"{player_name} 装备 {equipment_name} ({equipment_type})")
     
     def log_card_effect(self, card_name: str, effect_description: str):
         """记录牌效果"""
-        if self.logger:
+        if self._enabled():
             self.logger.info(f"{card_name} 效果: {effect_description}")
     
     def log_turn_start(self, player_name: str, turn_number: int):
         """记录回合开始"""
-        if self.logger:
+        if self._enabled():
             self.logger.info(f"=== 第 {turn_number} 回合开始，{player_name} 的回合 ===")
     
     def log_turn_end(self, player_name: str):
         """记录回合结束"""
-        if self.logger:
+        if self._enabled():
             self.logger.info(f"{player_name} 回合结束")
     
     def log_phase_start(self, player_name: str, phase: str):
         """记录阶段开始"""
-        if self.logger:
+        if self._enabled():
             self.logger.info(f"{player_name} 进入 {phase} 阶段")
     
     def log_game_event(self, event_description: str):
         """记录游戏事件"""
-        if self.logger:
+        if self._enabled():
             self.logger.info(f"游戏事件: {event_description}")
     
     def log_player_status(self, player_name: str, player_id: int, current_hp: int, max_hp: int, 
@@ -233,7 +260,7 @@ class GameLogger:
             identity: 身份
             character: 武将
         """
-        if self.logger:
+        if self._enabled():
             # 基本信息
             status_info = f"玩家{player_id} ({player_name})"
             if identity:
@@ -273,7 +300,7 @@ class GameLogger:
         Args:
             deck: 牌堆对象
         """
-        if self.logger:
+        if self._enabled():
             self.logger.info("=" * 60)
             self.logger.info("当前牌堆状态:")
             
@@ -298,7 +325,7 @@ class GameLogger:
     
     def log_all_players_status(self, players: list):
         """记录所有玩家状态"""
-        if self.logger:
+        if self._enabled():
             self.logger.info("=" * 60)
             self.logger.info("当前所有玩家状态:")
             for player in players:
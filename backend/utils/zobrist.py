@@ -0,0 +1,46 @@
+# 状态哈希模块
+"""对局状态的 Zobrist 哈希
+
+对局状态拆成若干特征（座位血量、存活状态、手牌中第k张某牌名、装备槽、牌堆第i张、弃牌堆中第k张某牌名、
+当前回合玩家、本回合是否已出杀），每个特征对应一个固定的64位随机键，状态哈希为所有特征键的异或。
+Player、HandCards、EquipmentManager、Deck 和 GameController 在修改状态时异或进/出对应的键，
+因此状态哈希的维护是增量的，读取是 O(1) 的。
+"""
+import hashlib
+from functools import lru_cache
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+@lru_cache(maxsize=None)
+def zobrist_key(*feature) -> int:
+    """特征的64位随机键
+
+    由特征的 repr 哈希得到，与生成顺序和进程无关（复制到子进程的对局得到相同的哈希）。
+
+    Args:
+        *feature: 特征（如 ("hp", 座位, 血量)）
+
+    Returns:
+        64位整数
+    """
+    return int.from_bytes(hashlib.blake2b(repr(feature).encode(), digest_size=8).digest(), "little")
+
+
+class StateHash:
+    """对局状态哈希（由对局中的各个对象共享，修改状态时增量更新）"""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def toggle(self, *feature) -> None:
+        """异或进/出一个特征的键（同一特征异或两次即移除）"""
+        self.value ^= zobrist_key(*feature)
+
+    def replace(self, old_feature: tuple, new_feature: tuple) -> None:
+        """把一个特征换成另一个（如血量变化）"""
+        if old_feature != new_feature:
+            self.value ^= zobrist_key(*old_feature) ^ zobrist_key(*new_feature)
@@ -11,7 +11,7 @@
 
 注意：本模块尽量只做组装与配置，不直接启动游戏主循环。
 """
-from typing import List
+from typing import Any, Dict, List, Optional
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -26,13 +26,17 @@ from config.simple_card_config import SimplePlayerConfig
 # SimpleAI is provided by ControlFactory via ControlType.SIMPLE_AI
 
 
-def create_chapter_one_players(deck: Deck, human_control: bool = True, ai_count: int = 4) -> List[BasePlayer]:
+def create_chapter_one_players(deck: Deck, human_control: bool = True, ai_count: int = 4,
+                               enemy_control_type: ControlType = ControlType.SIMPLE_AI,
+                               enemy_control_params: Optional[Dict[str, Any]] = None) -> List[BasePlayer]:
     """创建第一章的玩家列表。
 
     参数:
         deck: 牌堆，用于发手牌
         human_control: 是否把赵云设为真人控制（True -> 人类/窗口控制）
         ai_count: 敌方AI数量（建议 3~4）
+        enemy_control_type: 敌人的操控类型（默认规则AI，可换成搜索AI等更强的对手）
+        enemy_control_params: 敌人操控模块的参数（如搜索AI的 iterations、time_budget）
 
     返回:
         players: 按游戏顺序的 Player 实例列表
@@ -50,7 +54,9 @@ def create_chapter_one_players(deck: Deck, human_control: bool = True, ai_count:
         pid = i + 1
         # 使用简单 Player 基类实例化白板敌人
         # 这里直接用 Player，默认血量为4，需要把max/current 设置为1
-        ai = BasePlayer(player_id=pid, name=f"残兵{i+1}", control_type=ControlType.SIMPLE_AI, deck=deck, identity=PlayerIdentity.REBEL, character_name=CharacterName.BAI_BAN_WU_JIANG, player_controller=None)
+        ai = BasePlayer(player_id=pid, name=f"残兵{i+1}", control_type=enemy_control_type, deck=deck, identity=PlayerIdentity.REBEL, character_name=CharacterName.BAI_BAN_WU_JIANG, player_controller=None)
+        if enemy_control_params:
+            ai.control = ControlFactory.create_control(enemy_control_type, pid, enemy_control_params)
         # 设置为1血并清空技能/装备
         # 设置为2血，保持默认手牌抽取流程（不要手动清空 hand_cards）
         ai.max_hp = 2
@@ -61,9 +67,14 @@ def create_chapter_one_players(deck: Deck, human_control: bool = True, ai_count:
     return players
 
 
-def get_chapter_one_config() -> List[SimplePlayerConfig]:
+def get_chapter_one_config(enemy_control_type: ControlType = ControlType.CANBING_AI,
+                           enemy_control_params: Optional[Dict[str, Any]] = None) -> List[SimplePlayerConfig]:
     """生成第一章前端配置（SimplePlayerConfig列表）
     
+    参数:
+        enemy_control_type: 残兵的操控类型（默认残兵AI，可换成搜索AI等更强的对手）
+        enemy_control_params: 残兵操控模块的参数（如搜索AI的 iterations、time_budget）
+    
     返回:
         players_config: 包含赵云（忠臣，人类）和4个残兵（反贼，残兵AI）
     """
@@ -81,7 +92,8 @@ def get_chapter_one_config() -> List[SimplePlayerConfig]:
             name=f"残兵{i+1}",
             character_name=CharacterName.CAN_BING,
             identity=PlayerIdentity.REBEL,
-            control_type=ControlType.CANBING_AI  # 使用专用残兵AI
+            control_type=enemy_control_type,  # 默认使用专用残兵AI
+            control_params=dict(enemy_control_params or {})
         ))
     return players_cfg
 
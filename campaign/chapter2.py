@@ -10,7 +10,7 @@
 
 注意：本模块尽量只做组装与配置，不直接启动游戏主循环。
 """
-from typing import List
+from typing import Any, Dict, List, Optional
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -22,13 +22,17 @@ from backend.player.player import Player as BasePlayer
 from config.simple_card_config import SimplePlayerConfig
 
 
-def create_chapter_two_players(deck: Deck, human_control: bool = True, ai_count: int = 4) -> List[BasePlayer]:
+def create_chapter_two_players(deck: Deck, human_control: bool = True, ai_count: int = 4,
+                               enemy_control_type: ControlType = ControlType.SIMPLE_AI,
+                               enemy_control_params: Optional[Dict[str, Any]] = None) -> List[BasePlayer]:
     """创建第二章的玩家列表。
 
     参数:
         deck: 牌堆，用于发手牌
         human_control: 是否把赵云设为真人控制（True -> 人类/窗口控制）
         ai_count: 敌方AI数量（固定为4：1个阿斗 + 3个曹军）
+        enemy_control_type: 曹军的操控类型（默认规则AI，可换成搜索AI等更强的对手）
+        enemy_control_params: 曹军操控模块的参数（如搜索AI的 iterations、time_budget）
 
     返回:
         players: 按游戏顺序的 Player 实例列表
@@ -74,7 +78,7 @@ def create_chapter_two_players(deck: Deck, human_control: bool = True, ai_count:
         cao = BasePlayer(
             player_id=pid, 
             name=f"曹军{i+1}", 
-            control_type=ControlType.SIMPLE_AI, 
+            control_type=enemy_control_type, 
             deck=deck, 
             identity=PlayerIdentity.REBEL,  # 反贼
             character_name=CharacterName.CAO_JUN, 
@@ -83,14 +87,21 @@ def create_chapter_two_players(deck: Deck, human_control: bool = True, ai_count:
         # 曹军：3血
         cao.max_hp = 3
         cao.current_hp = 3
+        if enemy_control_params:
+            cao.control = ControlFactory.create_control(enemy_control_type, pid, enemy_control_params)
         players.append(cao)
 
     return players
 
 
-def get_chapter_two_config() -> List[SimplePlayerConfig]:
+def get_chapter_two_config(enemy_control_type: ControlType = ControlType.CAOJUN_AI,
+                           enemy_control_params: Optional[Dict[str, Any]] = None) -> List[SimplePlayerConfig]:
     """生成第二章前端配置（SimplePlayerConfig列表）
     
+    参数:
+        enemy_control_type: 曹军的操控类型（默认曹军AI，可换成搜索AI等更强的对手）
+        enemy_control_params: 曹军操控模块的参数（如搜索AI的 iterations、time_budget）
+    
     返回:
         players_config: 包含赵云（忠臣，人类）、阿斗（主公，阿斗AI）和3个曹军（反贼，曹军AI）
     """
@@ -115,7 +126,8 @@ def get_chapter_two_config() -> List[SimplePlayerConfig]:
             name=f"曹军{i+1}",
             character_name=CharacterName.CAO_JUN,
             identity=PlayerIdentity.REBEL,
-            control_type=ControlType.CAOJUN_AI  # 使用专用曹军AI
+            control_type=enemy_control_type,  # 默认使用专用曹军AI
+            control_params=dict(enemy_control_params or {})
         ))
     return players_cfg
 
@@ -6,20 +6,25 @@
   返回第三章的前端配置列表
 
 """
-from typing import List
+from typing import Any, Dict, List, Optional
 import sys, os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.simple_card_config import SimplePlayerConfig
 from config.enums import CharacterName, PlayerIdentity, ControlType
 
-def get_chapter_three_config() -> List[SimplePlayerConfig]:
+def get_chapter_three_config(enemy_control_type: ControlType = ControlType.CAOJUN_AI,
+                             enemy_control_params: Optional[Dict[str, Any]] = None) -> List[SimplePlayerConfig]:
     """生成第三章前端配置（SimplePlayerConfig列表）
     
     配置：
     - 赵云（忠臣，人类）：赵云3（龙胆+冲阵+绝境）
     - 3个曹军（反贼，曹军AI）
     - 1个张郃（反贼，曹军AI）
+    
+    参数:
+        enemy_control_type: 曹军和张郃的操控类型（默认曹军AI，可换成搜索AI等更强的对手）
+        enemy_control_params: 曹军和张郃操控模块的参数（如搜索AI的 iterations、time_budget）
     """
     players_cfg = []
     
@@ -37,7 +42,8 @@ def get_chapter_three_config() -> List[SimplePlayerConfig]:
             name=f"曹军{i+1}",
             character_name=CharacterName.CAO_JUN,
             identity=PlayerIdentity.REBEL,
-            control_type=ControlType.CAOJUN_AI
+            control_type=enemy_control_type,
+            control_params=dict(enemy_control_params or {})
         ))
         
     # 1个张郃（反贼，曹军AI）
@@ -45,7 +51,8 @@ def get_chapter_three_config() -> List[SimplePlayerConfig]:
         name="张郃",
         character_name=CharacterName.ZHANG_HE,
         identity=PlayerIdentity.REBEL,
-        control_type=ControlType.CAOJUN_AI
+        control_type=enemy_control_type,
+        control_params=dict(enemy_control_params or {})
     ))
     
     return players_cfg
@@ -6,13 +6,14 @@
 
 注意：UI层仍使用现有前端/后端系统；本模块以终端交互为主，用于快速验证章节流程。
 """
-from typing import Optional
+from typing import Any, Dict, Optional
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.game_controller.game_controller import GameController
 from config.simple_card_config import SimpleGameConfig
+from config.enums import ControlType
 from config.simple_detailed_config import create_simple_default_game_config
 from campaign.chapter1 import create_chapter_one_players, apply_reward_choice
 from campaign.chapter2 import create_chapter_two_players
@@ -32,12 +33,15 @@ def chapter_start_ui() -> Optional[str]:
     return None
 
 
-def start_chapter_one(human_control: bool = True, ai_count: int = 4):
+def start_chapter_one(human_control: bool = True, ai_count: int = 4,
+                      enemy_control_type: ControlType = ControlType.SIMPLE_AI,
+                      enemy_control_params: Optional[Dict[str, Any]] = None):
     """启动第一章章节：
     - 构建基础游戏配置
     - 初始化 GameController（创建牌堆/玩家控制器）
     - 使用 `create_chapter_one_players` 替换玩家列表（并重建 ControlManager）
     - 应用奖励选择
+    - 敌人可以指定操控类型和参数（enemy_control_type / enemy_control_params，如可调的搜索AI）
     - 启动游戏主循环
     """
     # 加载默认游戏配置（用于牌堆）
@@ -48,7 +52,9 @@ def start_chapter_one(human_control: bool = True, ai_count: int = 4):
     gc.initialize()
 
     # 构建章节玩家（赵云 + 敌人），player_id 从0开始连续
-    players = create_chapter_one_players(gc.deck, human_control=human_control, ai_count=ai_count)
+    players = create_chapter_one_players(gc.deck, human_control=human_control, ai_count=ai_count,
+                                         enemy_control_type=enemy_control_type,
+                                         enemy_control_params=enemy_control_params)
 
     # 替换 PlayerController 的 players 列表
     pc = gc.player_controller
@@ -58,12 +64,16 @@ def start_chapter_one(human_control: bool = True, ai_count: int = 4):
         # 确保player knows its player_controller
         p.player_controller = pc
     pc.players = players
+    # 玩家已替换，重新计算状态哈希并绑定到新的玩家
+    gc.rehash_state()
 
     # 重新创建 ControlManager，使其包含新的玩家的 Control 实例
     pc.control_manager = ControlManager(pc)
     set_control_manager(pc.control_manager)
     # 同步一次状态
     pc.control_manager.sync_game_state()
+    # 玩家已替换，让搜索AI等操控模块重新绑定本对局
+    gc.bind_controls()
 
     # 章节开始界面（选择奖励）
     reward = chapter_start_ui()
@@ -86,10 +96,13 @@ def start_chapter_one(human_control: bool = True, ai_count: int = 4):
         return False
 
 
-def start_chapter_one_headless(human_control: bool = True, ai_count: int = 4, auto_unlock_skill: str = '冲阵'):
+def start_chapter_one_headless(human_control: bool = True, ai_count: int = 4, auto_unlock_skill: str = '冲阵',
+                               enemy_control_type: ControlType = ControlType.SIMPLE_AI,
+                               enemy_control_params: Optional[Dict[str, Any]] = None):
     """无交互版本的第一章启动，用于从前端 UI 直接触发。
     - 自动为赵云解锁指定技能（默认 '冲阵'）
     - 不弹出终端奖励选择
+    - 敌人可以指定操控类型和参数（同 start_chapter_one / start_chapter_two）
     - 启动后端游戏主循环（阻塞直到游戏结束）
     返回 True/False 表示通关结果
     """
@@ -101,7 +114,9 @@ def start_chapter_one_headless(human_control: bool = True, ai_count: int = 4, au
     gc.initialize()
 
     # 构建章节玩家（赵云 + 敌人）
-    players = create_chapter_one_players(gc.deck, human_control=human_control, ai_count=ai_count)
+    players = create_chapter_one_players(gc.deck, human_control=human_control, ai_count=ai_count,
+                                         enemy_control_type=enemy_control_type,
+                                         enemy_control_params=enemy_control_params)
 
     # 替换 PlayerController 的 players 列表
     pc = gc.player_controller
@@ -109,11 +124,15 @@ def start_chapter_one_headless(human_control: bool = True, ai_count: int = 4, au
         p.player_id = i
         p.player_controller = pc
     pc.players = players
+    # 玩家已替换，重新计算状态哈希并绑定到新的玩家
+    gc.rehash_state()
 
     # 重新创建 ControlManager 并设置
     pc.control_manager = ControlManager(pc)
     set_control_manager(pc.control_manager)
     pc.control_manager.sync_game_state()
+    # 玩家已替换，让搜索AI等操控模块重新绑定本对局
+    gc.bind_controls()
 
     # 自动解锁技能到赵云（玩家0）
     if auto_unlock_skill:
@@ -143,12 +162,15 @@ def chapter_two_start_ui() -> Optional[str]:
     return None
 
 
-def start_chapter_two(human_control: bool = True, ai_count: int = 4):
+def start_chapter_two(human_control: bool = True, ai_count: int = 4,
+                      enemy_control_type: ControlType = ControlType.SIMPLE_AI,
+                      enemy_control_params: Optional[Dict[str, Any]] = None):
     """启动第二章章节：
     - 构建基础游戏配置
     - 初始化 GameController（创建牌堆/玩家控制器）
     - 使用 `create_chapter_two_players` 替换玩家列表（并重建 ControlManager）
     - 应用奖励选择
+    - 敌人可以指定操控类型和参数（enemy_control_type / enemy_control_params，如可调的搜索AI）
     - 启动游戏主循环
     """
     # 加载默认游戏配置（用于牌堆）
@@ -159,7 +181,9 @@ def start_chapter_two(human_control: bool = True, ai_count: int = 4):
     gc.initialize()
 
     # 构建章节玩家（赵云2 + 敌人），player_id 从0开始连续
-    players = create_chapter_two_players(gc.deck, human_control=human_control, ai_count=ai_count)
+    players = create_chapter_two_players(gc.deck, human_control=human_control, ai_count=ai_count,
+                                         enemy_control_type=enemy_control_type,
+                                         enemy_control_params=enemy_control_params)
 
     # 替换 PlayerController 的 players 列表
     pc = gc.player_controller
@@ -169,12 +193,16 @@ def start_chapter_two(human_control: bool = True, ai_count: int = 4):
         # 确保player knows its player_controller
         p.player_controller = pc
     pc.players = players
+    # 玩家已替换，重新计算状态哈希并绑定到新的玩家
+    gc.rehash_state()
 
     # 重新创建 ControlManager，使其包含新的玩家的 Control 实例
     pc.control_manager = ControlManager(pc)
     set_control_manager(pc.control_manager)
     # 同步一次状态
     pc.control_manager.sync_game_state()
+    # 玩家已替换，让搜索AI等操控模块重新绑定本对局
+    gc.bind_controls()
 
     # 章节开始界面（选择奖励）
     reward = chapter_two_start_ui()
@@ -197,10 +225,13 @@ def start_chapter_two(human_control: bool = True, ai_count: int = 4):
         return False
 
 
-def start_chapter_two_headless(human_control: bool = True, ai_count: int = 4, auto_unlock_skill: str = '绝境'):
+def start_chapter_two_headless(human_control: bool = True, ai_count: int = 4, auto_unlock_skill: str = '绝境',
+                               enemy_control_type: ControlType = ControlType.SIMPLE_AI,
+                               enemy_control_params: Optional[Dict[str, Any]] = None):
     """无交互版本的第二章启动，用于从前端 UI 直接触发。
     - 自动为赵云解锁指定技能（默认 '绝境'）
     - 不弹出终端奖励选择
+    - 敌人可以指定操控类型和参数（同 start_chapter_one / start_chapter_two）
     - 启动后端游戏主循环（阻塞直到游戏结束）
     返回 True/False 表示通关结果
     """
@@ -212,7 +243,9 @@ def start_chapter_two_headless(human_control: bool = True, ai_count: int = 4, au
     gc.initialize()
 
     # 构建章节玩家（赵云2 + 敌人）
-    players = create_chapter_two_players(gc.deck, human_control=human_control, ai_count=ai_count)
+    players = create_chapter_two_players(gc.deck, human_control=human_control, ai_count=ai_count,
+                                         enemy_control_type=enemy_control_type,
+                                         enemy_control_params=enemy_control_params)
 
     # 替换 PlayerController 的 players 列表
     pc = gc.player_controller
@@ -220,11 +253,15 @@ def start_chapter_two_headless(human_control: bool = True, ai_count: int = 4, au
         p.player_id = i
         p.player_controller = pc
     pc.players = players
+    # 玩家已替换，重新计算状态哈希并绑定到新的玩家
+    gc.rehash_state()
 
     # 重新创建 ControlManager 并设置
     pc.control_manager = ControlManager(pc)
     set_control_manager(pc.control_manager)
     pc.control_manager.sync_game_state()
+    # 玩家已替换，让搜索AI等操控模块重新绑定本对局
+    gc.bind_controls()
 
     # 自动解锁技能到赵云（玩家0）
     if auto_unlock_skill:
@@ -85,20 +85,38 @@ class DebugEvent(CommEvent):
 
 class AskPlayCardEvent(CommEvent):
     """后端请求前端出牌"""
-    def __init__(self, available_cards: list = None):
+    def __init__(self, available_cards: list = None, request_id: int = None, timeout: float = None):
         self.available_cards = available_cards # List of SimpleCardConfig
+        self.request_id = request_id # 请求编号（由 Communicator.request 分配），回复时原样带回
+        self.timeout = timeout # 最长等待时间（秒），None表示一直等待
 
 class PlayCardResponseEvent(CommEvent):
     """前端响应出牌请求"""
-    def __init__(self, card_index: int):
+    def __init__(self, card_index: int, request_id: int = None):
         self.card_index = card_index # Index in the available_cards list, or -1 for cancel/skip
+        self.request_id = request_id # 所回复的请求编号
 
 class AskTargetEvent(CommEvent):
     """后端请求前端选择目标"""
-    def __init__(self, available_targets: list):
+    def __init__(self, available_targets: list, request_id: int = None, timeout: float = None):
         self.available_targets = available_targets # List of player_ids
+        self.request_id = request_id
+        self.timeout = timeout
 
 class TargetResponseEvent(CommEvent):
     """前端响应目标选择"""
-    def __init__(self, target_ids: list):
-        self.target_ids = target_ids # List of player_ids, or None/empty for cancel
\ No newline at end of file
+    def __init__(self, target_ids: list, request_id: int = None):
+        self.target_ids = target_ids # List of player_ids, or None/empty for cancel
+        self.request_id = request_id
+
+class CancelRequestEvent(CommEvent):
+    """后端取消一个请求（如等待超时已采用默认动作），前端应退出对应的选择状态"""
+    def __init__(self, request_id: int, reason: str = ""):
+        self.request_id = request_id
+        self.reason = reason
+
+class KeyframeEvent(CommEvent):
+    """关键帧：某回合开始时前端需要的全部局面（只写入事件日志，用于回放时跳转）"""
+    def __init__(self, turn_number: int, players: list):
+        self.turn_number = turn_number
+        self.players = players # List of dict: player_id, hp, hand (List of SimpleCardConfig), equipment ({EquipmentType: CardName}), dead
\ No newline at end of file
@@ -2,7 +2,41 @@ import queue
 import threading
 import time
 from typing import Optional, Dict, Tuple
-from communicator.comm_event import CommEvent, AckEvent
+from communicator.comm_event import CommEvent, AckEvent, CancelRequestEvent, PlayCardResponseEvent, TargetResponseEvent
+
+# 前端对请求的回复（按 request_id 交给对应的请求，不进入 ftb_queue）
+RESPONSE_EVENTS = (PlayCardResponseEvent, TargetResponseEvent)
+
+
+class PendingRequest:
+    """
+    一个等待前端回复的请求（由 Communicator.request 创建）。
+    后端可以阻塞等待（wait），也可以只在需要时查看是否已回复（done / response）。
+    """
+
+    def __init__(self, request_id: int, event: CommEvent) -> None:
+        self.request_id = request_id
+        self.event = event
+        self.response: Optional[CommEvent] = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[CommEvent]:
+        """
+        等待回复。
+
+        Returns:
+            回复事件；超时返回 None
+        """
+        self._done.wait(timeout)
+        return self.response
+
+    def resolve(self, response: CommEvent) -> None:
+        self.response = response
+        self._done.set()
 
 
 class Communicator:
@@ -23,6 +57,13 @@ class Communicator:
 
         self._stop_event = threading.Event()
 
+        # 等待前端回复的请求：request_id -> PendingRequest
+        self.request_counter = 0
+        self.pending_requests: Dict[int, PendingRequest] = {}
+
+        # 后端 -> 前端 投递事件后调用的回调（前端空闲时据此唤醒）
+        self._frontend_listeners = []
+
         self.ack_thread = threading.Thread(
             target=self._process_acks, name="comm-ack-thread", daemon=True
         )
@@ -49,6 +90,7 @@ class Communicator:
                 setattr(event, "_event_id", event_id)
 
             self.btf_queue.put(event)
+            self._notify_frontend()
             return None, None
 
         with self.lock:
@@ -59,6 +101,7 @@ class Communicator:
             self.pending_acks[event_id] = ack_event
 
         self.btf_queue.put(event)
+        self._notify_frontend()
 
         ack_received = ack_event.wait(timeout=timeout)
 
@@ -68,14 +111,82 @@ class Communicator:
 
         return result
 
+    def add_frontend_listener(self, callback) -> None:
+        """
+        注册回调：每次有事件投递到前端队列后调用（在后端线程中调用，回调应尽快返回）。
+        """
+        self._frontend_listeners.append(callback)
+
+    def remove_frontend_listener(self, callback) -> None:
+        if callback in self._frontend_listeners:
+            self._frontend_listeners.remove(callback)
+
+    def _notify_frontend(self) -> None:
+        for callback in list(self._frontend_listeners):
+            callback()
+
+    def request(self, event: CommEvent, timeout: Optional[float] = None) -> PendingRequest:
+        """
+        向前端发出需要回复的请求（如选牌、选目标），分配 request_id 并登记。
+        前端的回复按 request_id 交给返回的 PendingRequest，不会与调试指令、ACK 等其他事件混在一起。
+
+        Args:
+            event: 请求事件（需要有 request_id 属性）
+            timeout: 告知前端的最长等待时间（秒），None表示一直等待
+        """
+        with self.lock:
+            self.request_counter += 1
+            request_id = self.request_counter
+            event.request_id = request_id
+            if hasattr(event, "timeout"):
+                event.timeout = timeout
+            pending = PendingRequest(request_id, event)
+            self.pending_requests[request_id] = pending
+        self.send_to_frontend(event)
+        return pending
+
+    def cancel_request(self, pending: PendingRequest, reason: str = "") -> bool:
+        """
+        取消请求（如等待超时，后端采用默认动作），并通知前端退出对应的选择状态。
+
+        Returns:
+            是否取消成功（回复已经到达时返回 False，应以回复为准）
+        """
+        with self.lock:
+            removed = self.pending_requests.pop(pending.request_id, None)
+        if removed is None or pending.done:
+            return False
+        self.send_to_frontend(CancelRequestEvent(pending.request_id, reason))
+        return True
+
+    def _resolve_response(self, event: CommEvent) -> None:
+        """
+        把前端的回复交给对应的请求；没有 request_id 的回复（旧版前端）交给最早的请求，
+        已超时或取消的请求的回复直接丢弃。
+        """
+        request_id = getattr(event, "request_id", None)
+        with self.lock:
+            if request_id is None and self.pending_requests:
+                request_id = next(iter(self.pending_requests))
+            pending = self.pending_requests.pop(request_id, None)
+        if pending is None:
+            print(f"[Communicator] 丢弃过期的回复: request_id={request_id}")
+            return
+        pending.resolve(event)
+
     def send_to_backend(self, event: CommEvent) -> None:
         """
         前端 -> 后端：投递消息到后端消费。
-        若为 AckEvent，额外复制一份进 _ack_inbox 供 ACK 线程消费。
+        若为对请求的回复，交给对应的 PendingRequest；
+        若为 AckEvent，只放进 _ack_inbox 供 ACK 线程消费（对局中没有人读取 ftb_queue 里的 ACK）。
         """
-        self.ftb_queue.put(event)
+        if isinstance(event, RESPONSE_EVENTS):
+            self._resolve_response(event)
+            return
         if isinstance(event, AckEvent):
             self._ack_inbox.put(event)
+            return
+        self.ftb_queue.put(event)
 
     def receive_from_frontend(self) -> Optional[CommEvent]:
         if self.ftb_queue.empty():
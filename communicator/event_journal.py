@@ -0,0 +1,294 @@
+import json
+import struct
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
+from communicator.comm_event import (CommEvent, DrawCardEvent, PlayCardEvent, DiscardCardEvent, HPChangeEvent,
+                                     EquipChangeEvent, DeathEvent, GameOverEvent, StealCardEvent, KeyframeEvent)
+from config.enums import CardName, CardSuit, EquipmentType
+from config.simple_card_config import SimpleCardConfig, SimpleGameConfig
+
+MAGIC = b"ZGSJ\x02"
+# 每条记录：序号、回合数、对局时间（秒）、事件数据长度，随后是事件数据（类型编号 + 按 EVENT_SCHEMA 顺序编码的字段）
+_RECORD_HEADER = struct.Struct("<IIdI")
+_BLOB_HEADER = struct.Struct("<I")
+_TYPE = struct.Struct("<B")
+_INT = struct.Struct("<q")
+_LENGTH = struct.Struct("<I")
+
+# 写入日志的事件类型及其字段（类型编号为在此列表中的下标，只能在末尾追加）
+EVENT_SCHEMA: List[Tuple[Type[CommEvent], Tuple[str, ...]]] = [
+    (DrawCardEvent, ("card_config", "to_player")),
+    (PlayCardEvent, ("card_config", "from_player", "to_player", "response_type", "response_target",
+                     "original_card_name", "conversion_display", "is_effective")),
+    (DiscardCardEvent, ("card_config", "player")),
+    (HPChangeEvent, ("player_id", "new_hp", "source_player_id", "damage_type", "original_card_name")),
+    (EquipChangeEvent, ("player_id", "equip_name", "equip_type")),
+    (DeathEvent, ("player_id",)),
+    (GameOverEvent, ("winner_id", "winner_info")),
+    (StealCardEvent, ("card_config", "from_player", "to_player")),
+    (KeyframeEvent, ("turn_number", "players")),
+]
+_EVENT_TYPE_IDS: Dict[type, int] = {event_type: i for i, (event_type, _) in enumerate(EVENT_SCHEMA)}
+# 字段中可以出现的枚举（按成员名保存，编号为在此列表中的下标）
+_ENUMS: List[Type[Enum]] = [CardName, CardSuit, EquipmentType]
+_ENUM_IDS: Dict[type, int] = {enum_type: i for i, enum_type in enumerate(_ENUMS)}
+
+
+class JournalRecord(NamedTuple):
+    seq: int
+    turn: int
+    time: float
+    event: CommEvent
+
+
+def _encode_str(text: str, out: bytearray) -> None:
+    data = text.encode("utf-8")
+    out += _LENGTH.pack(len(data))
+    out += data
+
+
+def _encode_value(value: Any, out: bytearray) -> None:
+    """按类型标记编码一个字段值（只支持事件中出现的类型，其他类型抛出 TypeError）"""
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif isinstance(value, Enum):
+        enum_id = _ENUM_IDS.get(type(value))
+        if enum_id is None:
+            raise TypeError(f"事件日志不支持的枚举类型: {type(value).__name__}")
+        out += b"e"
+        out += _TYPE.pack(enum_id)
+        _encode_str(value.name, out)
+    elif isinstance(value, int):
+        out += b"i"
+        out += _INT.pack(value)
+    elif isinstance(value, str):
+        out += b"s"
+        _encode_str(value, out)
+    elif isinstance(value, SimpleCardConfig):
+        out += b"c"
+        _encode_str(value.name.name, out)
+        _encode_str(value.suit.name, out)
+        out += _INT.pack(value.rank)
+    elif isinstance(value, list):
+        out += b"l"
+        out += _LENGTH.pack(len(value))
+        for item in value:
+            _encode_value(item, out)
+    elif isinstance(value, dict):
+        out += b"d"
+        out += _LENGTH.pack(len(value))
+        for key, item in value.items():
+            _encode_value(key, out)
+            _encode_value(item, out)
+    else:
+        raise TypeError(f"事件日志不支持的字段类型: {type(value).__name__}")
+
+
+def encode_event(event: CommEvent) -> Optional[bytes]:
+    """
+    编码一个事件：类型编号 + 按 EVENT_SCHEMA 顺序编码的字段。
+
+    Returns:
+        事件数据；不在 EVENT_SCHEMA 中的事件返回None
+    """
+    type_id = _EVENT_TYPE_IDS.get(type(event))
+    if type_id is None:
+        return None
+    out = bytearray(_TYPE.pack(type_id))
+    for field in EVENT_SCHEMA[type_id][1]:
+        _encode_value(getattr(event, field, None), out)
+    return bytes(out)
+
+
+class _Decoder:
+    """按类型标记解码字段值；只会构造 EVENT_SCHEMA 中的事件、牌配置和白名单中的枚举，不执行文件中的任何代码"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    def _unpack(self, fmt: struct.Struct) -> Any:
+        if self.offset + fmt.size > len(self.data):
+            raise ValueError("事件数据不完整")
+        (value,) = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return value
+
+    def _str(self) -> str:
+        length = self._unpack(_LENGTH)
+        end = self.offset + length
+        if end > len(self.data):
+            raise ValueError("事件数据不完整")
+        text = self.data[self.offset:end].decode("utf-8")
+        self.offset = end
+        return text
+
+    @staticmethod
+    def _member(enum_type: Type[Enum], name: str) -> Enum:
+        try:
+            return enum_type[name]
+        except KeyError:
+            raise ValueError(f"无效的枚举值: {enum_type.__name__}.{name}")
+
+    def value(self) -> Any:
+        if self.offset >= len(self.data):
+            raise ValueError("事件数据不完整")
+        tag = self.data[self.offset:self.offset + 1]
+        self.offset += 1
+        if tag == b"N":
+            return None
+        if tag == b"T":
+            return True
+        if tag == b"F":
+            return False
+        if tag == b"i":
+            return self._unpack(_INT)
+        if tag == b"s":
+            return self._str()
+        if tag == b"e":
+            enum_id = self._unpack(_TYPE)
+            if enum_id >= len(_ENUMS):
+                raise ValueError(f"未知的枚举编号: {enum_id}")
+            return self._member(_ENUMS[enum_id], self._str())
+        if tag == b"c":
+            name = self._member(CardName, self._str())
+            suit = self._member(CardSuit, self._str())
+            return SimpleCardConfig(name, suit, self._unpack(_INT))
+        if tag == b"l":
+            return [self.value() for _ in range(self._unpack(_LENGTH))]
+        if tag == b"d":
+            result = {}
+            for _ in range(self._unpack(_LENGTH)):
+                key = self.value()
+                result[key] = self.value()
+            return result
+        raise ValueError(f"未知的字段类型标记: {tag!r}")
+
+    def event(self) -> CommEvent:
+        type_id = self._unpack(_TYPE)
+        if type_id >= len(EVENT_SCHEMA):
+            raise ValueError(f"未知的事件类型编号: {type_id}")
+        event_type, fields = EVENT_SCHEMA[type_id]
+        values = {field: self.value() for field in fields}
+        if self.offset != len(self.data):
+            raise ValueError("事件数据末尾有多余的字节")
+        return event_type(**values)
+
+
+def decode_event(data: bytes) -> CommEvent:
+    """
+    解码 encode_event 编码的事件。
+
+    Raises:
+        ValueError: 数据损坏或包含未知的事件类型、字段类型
+    """
+    return _Decoder(data).event()
+
+
+class EventJournal:
+    """
+    事件日志：按顺序记录后端发往前端的每个 CommEvent（二进制，附带序号、回合数和对局时间），
+    每隔 keyframe_interval 个回合记录一个 KeyframeEvent，回放时可以从关键帧开始跳到任意回合。
+    文件开头保存对局配置（SimpleGameConfig.to_dict 的 JSON），回放不需要运行后端规则。
+    事件按 EVENT_SCHEMA 显式编码，读取时不会执行文件中的代码，可以放心打开别人上报的日志。
+    """
+
+    def __init__(self, path: str, config: Optional[SimpleGameConfig] = None, keyframe_interval: int = 5):
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.seq = 0
+        self.turn = 0
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        blob = json.dumps(config.to_dict() if config is not None else None, ensure_ascii=False).encode("utf-8")
+        self._file.write(_BLOB_HEADER.pack(len(blob)) + blob)
+
+    def append(self, event: CommEvent) -> None:
+        """追加一个事件（不在 EVENT_SCHEMA 中的事件不记录）"""
+        blob = encode_event(event)
+        if blob is None:
+            return
+        with self._lock:
+            if self._file is None:
+                return
+            self.seq += 1
+            header = _RECORD_HEADER.pack(self.seq, self.turn, time.perf_counter() - self._start, len(blob))
+            self._file.write(header + blob)
+
+    def begin_turn(self, turn_number: int, keyframe_factory=None) -> None:
+        """
+        标记新回合开始；每隔 keyframe_interval 个回合（从第1回合开始）调用 keyframe_factory() 记录关键帧。
+        """
+        self.turn = turn_number
+        if keyframe_factory is not None and (turn_number - 1) % self.keyframe_interval == 0:
+            self.append(keyframe_factory())
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_journal(path: str) -> Tuple[Optional[SimpleGameConfig], List[JournalRecord]]:
+    """
+    读取事件日志。
+
+    Returns:
+        (对局配置, 按序号排列的记录列表)；文件末尾不完整的记录（对局中途退出）被忽略
+
+    Raises:
+        ValueError: 不是事件日志文件，或记录数据损坏
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"不是事件日志文件: {path}")
+    offset = len(MAGIC)
+    if offset + _BLOB_HEADER.size > len(data):
+        raise ValueError(f"事件日志缺少对局配置: {path}")
+    (length,) = _BLOB_HEADER.unpack_from(data, offset)
+    offset += _BLOB_HEADER.size
+    config_dict = json.loads(data[offset:offset + length].decode("utf-8"))
+    config = SimpleGameConfig.from_dict(config_dict) if config_dict is not None else None
+    offset += length
+
+    records = []
+    while offset + _RECORD_HEADER.size <= len(data):
+        seq, turn, game_time, length = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        if start + length > len(data):
+            break
+        records.append(JournalRecord(seq, turn, game_time, decode_event(data[start:start + length])))
+        offset = start + length
+    return config, records
+
+
+def find_keyframe(records: List[JournalRecord], turn: int) -> Optional[int]:
+    """
+    找到不晚于指定回合的最后一个关键帧。
+
+    Returns:
+        关键帧在 records 中的下标，没有时返回None
+    """
+    found = None
+    for i, record in enumerate(records):
+        if isinstance(record.event, KeyframeEvent):
+            if record.turn > turn:
+                break
+            found = i
+    return found
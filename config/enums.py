@@ -57,6 +57,16 @@ class ControlType(Enum):
     CANBING_AI = "残兵AI"  # 第一章残兵专用AI
     ADOU_AI = "阿斗AI"    # 第二章阿斗专用AI
     CAOJUN_AI = "曹军AI"  # 第二章曹军专用AI
+    AGENT = "外部智能体操控"  # 决策交给外部智能体（如强化学习环境）
+    ISMCTS_AI = "搜索AI"  # 出牌阶段使用信息集蒙特卡洛树搜索
+
+class GameOutcome(Enum):
+    """对局结果枚举"""
+    FINISHED = "分出胜负"
+    REPETITION = "局面循环"        # 同一局面在回合之间重复出现，判定为循环而提前结束
+    TURN_LIMIT = "超过回合上限"
+    TIME_LIMIT = "超过时间上限"
+    ABORTED = "中止"               # 其他原因结束（如当前玩家无效、调试事件）
 
 class PlayerIdentity(Enum):
     """玩家身份枚举"""
@@ -1,6 +1,6 @@
 # 简化牌配置
 from typing import List, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName
 
 
@@ -20,6 +20,7 @@ class SimplePlayerConfig:
     character_name: CharacterName = CharacterName.BAI_BAN_WU_JIANG  # 武将名
     identity: PlayerIdentity = PlayerIdentity.REBEL  # 身份
     control_type: ControlType = ControlType.AI  # 操控类型
+    control_params: Dict[str, Any] = field(default_factory=dict)  # 操控模块的参数（如搜索AI的 iterations、time_budget）
 
 
 @dataclass
@@ -146,11 +147,17 @@ class SimpleGameConfig:
             except KeyError:
                 raise ValueError(f"'players[{idx}].control_type' 无效的枚举值: {player_data['control_type']}")
             
+            # 操控模块参数（可选）
+            control_params = player_data.get("control_params", {})
+            if not isinstance(control_params, dict):
+                raise TypeError(f"'players[{idx}].control_params' 必须是字典类型，实际类型: {type(control_params)}")
+            
             player_config = SimplePlayerConfig(
                 name=player_data["name"],
                 character_name=character_name,
                 identity=identity,
-                control_type=control_type
+                control_type=control_type,
+                control_params=dict(control_params)
             )
             players_config.append(player_config)
         
@@ -191,7 +198,8 @@ class SimpleGameConfig:
                     "name": player.name,
                     "character_name": player.character_name.name,
                     "identity": player.identity.name,
-                    "control_type": player.control_type.name
+                    "control_type": player.control_type.name,
+                    "control_params": dict(player.control_params)
                 }
                 for player in self.players_config
             ],
@@ -0,0 +1,186 @@
+"""
+前端性能基准（无显示器）
+
+使用 SDL 的 dummy 视频驱动运行 GameClient + Renderer + AnimationManager，
+把事件日志（或现场用规则AI跑一局录制的事件）送入前端，按固定的帧间隔逐帧推进，统计：
+帧耗时分位数、每秒处理的事件数、每帧分配的内存、Renderer.draw 与 AnimationManager.update 各自的耗时。
+
+用法：
+    python -m frontend.benchmark                       # 现场跑一局规则AI对局
+    python -m frontend.benchmark -j game.zgsj          # 使用录制的事件日志
+    python -m frontend.benchmark --allocations --json result.json
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from frontend.core.game_client import GameClient
+from frontend.core.game_state import game_state, GameStateEnum
+from frontend.util.size import DEFAULT_WINDOW_SIZE
+from communicator.communicator import communicator
+from communicator.comm_event import KeyframeEvent
+from communicator.event_journal import EventJournal, read_journal
+
+FRAME_DT = 1.0 / 30  # 每帧推进的动画时间（秒）
+
+
+def record_scripted_game(path: str, seed: int = 0, config_name: str = "default_game_config"):
+    """用规则AI跑一局并录制事件日志（不需要前端）"""
+    from backend.game_controller.game_controller import GameController
+    from backend.utils.event_sender import event_routing
+    from config.simple_detailed_config import load_config
+
+    random.seed(seed)
+    config = load_config(config_name)
+    game_controller = GameController(config)
+    with EventJournal(path, config) as journal:
+        with event_routing(None, journal=journal):
+            game_controller.initialize()
+        with event_routing(game_controller.player_controller.control_manager, journal=journal):
+            game_controller.start_game()
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(q / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def run_benchmark(journal_path: str, max_frames: int = 100000, track_allocations: bool = False, speed: float = 1.0) -> dict:
+    """逐帧回放事件日志并统计前端耗时
+
+    Args:
+        journal_path: 事件日志文件
+        max_frames: 最多运行的帧数
+        track_allocations: 是否用 tracemalloc 统计每帧分配的内存（会明显拖慢运行）
+        speed: 动画速度倍率
+
+    Returns:
+        统计结果
+    """
+    config, records = read_journal(journal_path)
+    events = [record.event for record in records if not isinstance(record.event, KeyframeEvent)]
+
+    pygame.init()
+    screen = pygame.display.set_mode(DEFAULT_WINDOW_SIZE)
+    client = GameClient(config, screen)
+    client.animation_mgr.set_speed(speed)
+    game_state.set_state(GameStateEnum.WAITING)
+    for event in events:
+        communicator.send_to_frontend(event)
+
+    handled = 0
+    handle_backend_event = client.handle_backend_event
+
+    def counting_handle(event):
+        nonlocal handled
+        handled += 1
+        handle_backend_event(event)
+
+    client.handle_backend_event = counting_handle
+
+    frame_times, update_times, draw_times, frame_allocs = [], [], [], []
+    if track_allocations:
+        tracemalloc.start()
+    start = time.perf_counter()
+    frames = 0
+    while frames < max_frames and game_state.state != GameStateEnum.ENDED:
+        if track_allocations:
+            tracemalloc.reset_peak()
+            alloc_base = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        client.drain_backend_events()
+        pygame.event.pump()
+        t1 = time.perf_counter()
+        client.animation_mgr.update(FRAME_DT)
+        t2 = time.perf_counter()
+        client.renderer.draw()
+        t3 = time.perf_counter()
+        if track_allocations:
+            frame_allocs.append(tracemalloc.get_traced_memory()[1] - alloc_base)
+        # 前端的ACK没有后端消费，直接丢弃
+        while communicator.receive_from_frontend() is not None:
+            pass
+        frame_times.append(t3 - t0)
+        update_times.append(t2 - t1)
+        draw_times.append(t3 - t2)
+        frames += 1
+        if client.is_idle():
+            break
+    elapsed = time.perf_counter() - start
+    if track_allocations:
+        tracemalloc.stop()
+    pygame.quit()
+
+    frame_times.sort()
+    result = {
+        "frames": frames,
+        "events": handled,
+        "wall_time": elapsed,
+        "events_per_second": handled / elapsed if elapsed > 0 else 0.0,
+        "frame_ms": {q: percentile(frame_times, q) * 1000 for q in (50, 90, 99, 100)},
+        "update_ms_total": sum(update_times) * 1000,
+        "draw_ms_total": sum(draw_times) * 1000,
+        "sprites_created": client.animation_mgr.sprite_pool.created,
+        "sprites_reused": client.animation_mgr.sprite_pool.reused,
+    }
+    if track_allocations:
+        frame_allocs.sort()
+        result["alloc_kb_per_frame"] = {q: percentile(frame_allocs, q) / 1024 for q in (50, 99)}
+    return result
+
+
+def print_report(result: dict):
+    print(f"帧数: {result['frames']}，事件数: {result['events']}，耗时: {result['wall_time']:.2f}s，"
+          f"每秒事件数: {result['events_per_second']:.1f}")
+    print("帧耗时(ms): " + "  ".join(f"p{q}={v:.3f}" for q, v in result["frame_ms"].items()))
+    print(f"AnimationManager.update 总耗时: {result['update_ms_total']:.1f}ms，Renderer.draw 总耗时: {result['draw_ms_total']:.1f}ms")
+    print(f"精灵: 新建 {result['sprites_created']}，复用 {result['sprites_reused']}")
+    if "alloc_kb_per_frame" in result:
+        print("每帧分配(KB): " + "  ".join(f"p{q}={v:.1f}" for q, v in result["alloc_kb_per_frame"].items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='前端性能基准（SDL dummy 驱动，无需显示器）')
+    parser.add_argument('-j', '--journal', type=str, default=None, help='事件日志文件（默认现场用规则AI跑一局）')
+    parser.add_argument('--seed', type=int, default=0, help='现场对局的随机种子')
+    parser.add_argument('--frames', type=int, default=100000, help='最多运行的帧数')
+    parser.add_argument('--speed', type=float, default=1.0, help='动画速度倍率')
+    parser.add_argument('--allocations', action='store_true', help='统计每帧分配的内存（tracemalloc）')
+    parser.add_argument('--json', type=str, default=None, help='把结果写入JSON文件')
+    args = parser.parse_args()
+
+    journal_path = os.path.abspath(args.journal) if args.journal else None
+    json_path = os.path.abspath(args.json) if args.json else None
+    # 资源路径相对于项目根目录
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    scripted = journal_path is None
+    if scripted:
+        fd, journal_path = tempfile.mkstemp(suffix=".zgsj")
+        os.close(fd)
+        record_scripted_game(journal_path, args.seed)
+    try:
+        result = run_benchmark(journal_path, args.frames, args.allocations, args.speed)
+    finally:
+        if scripted:
+            os.remove(journal_path)
+    print_report(result)
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
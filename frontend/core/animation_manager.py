@@ -1,4 +1,4 @@
-
+import time
 import pygame
 from frontend.ui.card_sprite import CardSprite
 from frontend.core.renderer import Renderer
@@ -6,112 +6,183 @@ from frontend.config.card_config import CardConfig
 from config.enums import EffectName
 from frontend.ui.effect_sprite import EffectSprite
 from frontend.core.game_state import game_state, GameStateEnum
-DEFAULT_ANIM_SPEED = 30  # 每帧移动像素数
+from frontend.core.sprite_pool import SpritePool
+DEFAULT_ANIM_SPEED = 30  # 每帧移动像素数（按 REFERENCE_FPS 换算成每秒移动的像素数）
 PLAY_CARD_ANIM_SPEED = 30
+REFERENCE_FPS = 30  # 动画速度和 duration_frames 所对应的帧率
+MAX_FRAME_TIME = 0.1  # 单帧最多推进的时间（秒），避免卡顿后动画直接跳到终点
+MIN_SPEED, MAX_SPEED = 0.25, 8.0  # 全局速度倍率范围
+
+
+def ease_out_cubic(t: float) -> float:
+    """缓出：开始快、接近终点时减速"""
+    t = 1.0 - t
+    return 1.0 - t * t * t
+
+
 class Animation:
-    def __init__(self, sprite: CardSprite, target_pos: tuple,  on_complete=None):
+    """一个正在播放的动画（移动的牌，或在原地显示一段时间的特效/展示牌）"""
+    __slots__ = ("sprite", "start_pos", "target_pos", "elapsed", "duration", "on_complete", "blocking", "moving")
+
+    def __init__(self, sprite, start_pos: tuple, target_pos: tuple, duration: float, on_complete=None, blocking=True, moving=True):
         self.sprite = sprite
+        self.start_pos = start_pos
         self.target_pos = target_pos
-        self.is_complete = False
-        # 结束后的回调函数类型应该是什么
-        self.on_complete = on_complete if on_complete else lambda: None
-class Effect:
-    def __init__(self, sprite: EffectSprite | CardSprite, duration_frames: int, on_complete=None):
-        self.sprite = sprite
-        self.duration_frames = duration_frames
+        self.elapsed = 0.0  # 已播放的时间（秒，已乘以速度倍率）
+        self.duration = duration  # 总时长（秒）
         self.on_complete = on_complete if on_complete else lambda: None
+        # 是否需要按顺序播放（False 表示可以和其他不需要按顺序播放的动画同时播放，如摸牌）
+        self.blocking = blocking
+        self.moving = moving
+
 
 class AnimationManager:
     def __init__(self, renderer: Renderer):
         self.renderer = renderer
-        self.active_animations = []
-        self.show_effects = []
+        self.active_animations = []  # 正在播放的动画（移动和原地特效放在同一个列表里）
+        self.speed = 1.0  # 全局速度倍率
+        self.max_speed = MAX_SPEED  # 速度倍率上限（回放等场景可以调高）
+        # 为True时新加入的动画不播放，直接完成并调用回调（快进时由 GameClient 设置）
+        self.instant = False
+        self._last_update = None
+        self.sprite_pool = SpritePool()
+
+    def set_speed(self, speed: float):
+        """设置全局速度倍率"""
+        self.speed = min(max(speed, MIN_SPEED), self.max_speed)
 
     def add_draw_card_animation(self, card_config: CardConfig, to_pos: tuple, face_up = True, on_complete=None):
-        game_state.set_state(GameStateEnum.ANIMATING)
-        start_pos = self.renderer.deck_center_pos
-        end_pos = to_pos
-        card_sprite = CardSprite(start_pos, card_config, face_up=face_up, speed=DEFAULT_ANIM_SPEED, asset_mgr=self.renderer.asset_mgr)
-        card_sprite.rect.center = start_pos
-        self.renderer.add_sprite(card_sprite)
-        self.add_animation(card_sprite, end_pos, on_complete)
+        self._add_card_move(card_config, self.renderer.deck_center_pos, to_pos, face_up, DEFAULT_ANIM_SPEED, on_complete, blocking=False)
 
     def add_play_card_animation(self, card_config: CardConfig, from_pos: tuple, to_pos: tuple, on_complete=None):
-        game_state.set_state(GameStateEnum.ANIMATING)
-        start_pos = from_pos
-        end_pos = to_pos
-        card_sprite = CardSprite(start_pos, card_config, face_up=True, speed=PLAY_CARD_ANIM_SPEED, asset_mgr=self.renderer.asset_mgr)
-        card_sprite.rect.center = start_pos
-        self.renderer.add_sprite(card_sprite)
-        self.add_animation(card_sprite, end_pos, on_complete)
+        self._add_card_move(card_config, from_pos, to_pos, True, PLAY_CARD_ANIM_SPEED, on_complete)
 
     def add_discard_card_animation(self, card_config: CardConfig, from_pos: tuple, to_pos: tuple, on_complete=None):
-        game_state.set_state(GameStateEnum.ANIMATING)
-        start_pos = from_pos
-        end_pos = to_pos
-        card_sprite = CardSprite(start_pos, card_config, face_up=True, speed=DEFAULT_ANIM_SPEED, asset_mgr=self.renderer.asset_mgr)
-        card_sprite.rect.center = start_pos
-        self.renderer.add_sprite(card_sprite)
-        self.add_animation(card_sprite, end_pos, on_complete)
+        self._add_card_move(card_config, from_pos, to_pos, True, DEFAULT_ANIM_SPEED, on_complete)
 
     def add_steal_animation(self, card_config: CardConfig, from_pos: tuple, to_pos: tuple, on_complete=None):
         """
         播放夺牌动画：从被夺玩家位置（通常为角色位置）移动一张背面牌到接收者手牌位置。
         到达后回调用于把牌加入接收者视图并调整手牌计数。
         """
-        game_state.set_state(GameStateEnum.ANIMATING)
-        start_pos = from_pos
-        end_pos = to_pos
         # 使用背面牌进行动画，除非接收者是本地手牌（那会在回调中展示正面）
-        card_sprite = CardSprite(start_pos, card_config, face_up=False, speed=DEFAULT_ANIM_SPEED, asset_mgr=self.renderer.asset_mgr)
-        card_sprite.rect.center = start_pos
+        self._add_card_move(card_config, from_pos, to_pos, False, DEFAULT_ANIM_SPEED, on_complete, blocking=False)
+
+    def _add_card_move(self, card_config: CardConfig, start_pos: tuple, end_pos: tuple, face_up: bool, speed: int, on_complete=None, blocking=True):
+        game_state.set_state(GameStateEnum.ANIMATING)
+        if self.instant:
+            self._complete(on_complete)
+            return
+        card_sprite = self._acquire_card_sprite(start_pos, card_config, face_up, speed)
         self.renderer.add_sprite(card_sprite)
-        self.add_animation(card_sprite, end_pos, on_complete)
+        self.add_animation(card_sprite, end_pos, on_complete, blocking)
 
-    def add_animation(self, sprite: CardSprite, target_pos, on_complete=None):
+    def add_animation(self, sprite: CardSprite, target_pos, on_complete=None, blocking=True):
         sprite.start_move_to(target_pos)
-        self.active_animations.append(Animation(sprite, target_pos, on_complete))
+        start_pos = sprite.rect.center
+        distance = ((target_pos[0] - start_pos[0]) ** 2 + (target_pos[1] - start_pos[1]) ** 2) ** 0.5
+        pixels_per_second = sprite.anim_speed * REFERENCE_FPS
+        duration = distance / pixels_per_second if pixels_per_second > 0 else 0.0
+        self.active_animations.append(Animation(sprite, start_pos, target_pos, duration, on_complete, blocking))
 
     def add_effect(self, effect_code: EffectName, pos: tuple, duration_frames=60, on_complete=None):
         game_state.set_state(GameStateEnum.ANIMATING)
-        effect_sprite = EffectSprite(pos, effect_code, asset_mgr=self.renderer.asset_mgr)
-        self.renderer.add_sprite(effect_sprite)
-        self.show_effects.append(Effect(effect_sprite, duration_frames, on_complete))
+        if self.instant:
+            self._complete(on_complete)
+            return
+        effect_sprite = self._acquire_sprite(("effect", effect_code), pos, lambda: EffectSprite(pos, effect_code, asset_mgr=self.renderer.asset_mgr))
+        self._add_still(effect_sprite, pos, duration_frames, on_complete)
 
     def add_show_card(self, card_config: CardConfig, pos: tuple, duration_frames=60, on_complete=None):
         game_state.set_state(GameStateEnum.ANIMATING)
-        card_sprite = CardSprite(pos, card_config, face_up=True, speed=0, asset_mgr=self.renderer.asset_mgr)
-        self.renderer.add_sprite(card_sprite)
-        self.show_effects.append(Effect(card_sprite, duration_frames, on_complete))
-
-    def update(self):
-        for anim in self.active_animations[:]:
-            sprite = anim.sprite
-            if sprite.is_animating:
-                tx, ty = sprite.anim_target
-                cx, cy = sprite.rect.center
-                dx, dy = tx - cx, ty - cy
-                dist = (dx**2 + dy**2)**0.5
-                if dist < sprite.anim_speed:
-                    sprite.rect.center = sprite.anim_target
-                    sprite.is_animating = False
-                    self.active_animations.remove(anim)
-                    self.renderer.remove_sprite(sprite)
-                    anim.on_complete()
-                else:
-                    move_x = sprite.anim_speed * dx / dist
-                    move_y = sprite.anim_speed * dy / dist
-                    sprite.rect.center = (cx + move_x, cy + move_y)
-                    sprite.dirty = 1  # Mark as dirty for redraw
-        for effect in self.show_effects[:]:
-            effect_sprite, frames_left = effect.sprite, effect.duration_frames
-            frames_left -= 1
-            if frames_left <= 0:
-                self.renderer.remove_sprite(effect_sprite)
-                self.show_effects.remove(effect)
-                if effect.on_complete:
-                    effect.on_complete()
-            else:
-                index = self.show_effects.index(effect)
-                effect_sprite.dirty = 1  # Mark as dirty for redraw
-                self.show_effects[index] = (Effect(effect_sprite, frames_left, effect.on_complete))
\ No newline at end of file
+        if self.instant:
+            self._complete(on_complete)
+            return
+        card_sprite = self._acquire_card_sprite(pos, card_config, True, 0)
+        self._add_still(card_sprite, pos, duration_frames, on_complete)
+
+    def _acquire_card_sprite(self, pos: tuple, card_config: CardConfig, face_up: bool, speed: int) -> CardSprite:
+        key = ("card", card_config.name, card_config.suit, card_config.rank, face_up)
+        sprite = self._acquire_sprite(key, pos, lambda: CardSprite(pos, card_config, face_up=face_up, speed=speed, asset_mgr=self.renderer.asset_mgr))
+        sprite.anim_speed = speed
+        return sprite
+
+    def _acquire_sprite(self, key: tuple, pos: tuple, factory):
+        """从精灵池取出精灵并就地重置（位置、动画状态），池中没有时新建"""
+        sprite, reused = self.sprite_pool.acquire(key, factory)
+        sprite.pool_key = key
+        if reused:
+            sprite.is_animating = False
+            sprite.dirty = 1
+        sprite.rect.center = pos
+        return sprite
+
+    def _add_still(self, sprite, pos: tuple, duration_frames: int, on_complete=None):
+        self.renderer.add_sprite(sprite)
+        self.active_animations.append(Animation(sprite, pos, pos, duration_frames / REFERENCE_FPS, on_complete, moving=False))
+
+    def is_idle(self) -> bool:
+        """是否没有正在播放的动画和特效"""
+        return not self.active_animations
+
+    def has_blocking(self) -> bool:
+        """是否有需要按顺序播放的动画或特效正在播放"""
+        return any(anim.blocking for anim in self.active_animations)
+
+    def update(self, dt: float = None):
+        """按经过的时间推进所有动画
+
+        Args:
+            dt: 经过的时间（秒），默认取距上次调用的时间
+        """
+        now = time.perf_counter()
+        if dt is None:
+            dt = min(now - self._last_update, MAX_FRAME_TIME) if self._last_update is not None else 0.0
+        # 空闲时不累计时间，新动画从加入后的第一帧开始计时
+        self._last_update = now if self.active_animations else None
+        step = dt * self.speed
+
+        still_active = []
+        finished = []
+        for anim in self.active_animations:
+            anim.elapsed += step
+            if anim.elapsed >= anim.duration:
+                finished.append(anim)
+                continue
+            still_active.append(anim)
+            if anim.moving:
+                t = ease_out_cubic(anim.elapsed / anim.duration)
+                (sx, sy), (tx, ty) = anim.start_pos, anim.target_pos
+                anim.sprite.rect.center = (sx + (tx - sx) * t, sy + (ty - sy) * t)
+            anim.sprite.dirty = 1  # Mark as dirty for redraw
+        # 回调中加入的新动画进入新的列表
+        self.active_animations = still_active
+        for anim in finished:
+            self._finish(anim)
+
+    def finish_all(self):
+        """跳过：立即完成所有正在播放的动画（包括回调中接着加入的动画）"""
+        for _ in range(1000):
+            if not self.active_animations:
+                break
+            finished, self.active_animations = self.active_animations, []
+            for anim in finished:
+                self._finish(anim)
+        self._last_update = None
+        self.sprite_pool = SpritePool()
+
+    def _finish(self, anim: Animation):
+        sprite = anim.sprite
+        if anim.moving:
+            sprite.rect.center = anim.target_pos
+            sprite.is_animating = False
+        self.renderer.remove_sprite(sprite)
+        pool_key = getattr(sprite, "pool_key", None)
+        if pool_key is not None:
+            self.sprite_pool.release(pool_key, sprite)
+        self._complete(anim.on_complete)
+
+    def _complete(self, on_complete):
+        # 修改玩家视图的回调（如把牌加入手牌）会自行标记对应座位的面板
+        if on_complete:
+            on_complete()
@@ -1,3 +1,4 @@
+import math
 import os
 import pygame
 from config.enums import CardName, CharacterName, EffectName, PlayerIdentity
@@ -5,6 +6,8 @@ from config.enums import CardName, CharacterName, EffectName, PlayerIdentity
 class AssetManager:
     def __init__(self, asset_root=None):
         self._cache = {}
+        self._scaled_cache = {}  # (资源键, 尺寸) -> 缩放后的 Surface，窗口大小改变时清空
+        self.card_atlas = None  # 所有牌面拼成的一张大图，牌面是它的子图
 
         if asset_root is None:
             asset_root = os.path.join("frontend", "assets")
@@ -14,6 +17,73 @@ class AssetManager:
         self.character_base_path = os.path.join(asset_root, "characters")
         self.effect_base_path = os.path.join(asset_root, "effects")
 
+    def preload(self, character_names=None):
+        """启动时预加载资源，避免第一次用到时在渲染线程中读取图片造成卡顿
+
+        - 牌面（包括牌背和牌堆）拼成一张图集，各牌面是图集的子图
+        - 特效、选择图标、死亡特效
+        - 武将图（默认只加载 character_names 中的武将，None 表示全部）
+        """
+        self.build_card_atlas()
+        for code in EffectName:
+            self.get_effect_surface(code)
+        self.get_select_icon()
+        for identity in (PlayerIdentity.LORD, PlayerIdentity.LOYALIST, PlayerIdentity.REBEL, PlayerIdentity.TRAITOR):
+            self.get_death_effect_surface(identity)
+        for code in (character_names if character_names is not None else CharacterName):
+            self.get_character_surface(code)
+
+    def build_card_atlas(self):
+        """把 cards 目录下的牌面拼成一张图集，并以牌名为键缓存各牌面的子图"""
+        entries = [(("card", code.value), f"{code.value}.jpg") for code in CardName]
+        entries += [(("card", "back"), "back.jpg"), (("card", "deck"), "deck.jpg")]
+        images = []
+        for key, filename in entries:
+            path = os.path.join(self.card_base_path, filename)
+            if os.path.exists(path):
+                images.append((key, pygame.image.load(path).convert_alpha()))
+        if not images:
+            return
+        cell_w = max(surf.get_width() for _, surf in images)
+        cell_h = max(surf.get_height() for _, surf in images)
+        cols = math.ceil(math.sqrt(len(images)))
+        rows = math.ceil(len(images) / cols)
+        self.card_atlas = pygame.Surface((cols * cell_w, rows * cell_h), pygame.SRCALPHA).convert_alpha()
+        for i, (key, surf) in enumerate(images):
+            pos = ((i % cols) * cell_w, (i // cols) * cell_h)
+            self.card_atlas.blit(surf, pos)
+            self._cache[key] = self.card_atlas.subsurface(pygame.Rect(pos, surf.get_size()))
+
+    def get_scaled(self, key: tuple, size: tuple) -> pygame.Surface:
+        """获取缩放到指定尺寸的资源（同一资源同一尺寸只缩放一次）
+
+        Args:
+            key: 资源键（需已加载），如 ("card", "杀")、("character", "关羽")
+            size: (宽, 高)
+        """
+        scaled_key = (key, tuple(size))
+        surf = self._scaled_cache.get(scaled_key)
+        if surf is None:
+            surf = pygame.transform.smoothscale(self._cache[key], scaled_key[1])
+            self._scaled_cache[scaled_key] = surf
+        return surf
+
+    def get_scaled_card(self, code: CardName, size: tuple) -> pygame.Surface:
+        self.get_card_surface(code)
+        return self.get_scaled(("card", code.value), size)
+
+    def get_scaled_card_back(self, size: tuple) -> pygame.Surface:
+        self.get_card_back()
+        return self.get_scaled(("card", "back"), size)
+
+    def get_scaled_character(self, code: CharacterName, size: tuple) -> pygame.Surface:
+        self.get_character_surface(code)
+        return self.get_scaled(("character", code.value), size)
+
+    def clear_scaled_cache(self):
+        """清空缩放缓存（窗口大小改变后各视图的尺寸会变）"""
+        self._scaled_cache.clear()
+
     def get_card_surface(self, code: CardName) -> pygame.Surface:
         key = ("card", code.value)
         if key in self._cache:
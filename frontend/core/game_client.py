@@ -6,7 +6,7 @@ import queue
 from typing import Optional, Dict, Any
 from frontend.util.size import DEFAULT_WINDOW_SIZE
 from frontend.util.color import default_colors
-from config.enums import EffectName, CardName, EquipmentType, EquipmentName
+from config.enums import EffectName, CardName, EquipmentType, EquipmentName, ControlType
 
 from frontend.core.renderer import Renderer
 from frontend.core.animation_manager import AnimationManager
@@ -19,6 +19,13 @@ from communicator.communicator import communicator, AckEvent
 
 from communicator.comm_event import DebugEvent, AskPlayCardEvent, PlayCardResponseEvent, AskTargetEvent, TargetResponseEvent
 
+MAX_EVENTS_PER_FRAME = 64  # 每帧最多处理的后端事件数
+CONCURRENT_EVENTS = ("DrawCardEvent", "StealCardEvent")  # 动画可以同时播放的事件
+INSTANT_EVENTS = ("EquipChangeEvent", "DeathEvent", "CancelRequestEvent")  # 没有动画、直接更新状态的事件
+SELECTING_STATES = (GameStateEnum.SELECTING, GameStateEnum.SELECTING_TARGET)
+IDLE_WAIT_MS = 1000  # 空闲时最长阻塞等待的时间（毫秒）
+BACKEND_EVENT = pygame.event.custom_type()  # 后端投递了事件（用于唤醒空闲的前端）
+
 class GameClient:
     def __init__(self, config: SimpleGameConfig, screen: Optional[pygame.Surface]=None, clock: Optional[pygame.time.Clock]=None):
         self.config = config
@@ -30,12 +37,18 @@ class GameClient:
         self.winner_info = None  # 存储胜利信息
         self.selecting_cards = [] # 当前可选的牌列表
         self.selecting_targets = [] # 当前可选的目标列表
+        self.request_id = None # 当前选牌/选目标请求的编号（回复时带回）
+        self._next_event = None # 已取出但还不能处理的后端事件
+        # 快进：不涉及人类玩家的事件不播放动画，直接更新界面并ACK（观看AI对局时使用，按F切换）
+        self.fast_forward = False
+        self.human_seats = {i for i, p_cfg in enumerate(config.players_config) if getattr(p_cfg, 'control_type', None) == ControlType.HUMAN}
 
     def after_draw_card(self, card_config: CardConfig, to_player: int, event_id: int):
         # 返回draw_card_event的on_complete调用，处理牌局状态更新等
         player = self.renderer.player_views[to_player]
         player.add_card(card_config)
         player.card_cnt += 1
+        self.renderer.invalidate_player(to_player)
         communicator.send_to_backend(AckEvent(original_event_id=event_id, success=True, message="Draw card processed"))
         game_state.set_state(GameStateEnum.WAITING)
     def draw_card_event(self, card_config: CardConfig, to_player: int, event_id: int):
@@ -88,6 +101,7 @@ class GameClient:
         # 处理出牌事件，添加动画等
         from_pv = self.renderer.player_views[from_player]
         from_pv.card_cnt -= 1
+        self.renderer.invalidate_player(from_player)
         # 目的地位置（统一使用屏幕中心作为动画目标，后续在 after_play_card 中会根据 to_player 决定效果位置）
         to_pos = self.renderer.screen_center
 
@@ -114,6 +128,7 @@ class GameClient:
         player = self.renderer.player_views[player_id]
         old_hp = player.get_hp()
         player.update_hp(new_hp)
+        self.renderer.invalidate_player(player_id)
         if new_hp < old_hp:
             effect_pos = player.character_pos
             self.animation_mgr.add_effect(EffectName.DAMAGE, effect_pos, duration_frames=60, on_complete=lambda: self.set_waiting_and_ack(event_id=event_id))
@@ -135,6 +150,7 @@ class GameClient:
             player.card_cnt -= 1
         if player.is_self:
             player.remove_card(card)
+        self.renderer.invalidate_player(player_id)
         # 添加弃牌动画
         from_pos = player.character_pos if not player.is_self else player.card_center_pos
         to_pos = self.renderer.deck_center_pos
@@ -145,6 +161,7 @@ class GameClient:
         # 处理装备变化事件，更新装备栏等
         player = self.renderer.player_views[player_id]
         player.equipment[equip_type] = equip_name
+        self.renderer.invalidate_player(player_id)
         game_state.set_state(GameStateEnum.WAITING)
         communicator.send_to_backend(AckEvent(original_event_id=event_id, success=True, message="Equip change processed"))
 
@@ -152,152 +169,233 @@ class GameClient:
         # 处理角色死亡事件，播放动画等
         player = self.renderer.player_views[player_id]
         player.dead = True
+        self.renderer.invalidate_player(player_id)
         game_state.set_state(GameStateEnum.WAITING)
         communicator.send_to_backend(AckEvent(original_event_id=event_id, success=True, message="Death event processed"))
         # effect_pos = player.character_pos
         # self.animation_mgr.add_effect(EffectName.DEATH, effect_pos, duration_frames=90, on_complete=lambda: self.set_waiting_and_ack(event_id=event_id))
 
-    def run(self):
-        running = True
-        game_state.set_state(GameStateEnum.WAITING)
-        while running:
-            if game_state.state == GameStateEnum.WAITING:
-                event = communicator.receive_from_backend()
-                if event is not None:
-                    event_id = getattr(event, '_event_id', None)
-                    # 处理不同类型的事件
-                    if type(event).__name__ == "DrawCardEvent":
-                        simple_card_cfg = event.card_config
-                        card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-                        self.draw_card_event(card_cfg, event.to_player, event_id=event_id)
-
-                    elif type(event).__name__ == "PlayCardEvent":
-                        simple_card_cfg = event.card_config
-                        # 展示用卡片：如果后端提供了 conversion_display，优先使用它作为展示用卡牌
-                        conv_disp = getattr(event, 'conversion_display', None)
-                        if conv_disp:
-                            try:
-                                # conv_disp 可能是 CardName 枚举或字符串
-                                if isinstance(conv_disp, str):
-                                    from config.enums import CardName as _CardNameEnum
-                                    disp_name = _CardNameEnum[conv_disp]
-                                else:
-                                    disp_name = conv_disp
-                                display_card_cfg = CardConfig(card_name=disp_name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-                            except Exception:
-                                display_card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-                        else:
-                            display_card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-
-                        # 移除用卡片：优先使用后端传来的 original_card_name（原始牌名），否则使用 card_config.name
-                        removal_name = getattr(event, 'original_card_name', None) or simple_card_cfg.name
-                        try:
-                            from config.enums import CardName as _CardNameEnum
-                            if isinstance(removal_name, str):
-                                removal_card_name = _CardNameEnum[removal_name]
-                            else:
-                                removal_card_name = removal_name
-                        except Exception:
-                            removal_card_name = simple_card_cfg.name
-
-                        removal_card_cfg = CardConfig(card_name=removal_card_name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-
-                        # 构建生效卡（来自后端的 card_config）并传入 play_card_event
-                        effective_card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-                        # 传入展示卡、移除卡和生效卡，前端用展示卡做动画，用移除卡从手牌中匹配并删除，生效卡决定特效
-                        self.play_card_event(display_card_cfg, removal_card_cfg, effective_card_cfg, event.from_player, event.to_player, event_id=event_id)
-
-                    elif type(event).__name__ == "HPChangeEvent":
-                        self.change_hp_event(event.player_id, event.new_hp, event_id=event_id)
-
-                    elif type(event).__name__ == "DiscardCardEvent":
-                        simple_card_cfg = event.card_config
-                        card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-                        self.discard_card_event(card_cfg, event.player, event_id=event_id)
-
-                    elif type(event).__name__ == "StealCardEvent":
-                        # 处理夺牌事件：播放一张背面牌从被夺者移动到接收者，完成后更新视图手牌
-                        simple_card_cfg = event.card_config
-                        card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-                        from_pv = self.renderer.player_views[event.from_player]
-                        to_pv = self.renderer.player_views[event.to_player]
-
-                        # 调整被夺者手牌计数与视图（若被夺者是本地，则移除具体卡牌）
-                        if not (card_cfg.name.value in []):
-                            pass
-                        # 被夺者手牌数先减1（界面计数）
-                        if hasattr(from_pv, 'card_cnt'):
-                            from_pv.card_cnt = max(0, from_pv.card_cnt - 1)
-                        if from_pv.is_self:
-                            # 如果被夺者是本地，移除与 card_cfg 匹配的一张手牌（若存在）
-                            try:
-                                from_pv.remove_card(card_cfg)
-                            except Exception:
-                                pass
-
-                        # 目标接收位置：若接收者是本地，使用手牌中心；否则使用角色位置
-                        if to_pv.is_self:
-                            target_pos = to_pv.card_center_pos
-                        else:
-                            target_pos = to_pv.character_pos
-
-                        # 动画完成后的回调：把牌加入接收者视图或更新计数，然后 ACK 后端
-                        def _on_steal_complete():
-                            try:
-                                if to_pv.is_self:
-                                    to_pv.add_card(card_cfg)
-                                    to_pv.card_cnt += 1
-                                else:
-                                    # 非本地玩家，仅增加计数
-                                    to_pv.card_cnt += 1
-                            finally:
-                                self.set_waiting_and_ack(event_id=event_id)
-
-                        # 播放夺牌动画（使用背面到目标）
-                        from_pos = from_pv.character_pos if not from_pv.is_self else from_pv.card_center_pos
-                        to_pos = target_pos
-                        if to_pos != (None, None):
-                            self.animation_mgr.add_steal_animation(card_cfg, from_pos, to_pos, on_complete=_on_steal_complete)
-                        else:
-                            # 若无目标位置，直接完成回调
-                            _on_steal_complete()
-
-                    elif type(event).__name__ == "EquipChangeEvent":
-                        self.equip_change_event(event.player_id, event.equip_name, event.equip_type, event_id=event_id)
-
-                    elif type(event).__name__ == "DeathEvent":
-                        self.death_event(event.player_id, event_id=event_id)
-
-                    elif type(event).__name__ == "GameOverEvent":
-                        self.winner_info = event.winner_info
-                        game_state.set_state(GameStateEnum.ENDED)
-                        # 不需要ACK，直接结束
-
-                    elif type(event).__name__ == "AskPlayCardEvent":
-                        self.selecting_cards = event.available_cards
-                        game_state.set_state(GameStateEnum.SELECTING)
-                        print(f"[前端] 收到选牌请求，可选: {len(self.selecting_cards)} 张 (右键跳过)")
-
-                    elif type(event).__name__ == "AskTargetEvent":
-                        self.selecting_targets = event.available_targets
-                        game_state.set_state(GameStateEnum.SELECTING_TARGET)
-                        print(f"[前端] 收到选目标请求，可选: {self.selecting_targets} (右键取消)")
-                        # 标记可选目标
-                        for pv in self.renderer.player_views:
-                            if pv.id in self.selecting_targets:
-                                pv.is_target_selectable = True
-                            else:
-                                pv.is_target_selectable = False
+    def event_ready(self, event) -> bool:
+        """判断后端事件现在能否处理
+
+        - 摸牌、夺牌：动画互不影响，只要没有需要按顺序播放的动画就可以同时播放
+        - 装备变化、死亡、血量不变：直接更新状态，不需要等待
+        - 其余事件（出牌、弃牌、血量变化、选牌/选目标请求、游戏结束）：等所有动画播完再处理
+        """
+        if self.animation_mgr.has_blocking():
+            return False
+        event_name = type(event).__name__
+        if event_name in CONCURRENT_EVENTS or event_name in INSTANT_EVENTS:
+            return True
+        if event_name == "HPChangeEvent" and event.new_hp == self.renderer.player_views[event.player_id].get_hp():
+            return True
+        return self.animation_mgr.is_idle()
+
+    def drain_backend_events(self):
+        """在一帧内处理所有现在就能处理的后端事件（遇到需要等待的事件时留到之后的帧）"""
+        for _ in range(MAX_EVENTS_PER_FRAME):
+            selecting = game_state.state in SELECTING_STATES
+            if game_state.state not in (GameStateEnum.WAITING, GameStateEnum.ANIMATING) and not selecting:
+                break
+            if self._next_event is None:
+                self._next_event = communicator.receive_from_backend()
+                if self._next_event is None:
+                    break
+            # 选择中只处理后端取消请求的事件
+            if selecting and type(self._next_event).__name__ != "CancelRequestEvent":
+                break
+            if not self.event_ready(self._next_event):
+                break
+            event, self._next_event = self._next_event, None
+            self.animation_mgr.instant = self.fast_forward and not self.involves_human(event)
+            try:
+                self.handle_backend_event(event)
+            finally:
+                self.animation_mgr.instant = False
+
+    def is_idle(self) -> bool:
+        """是否空闲：没有动画、界面不需要重绘、也没有待处理的后端事件"""
+        return (self.animation_mgr.is_idle() and not self.renderer.board_dirty
+                and self._next_event is None and communicator.btf_queue.empty())
+
+    def _wake_up(self):
+        """后端投递事件后唤醒阻塞在 pygame.event.wait 上的前端（在后端线程中调用）"""
+        try:
+            pygame.event.post(pygame.event.Event(BACKEND_EVENT))
+        except pygame.error:
+            pass
 
+    def _wait_events(self) -> list:
+        """取出本帧的 Pygame 事件；空闲时阻塞，直到有输入或后端事件"""
+        if not self.is_idle():
+            return pygame.event.get()
+        ev = pygame.event.wait(IDLE_WAIT_MS)
+        if ev.type == pygame.NOEVENT:
+            return []
+        return [ev] + pygame.event.get()
+
+    def involves_human(self, event) -> bool:
+        """事件是否涉及人类玩家（出牌者、目标、摸牌者等）"""
+        for attr in ('player_id', 'player', 'from_player', 'to_player'):
+            if getattr(event, attr, None) in self.human_seats:
+                return True
+        return False
+
+    def handle_backend_event(self, event):
+        """处理一个后端事件"""
+        event_id = getattr(event, '_event_id', None)
+        # 处理不同类型的事件
+        if type(event).__name__ == "DrawCardEvent":
+            simple_card_cfg = event.card_config
+            card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
+            self.draw_card_event(card_cfg, event.to_player, event_id=event_id)
+
+        elif type(event).__name__ == "PlayCardEvent":
+            simple_card_cfg = event.card_config
+            # 展示用卡片：如果后端提供了 conversion_display，优先使用它作为展示用卡牌
+            conv_disp = getattr(event, 'conversion_display', None)
+            if conv_disp:
+                try:
+                    # conv_disp 可能是 CardName 枚举或字符串
+                    if isinstance(conv_disp, str):
+                        from config.enums import CardName as _CardNameEnum
+                        disp_name = _CardNameEnum[conv_disp]
                     else:
-                        pass
+                        disp_name = conv_disp
+                    display_card_cfg = CardConfig(card_name=disp_name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
+                except Exception:
+                    display_card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
+            else:
+                display_card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
+
+            # 移除用卡片：优先使用后端传来的 original_card_name（原始牌名），否则使用 card_config.name
+            removal_name = getattr(event, 'original_card_name', None) or simple_card_cfg.name
+            try:
+                from config.enums import CardName as _CardNameEnum
+                if isinstance(removal_name, str):
+                    removal_card_name = _CardNameEnum[removal_name]
                 else:
+                    removal_card_name = removal_name
+            except Exception:
+                removal_card_name = simple_card_cfg.name
+
+            removal_card_cfg = CardConfig(card_name=removal_card_name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
+
+            # 构建生效卡（来自后端的 card_config）并传入 play_card_event
+            effective_card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
+            # 传入展示卡、移除卡和生效卡，前端用展示卡做动画，用移除卡从手牌中匹配并删除，生效卡决定特效
+            self.play_card_event(display_card_cfg, removal_card_cfg, effective_card_cfg, event.from_player, event.to_player, event_id=event_id)
+
+        elif type(event).__name__ == "HPChangeEvent":
+            self.change_hp_event(event.player_id, event.new_hp, event_id=event_id)
+
+        elif type(event).__name__ == "DiscardCardEvent":
+            simple_card_cfg = event.card_config
+            card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
+            self.discard_card_event(card_cfg, event.player, event_id=event_id)
+
+        elif type(event).__name__ == "StealCardEvent":
+            # 处理夺牌事件：播放一张背面牌从被夺者移动到接收者，完成后更新视图手牌
+            simple_card_cfg = event.card_config
+            card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
+            from_pv = self.renderer.player_views[event.from_player]
+            to_pv = self.renderer.player_views[event.to_player]
+
+            # 调整被夺者手牌计数与视图（若被夺者是本地，则移除具体卡牌）
+            if not (card_cfg.name.value in []):
+                pass
+            # 被夺者手牌数先减1（界面计数）
+            if hasattr(from_pv, 'card_cnt'):
+                from_pv.card_cnt = max(0, from_pv.card_cnt - 1)
+            self.renderer.invalidate_player(event.from_player)
+            if from_pv.is_self:
+                # 如果被夺者是本地，移除与 card_cfg 匹配的一张手牌（若存在）
+                try:
+                    from_pv.remove_card(card_cfg)
+                except Exception:
                     pass
 
-            elif game_state.state == GameStateEnum.ANIMATING:
-                pass
-            elif game_state.state == GameStateEnum.SELECTING:
-                pass
+            # 目标接收位置：若接收者是本地，使用手牌中心；否则使用角色位置
+            if to_pv.is_self:
+                target_pos = to_pv.card_center_pos
+            else:
+                target_pos = to_pv.character_pos
+
+            # 动画完成后的回调：把牌加入接收者视图或更新计数，然后 ACK 后端
+            def _on_steal_complete():
+                try:
+                    if to_pv.is_self:
+                        to_pv.add_card(card_cfg)
+                        to_pv.card_cnt += 1
+                    else:
+                        # 非本地玩家，仅增加计数
+                        to_pv.card_cnt += 1
+                    self.renderer.invalidate_player(event.to_player)
+                finally:
+                    self.set_waiting_and_ack(event_id=event_id)
+
+            # 播放夺牌动画（使用背面到目标）
+            from_pos = from_pv.character_pos if not from_pv.is_self else from_pv.card_center_pos
+            to_pos = target_pos
+            if to_pos != (None, None):
+                self.animation_mgr.add_steal_animation(card_cfg, from_pos, to_pos, on_complete=_on_steal_complete)
+            else:
+                # 若无目标位置，直接完成回调
+                _on_steal_complete()
+
+        elif type(event).__name__ == "EquipChangeEvent":
+            self.equip_change_event(event.player_id, event.equip_name, event.equip_type, event_id=event_id)
+
+        elif type(event).__name__ == "DeathEvent":
+            self.death_event(event.player_id, event_id=event_id)
+
+        elif type(event).__name__ == "GameOverEvent":
+            self.winner_info = event.winner_info
+            game_state.set_state(GameStateEnum.ENDED)
+            # 不需要ACK，直接结束
+
+        elif type(event).__name__ == "AskPlayCardEvent":
+            self.request_id = getattr(event, 'request_id', None)
+            self.selecting_cards = event.available_cards
+            game_state.set_state(GameStateEnum.SELECTING)
+            self.renderer.invalidate()
+            print(f"[前端] 收到选牌请求，可选: {len(self.selecting_cards)} 张 (右键跳过)")
+
+        elif type(event).__name__ == "AskTargetEvent":
+            self.request_id = getattr(event, 'request_id', None)
+            self.selecting_targets = event.available_targets
+            game_state.set_state(GameStateEnum.SELECTING_TARGET)
+            print(f"[前端] 收到选目标请求，可选: {self.selecting_targets} (右键取消)")
+            # 标记可选目标
+            for pv in self.renderer.player_views:
+                if pv.id in self.selecting_targets:
+                    pv.is_target_selectable = True
+                else:
+                    pv.is_target_selectable = False
+            self.renderer.invalidate()
+
+        elif type(event).__name__ == "CancelRequestEvent":
+            # 后端已放弃等待（超时采用了默认动作），退出选择状态
+            if event.request_id == self.request_id and game_state.state in SELECTING_STATES:
+                print(f"[前端] 请求 {event.request_id} 已被后端取消: {event.reason}")
+                self.selecting_cards = []
+                self.selecting_targets = []
+                for pv in self.renderer.player_views:
+                    pv.is_target_selectable = False
+                self.request_id = None
+                game_state.set_state(GameStateEnum.WAITING)
+                self.renderer.invalidate()
+
+        else:
+            pass
+
+    def run(self):
+        running = True
+        game_state.set_state(GameStateEnum.WAITING)
+        communicator.add_frontend_listener(self._wake_up)
+        while running:
+            if game_state.state in (GameStateEnum.WAITING, GameStateEnum.ANIMATING) or game_state.state in SELECTING_STATES:
+                self.drain_backend_events()
             elif game_state.state == GameStateEnum.PAUSED:
                 pass
             elif game_state.state == GameStateEnum.ENDED:
@@ -305,22 +403,36 @@ class GameClient:
             else:
                 pass
 
-            # 处理本地 Pygame 事件
-            for ev in pygame.event.get():
+            # 处理本地 Pygame 事件（空闲时阻塞等待，不再空转重绘）
+            for ev in self._wait_events():
                 if ev.type == pygame.QUIT:
                     running = False
                 elif ev.type == pygame.VIDEORESIZE:
                     # 更新窗口大小并通知渲染器
                     self.screen = pygame.display.set_mode((ev.w, ev.h), pygame.RESIZABLE)
                     self.renderer.handle_resize(self.screen)
+
+                elif ev.type == pygame.KEYDOWN:
+                    if ev.key == pygame.K_SPACE:
+                        # 跳过正在播放的动画
+                        self.animation_mgr.finish_all()
+                    elif ev.key == pygame.K_f:
+                        self.fast_forward = not self.fast_forward
+                        print(f"[前端] 快进: {'开' if self.fast_forward else '关'}")
+                    elif ev.key in (pygame.K_UP, pygame.K_DOWN):
+                        factor = 2.0 if ev.key == pygame.K_UP else 0.5
+                        self.animation_mgr.set_speed(self.animation_mgr.speed * factor)
+                        print(f"[前端] 动画速度: {self.animation_mgr.speed}x")
                 
                 elif ev.type == pygame.MOUSEMOTION:
                     # 处理鼠标悬停
                     for pv in self.renderer.player_views:
                         if pv.is_self:
                             pv.handle_mouse_motion(ev.pos)
+                            self.renderer.invalidate_player(pv.id)
 
                 elif ev.type == pygame.MOUSEBUTTONDOWN:
+                    self.renderer.invalidate()
                     if ev.button == 1:  # 左键
                         mouse_pos = ev.pos
                         
@@ -345,7 +457,7 @@ class GameClient:
                                 
                                 if selected_idx != -1:
                                     print(f"[前端] 选择了第 {selected_idx} 张牌: {clicked_card_view.config.name}")
-                                    communicator.send_to_backend(PlayCardResponseEvent(card_index=selected_idx))
+                                    communicator.send_to_backend(PlayCardResponseEvent(card_index=selected_idx, request_id=self.request_id))
                                     game_state.set_state(GameStateEnum.WAITING)
                                     self.selecting_cards = []
                                 else:
@@ -361,7 +473,7 @@ class GameClient:
                             
                             if clicked_target_id is not None:
                                 print(f"[前端] 选择了目标: {clicked_target_id}")
-                                communicator.send_to_backend(TargetResponseEvent(target_ids=[clicked_target_id]))
+                                communicator.send_to_backend(TargetResponseEvent(target_ids=[clicked_target_id], request_id=self.request_id))
                                 game_state.set_state(GameStateEnum.WAITING)
                                 # 清除标记
                                 for pv in self.renderer.player_views:
@@ -378,12 +490,12 @@ class GameClient:
                     elif ev.button == 3: # 右键
                         if game_state.state == GameStateEnum.SELECTING:
                             print("[前端] 跳过出牌")
-                            communicator.send_to_backend(PlayCardResponseEvent(card_index=-1))
+                            communicator.send_to_backend(PlayCardResponseEvent(card_index=-1, request_id=self.request_id))
                             game_state.set_state(GameStateEnum.WAITING)
                             self.selecting_cards = []
                         elif game_state.state == GameStateEnum.SELECTING_TARGET:
                             print("[前端] 取消选择目标")
-                            communicator.send_to_backend(TargetResponseEvent(target_ids=None))
+                            communicator.send_to_backend(TargetResponseEvent(target_ids=None, request_id=self.request_id))
                             game_state.set_state(GameStateEnum.WAITING)
                             # 清除标记
                             for pv in self.renderer.player_views:
@@ -410,7 +522,7 @@ class GameClient:
                             
                             if found_idx != -1:
                                 print(f"[前端] 选择了第 {found_idx} 张牌")
-                                communicator.send_to_backend(PlayCardResponseEvent(card_index=found_idx))
+                                communicator.send_to_backend(PlayCardResponseEvent(card_index=found_idx, request_id=self.request_id))
                                 game_state.set_state(GameStateEnum.WAITING)
                                 self.selecting_cards = []
                             else:
@@ -419,7 +531,7 @@ class GameClient:
                     elif ev.button == 3: # 右键
                         if game_state.state == GameStateEnum.SELECTING:
                              print("[前端] 跳过出牌")
-                             communicator.send_to_backend(PlayCardResponseEvent(card_index=-1))
+                             communicator.send_to_backend(PlayCardResponseEvent(card_index=-1, request_id=self.request_id))
                              game_state.set_state(GameStateEnum.WAITING)
                              self.selecting_cards = []
 
@@ -428,6 +540,7 @@ class GameClient:
             self.clock.tick(30)
 
         # 退出清理
+        communicator.remove_frontend_listener(self._wake_up)
         try:
             self._stop_event.set()
         except Exception:
@@ -1,4 +1,5 @@
 import pygame
+from functools import lru_cache
 from config.simple_card_config import SimpleGameConfig, SimpleCardConfig
 from config.enums import CardName
 from frontend.util.color import default_colors
@@ -7,22 +8,48 @@ from config.enums import ControlType
 from frontend.core.asset_manager import AssetManager
 from frontend.ui.card_sprite import CardSprite
 from frontend.config.card_config import CardConfig
+
+
+@lru_cache(maxsize=None)
+def get_font(name: str, size: int) -> pygame.font.Font:
+    """获取字体（SysFont 需要查找系统字体，开销很大，只创建一次）"""
+    return pygame.font.SysFont(name, size)
+
+
+@lru_cache(maxsize=1024)
+def render_text(text: str, size: int = 20, color: tuple = (255, 255, 255), font_name: str = "SimHei") -> pygame.Surface:
+    """渲染文字（同样的文字只渲染一次，返回的 Surface 不要修改）"""
+    return get_font(font_name, size).render(text, True, color)
+
+
 class Renderer:
     def __init__(self, config: SimpleGameConfig, screen: pygame.Surface):
         self.config = config
         self.screen = screen
-        self.bg = pygame.Surface(self.screen.get_size())
-        self.bg.fill(default_colors["greybrown"])
         self.asset_mgr = AssetManager()
+        self.asset_mgr.preload(character_names={p_cfg.character_name for p_cfg in config.players_config})
         self.all_sprites = pygame.sprite.LayeredDirty()
         # Initialize card sprites in deck:
         self.deck_center_pos = self._get_deck_center_pos()
         self.screen_center = (self.screen.get_width() // 2, self.deck_center_pos[1])
-        
+
         # 调试按钮区域
         self.debug_win_rect = pygame.Rect(10, 10, 80, 30)
         self.debug_lose_rect = pygame.Rect(100, 10, 80, 30)
 
+        # 静态层（背景、调试按钮、牌堆）只在初始化和改变窗口大小时绘制一次；
+        # 每个座位的面板（玩家视图）缓存为一张图，只在 invalidate_player() 之后重新绘制；
+        # 牌桌层 = 背景 + 各座位面板 + 调试按钮和牌堆，只在有面板变化后重新合成，
+        # 其余帧只重绘移动的精灵所在的区域（LayeredDirty 返回的脏矩形）
+        self.bg = None
+        self.static_overlay = None
+        self.board = None
+        self.board_dirty = True
+        self._panel_scratch = None  # 绘制面板用的透明画布
+        self._panels = {}  # player_id -> (面板图, 位置)
+        self._dirty_panels = set()
+        self._build_static_layers()
+
         # Initialize player view:
         self.player_views = []
         total_players = len(config.players_config)
@@ -63,53 +90,96 @@ class Renderer:
 
             pv = PlayerView(config, p_cfg, i, is_self, asset_mgr=self.asset_mgr, character_pos=char_pos, card_center_pos=card_center)
             self.player_views.append(pv)
-    
+        self.invalidate()
+
     def add_sprite(self, sprite: CardSprite):
         self.all_sprites.add(sprite)
     def remove_sprite(self, sprite: CardSprite):
         self.all_sprites.remove(sprite)
 
+    def invalidate(self):
+        """标记所有座位的面板需要重新绘制（窗口大小改变、多个座位的选择状态改变后调用）"""
+        self._dirty_panels.update(range(len(self.player_views)))
+        self.board_dirty = True
+
+    def invalidate_player(self, player_id: int):
+        """标记一个座位的面板需要重新绘制（该玩家视图的血量、手牌、装备等改变后调用）"""
+        self._dirty_panels.add(player_id)
+        self.board_dirty = True
+
     def handle_resize(self, new_screen: pygame.Surface):
         """处理窗口大小改变事件"""
         self.screen = new_screen
-        # 重新创建背景
-        self.bg = pygame.Surface(self.screen.get_size())
-        self.bg.fill(default_colors["greybrown"])
         # 重新计算位置
         self.deck_center_pos = self._get_deck_center_pos()
         self.screen_center = (self.screen.get_width() // 2, self.deck_center_pos[1])
+        # 缩放过的资源按新尺寸重新缩放，并重新绘制静态层
+        self.asset_mgr.clear_scaled_cache()
+        self._build_static_layers()
         # 通知所有玩家视图更新位置
         for player_view in self.player_views:
             player_view.handle_resize(self.screen)
+        self.invalidate()
 
     def _get_deck_center_pos(self):
         screen_width, screen_height = pygame.display.get_surface().get_size()
         return (screen_width - 100, screen_height // 2)
+
+    def _build_static_layers(self):
+        """绘制背景和静态覆盖层（调试按钮、牌堆）"""
+        size = self.screen.get_size()
+        self.bg = pygame.Surface(size).convert()
+        self.bg.fill(default_colors["greybrown"])
+        self.board = pygame.Surface(size).convert()
+        self._panel_scratch = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+
+        self.static_overlay = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        # 调试按钮
+        pygame.draw.rect(self.static_overlay, (0, 200, 0), self.debug_win_rect)
+        pygame.draw.rect(self.static_overlay, (200, 0, 0), self.debug_lose_rect)
+        self.static_overlay.blit(render_text("一键胜利"), (self.debug_win_rect.x + 5, self.debug_win_rect.y + 5))
+        self.static_overlay.blit(render_text("一键失败"), (self.debug_lose_rect.x + 5, self.debug_lose_rect.y + 5))
+        # 牌堆
+        self.draw_deck(self.static_overlay)
+
     def draw_deck(self, screen: pygame.Surface):
         deck_surf = self.asset_mgr.get_deck_surface()
         rect = deck_surf.get_rect(center=self.deck_center_pos)
         screen.blit(deck_surf, rect.topleft)
 
+    def _render_panel(self, player_id: int):
+        """把玩家视图绘制到透明画布上，裁出有内容的区域作为该座位的面板"""
+        self._panel_scratch.fill((0, 0, 0, 0))
+        self.player_views[player_id].draw(self._panel_scratch)
+        rect = self._panel_scratch.get_bounding_rect()
+        self._panels[player_id] = (self._panel_scratch.subsurface(rect).copy(), rect.topleft)
+
+    def _compose_board(self):
+        """合成牌桌层：背景 + 各座位面板（只重新绘制变化了的面板） + 静态覆盖层"""
+        for player_id in self._dirty_panels:
+            self._render_panel(player_id)
+        self._dirty_panels.clear()
+        self.board.blit(self.bg, (0, 0))
+        for player_id in range(len(self.player_views)):
+            panel, pos = self._panels[player_id]
+            self.board.blit(panel, pos)
+        self.board.blit(self.static_overlay, (0, 0))
+        self.board_dirty = False
+
     def draw(self):
-        self.screen.blit(self.bg, (0, 0))
-        for pv in self.player_views:
-            pv.draw(self.screen)
-        
-        # 绘制调试按钮
-        pygame.draw.rect(self.screen, (0, 200, 0), self.debug_win_rect)
-        pygame.draw.rect(self.screen, (200, 0, 0), self.debug_lose_rect)
-        
-        font = pygame.font.SysFont("SimHei", 20)
-        win_text = font.render("一键胜利", True, (255, 255, 255))
-        lose_text = font.render("一键失败", True, (255, 255, 255))
-        
-        self.screen.blit(win_text, (self.debug_win_rect.x + 5, self.debug_win_rect.y + 5))
-        self.screen.blit(lose_text, (self.debug_lose_rect.x + 5, self.debug_lose_rect.y + 5))
-        
-        self.draw_deck(self.screen)
-        self.all_sprites.draw(self.screen)
-        pygame.display.flip()
-        self.draw_deck(self.screen)
-        # Update dirty sprites
-        self.all_sprites.draw(self.screen)
-        pygame.display.flip()
\ No newline at end of file
+        """绘制一帧
+
+        牌桌层有变化时整屏重绘；否则只擦除并重绘精灵移动经过的区域，并只更新这些区域。
+        """
+        if self.board_dirty:
+            self._compose_board()
+            self.screen.blit(self.board, (0, 0))
+            self.all_sprites.clear(self.screen, self.board)
+            self.all_sprites.repaint_rect(self.screen.get_rect())
+            self.all_sprites.draw(self.screen)
+            pygame.display.flip()
+            return
+        # 精灵移走后露出的区域用牌桌层擦除
+        dirty_rects = self.all_sprites.draw(self.screen)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
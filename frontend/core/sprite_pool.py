@@ -0,0 +1,40 @@
+from collections import defaultdict
+
+
+class SpritePool:
+    """可复用精灵池
+
+    动画结束后精灵不丢弃，按键（牌名、花色、点数、正反面或特效名）放回池中，
+    下次同样的动画直接取出重置位置后复用，避免频繁创建精灵和加载/缩放图像。
+    """
+
+    def __init__(self, max_free_per_key: int = 16):
+        self.max_free_per_key = max_free_per_key
+        self._free = defaultdict(list)
+        self.created = 0  # 新建的精灵数
+        self.reused = 0  # 复用的精灵数
+
+    def acquire(self, key, factory):
+        """取出一个精灵，池中没有时用 factory() 新建
+
+        Returns:
+            (精灵, 是否为复用的精灵)
+        """
+        free = self._free.get(key)
+        if free:
+            self.reused += 1
+            return free.pop(), True
+        self.created += 1
+        return factory(), False
+
+    def release(self, key, sprite):
+        """放回精灵（超过每个键的上限时丢弃）"""
+        free = self._free[key]
+        if len(free) < self.max_free_per_key:
+            free.append(sprite)
+
+    def clear(self):
+        self._free.clear()
+
+    def __len__(self):
+        return sum(len(free) for free in self._free.values())
@@ -6,7 +6,8 @@
 
 import argparse
 from backend.main_controller.main_controller import MainController
-from backend.utils.event_sender import set_wait_for_ack
+from backend.utils.event_sender import set_wait_for_ack, set_event_journal
+from communicator.event_journal import EventJournal
 
 
 def main():
@@ -23,6 +24,7 @@ def main():
   python main_back.py                    # 使用默认配置文件 (default_game_config)
   python main_back.py -c my_config       # 使用 config_file/my_config.json
   python main_back.py --config test      # 使用 config_file/test.json
+  python main_back.py -j game.zgsj        # 录制事件日志，用 main_replay.py 回放
         """
     )
     parser.add_argument(
@@ -32,6 +34,13 @@ def main():
         help='配置文件名（不需要加.json扩展名），默认为 default_game_config'
     )
     
+    parser.add_argument(
+        '-j', '--journal',
+        type=str,
+        default=None,
+        help='把本局发往前端的事件录制到指定的事件日志文件（用 main_replay.py 回放）'
+    )
+    
     args = parser.parse_args()
     
     print("欢迎来到猪国杀！")
@@ -39,11 +48,15 @@ def main():
     
     # 创建主控制器
     main_controller = MainController()
+    journal = None
     
     try:
         # 加载配置
         config = main_controller.load_config(args.config)
         print(f"已加载配置，玩家数量: {len(config.players_config)}")
+        if args.journal:
+            journal = EventJournal(args.journal, config)
+            set_event_journal(journal)
     
         # 开始游戏
         main_controller.start_game()
@@ -58,6 +71,10 @@ def main():
     except Exception as e:
         print(f"发生错误: {e}")
         return 1
+    finally:
+        if journal is not None:
+            set_event_journal(None)
+            journal.close()
     
     return 0
 
@@ -10,6 +10,7 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".")))
 
+import argparse
 import pygame
 import threading
 import time
@@ -23,7 +24,8 @@ from frontend.util.size import DEFAULT_WINDOW_SIZE
 from backend.main_controller.main_controller import MainController
 from config.simple_card_config import SimpleGameConfig, SimplePlayerConfig
 from communicator.communicator import communicator
-from backend.utils.event_sender import set_wait_for_ack
+from backend.utils.event_sender import set_wait_for_ack, set_event_journal
+from communicator.event_journal import EventJournal
 from config.enums import ControlType
 from config.enums import CharacterName, PlayerIdentity
 from campaign.flow import start_chapter_one_headless, start_chapter_two_headless
@@ -35,11 +37,19 @@ from config.simple_detailed_config import create_simple_default_game_config
 class GameManager:
     """游戏管理器，负责前后端协调"""
 
-    def __init__(self):
+    def __init__(self, journal_path: Optional[str] = None, enemy_control_type: Optional[ControlType] = None,
+                 enemy_control_params: Optional[Dict[str, Any]] = None):
         self.backend_thread: Optional[threading.Thread] = None
         self.frontend_client: Optional[GameClient] = None
         self.running = False
         self.config: Optional[SimpleGameConfig] = None
+        self.journal_path = journal_path  # 录制事件日志的文件（None表示不录制）
+        self.journal: Optional[EventJournal] = None
+        # 战役章节中敌人的操控类型和参数（None表示使用各章节默认的专用AI）
+        self.enemy_options: Dict[str, Any] = {}
+        if enemy_control_type is not None:
+            self.enemy_options = {"enemy_control_type": enemy_control_type,
+                                  "enemy_control_params": enemy_control_params}
 
         # 设置信号处理
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -120,15 +130,15 @@ class GameManager:
             # 如果是章节标识（由 StartScreen 返回），调用对应章节的配置生成函数
             if isinstance(config_result, dict) and config_result.get('__chapter__') == 'chapter1':
                 self.config = create_simple_default_game_config()
-                self.config.players_config = get_chapter_one_config()
+                self.config.players_config = get_chapter_one_config(**self.enemy_options)
                 current_chapter = "chapter1"
             elif isinstance(config_result, dict) and config_result.get('__chapter__') == 'chapter2':
                 self.config = create_simple_default_game_config()
-                self.config.players_config = get_chapter_two_config()
+                self.config.players_config = get_chapter_two_config(**self.enemy_options)
                 current_chapter = "chapter2"
             elif isinstance(config_result, dict) and config_result.get('__chapter__') == 'chapter3':
                 self.config = create_simple_default_game_config()
-                self.config.players_config = get_chapter_three_config()
+                self.config.players_config = get_chapter_three_config(**self.enemy_options)
                 current_chapter = "chapter3"
             elif isinstance(config_result, dict):
                 self.config = SimpleGameConfig.from_dict(config_result)
@@ -152,19 +162,23 @@ class GameManager:
                     print(f"\n[配置] 已将玩家 {idx} ({pconf.name} - {pconf.character_name.name}) 设为真人控制")
                     break
 
+            if self.journal_path:
+                self.journal = EventJournal(self.journal_path, self.config)
+                set_event_journal(self.journal)
+
             # 在后台线程启动后端（普通模式或章节模式）
             print("[系统] 启动后端线程...")
             if isinstance(config_result, dict) and config_result.get('__chapter__') == 'chapter1':
                 # 第一章模式：使用 campaign 的 headless 启动函数
                 self.backend_thread = threading.Thread(
-                    target=lambda: start_chapter_one_headless(human_control=True, ai_count=4),
+                    target=lambda: start_chapter_one_headless(human_control=True, ai_count=4, **self.enemy_options),
                     daemon=True,
                     name="BackendThread"
                 )
             elif isinstance(config_result, dict) and config_result.get('__chapter__') == 'chapter2':
                 # 第二章模式：使用 campaign 的 headless 启动函数
                 self.backend_thread = threading.Thread(
-                    target=lambda: start_chapter_two_headless(human_control=True, ai_count=4),
+                    target=lambda: start_chapter_two_headless(human_control=True, ai_count=4, **self.enemy_options),
                     daemon=True,
                     name="BackendThread"
                 )
@@ -238,6 +252,11 @@ class GameManager:
         if self.backend_thread and self.backend_thread.is_alive():
             print("[系统] 等待后端线程结束...")
             self.backend_thread.join(timeout=2.0)
+
+        if self.journal is not None:
+            set_event_journal(None)
+            self.journal.close()
+            self.journal = None
             
         # 清理通信器
         try:
@@ -262,8 +281,23 @@ class GameManager:
 
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description='猪国杀 - 前后端通信集成版')
+    parser.add_argument('-j', '--journal', type=str, default=None,
+                        help='把对局事件录制到指定的事件日志文件（用 main_replay.py 回放）')
+    parser.add_argument('--enemy-ai', choices=['default', 'ismcts'], default='default',
+                        help='战役章节中敌人的操控：default 为各章节的专用AI，ismcts 为可调强度的搜索AI')
+    parser.add_argument('--search-iterations', type=int, default=200, help='搜索AI每次决策的最大模拟次数')
+    parser.add_argument('--search-time', type=float, default=0.5, help='搜索AI每次决策的时间预算（秒）')
+    args = parser.parse_args()
+
+    enemy_control_type, enemy_control_params = None, None
+    if args.enemy_ai == 'ismcts':
+        enemy_control_type = ControlType.ISMCTS_AI
+        enemy_control_params = {"iterations": args.search_iterations, "time_budget": args.search_time}
+
     set_wait_for_ack(True)
-    game_manager = GameManager()
+    game_manager = GameManager(journal_path=args.journal, enemy_control_type=enemy_control_type,
+                               enemy_control_params=enemy_control_params)
     game_manager.start()
 
 
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+猪国杀 - 对局回放
+读取事件日志（main_back.py / main_integrated.py 的 --journal 参数录制），
+把记录的事件按时间送入 GameClient 播放，不运行后端规则。
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), ".")))
+
+import argparse
+import threading
+import time
+import pygame
+from frontend.core.game_client import GameClient
+from frontend.config.card_config import CardConfig
+from frontend.util.size import DEFAULT_WINDOW_SIZE
+from communicator.communicator import communicator
+from communicator.comm_event import KeyframeEvent
+from communicator.event_journal import read_journal, find_keyframe
+
+MIN_REPLAY_SPEED, MAX_REPLAY_SPEED = 1.0, 50.0
+
+
+class ReplayClient(GameClient):
+    """回放用的 GameClient：没有人类玩家，应用关键帧，跳转时快速跳过目标回合之前的事件"""
+
+    def __init__(self, config, screen, clock, seek_turn: int = 0):
+        super().__init__(config, screen, clock)
+        self.human_seats = set()
+        self.seek_turn = seek_turn
+
+    def apply_keyframe(self, event: KeyframeEvent):
+        """把关键帧中的局面直接应用到（新建的）玩家视图上"""
+        for state in event.players:
+            pv = self.renderer.player_views[state["player_id"]]
+            pv.update_hp(state["hp"])
+            if pv.is_self:
+                for card in state["hand"]:
+                    pv.add_card(CardConfig(card_name=card.name, suit=card.suit, rank=card.rank))
+            pv.card_cnt = len(state["hand"])
+            for equip_type, equip_name in state["equipment"].items():
+                pv.equipment[equip_type] = equip_name
+            pv.dead = state["dead"]
+        self.renderer.invalidate()
+
+    def handle_backend_event(self, event):
+        if isinstance(event, KeyframeEvent):
+            self.apply_keyframe(event)
+            return
+        if getattr(event, "_journal_turn", self.seek_turn) < self.seek_turn:
+            # 跳转中：目标回合之前的事件不播放动画
+            self.animation_mgr.instant = True
+        super().handle_backend_event(event)
+
+
+def feed_events(records, start_index: int, seek_turn: int, speed: float, stop_event: threading.Event):
+    """按记录的时间（除以回放速度）把事件送入前端队列；目标回合之前的事件立即送入"""
+    base_time = None
+    started_at = None
+    for i, record in enumerate(records[start_index:]):
+        if stop_event.is_set():
+            return
+        event = record.event
+        # 只应用起始关键帧，之后的关键帧跳过
+        if isinstance(event, KeyframeEvent) and i > 0:
+            continue
+        if record.turn >= seek_turn:
+            if base_time is None:
+                base_time, started_at = record.time, time.perf_counter()
+            delay = (record.time - base_time) / speed - (time.perf_counter() - started_at)
+            if delay > 0:
+                stop_event.wait(delay)
+        setattr(event, "_journal_turn", record.turn)
+        communicator.send_to_frontend(event)
+        # 前端的ACK没有后端消费，直接丢弃
+        while communicator.receive_from_frontend() is not None:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='猪国杀对局回放')
+    parser.add_argument('journal', type=str, help='事件日志文件')
+    parser.add_argument('-s', '--speed', type=float, default=1.0, help='回放速度（1~50倍），默认1倍')
+    parser.add_argument('-t', '--turn', type=int, default=0, help='从指定回合开始播放（从之前最近的关键帧快速跳转）')
+    args = parser.parse_args()
+    speed = min(max(args.speed, MIN_REPLAY_SPEED), MAX_REPLAY_SPEED)
+
+    config, records = read_journal(args.journal)
+    print(f"已读取事件日志: {len(records)} 个事件，共 {records[-1].turn if records else 0} 回合")
+    start_index = 0
+    if args.turn > 0:
+        keyframe_index = find_keyframe(records, args.turn)
+        if keyframe_index is None:
+            print(f"[警告] 第 {args.turn} 回合之前没有关键帧，从头开始跳转")
+        else:
+            start_index = keyframe_index
+
+    pygame.init()
+    screen = pygame.display.set_mode(DEFAULT_WINDOW_SIZE, pygame.RESIZABLE)
+    pygame.display.set_caption("猪国杀 - 回放")
+    clock = pygame.time.Clock()
+
+    client = ReplayClient(config, screen, clock, seek_turn=args.turn)
+    # 回放可以超过对局时的速度上限，动画与事件投递保持同一倍率
+    client.animation_mgr.max_speed = MAX_REPLAY_SPEED
+    client.animation_mgr.set_speed(speed)
+    stop_event = threading.Event()
+    feeder = threading.Thread(target=feed_events, args=(records, start_index, args.turn, speed, stop_event),
+                              daemon=True, name="ReplayFeeder")
+    feeder.start()
+    try:
+        winner_info = client.run()
+        if winner_info:
+            print(f"回放结束: {winner_info}")
+    finally:
+        stop_event.set()
+        pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
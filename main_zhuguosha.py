@@ -180,21 +180,15 @@ def set_initial_hand_cards_and_deck_order(game_controller: GameController,
     """
     deck = game_controller.deck
     
-    # 清空现有牌堆
-    deck.cards.clear()
-    
     # 按照输入顺序创建牌堆（从顶部到底部）
-    for card_char in deck_order:
-        card = create_card_from_name(card_char)
-        deck.cards.append(card)
+    cards = [create_card_from_name(card_char) for card_char in deck_order]
     
     # 将牌堆的最后一张牌复制100遍添加到牌堆末尾
-    if deck.cards:
-        last_card_char = deck_order[-1] if deck_order else None
-        if last_card_char:
-            for _ in range(100):
-                card = create_card_from_name(last_card_char)
-                deck.cards.append(card)
+    if cards:
+        cards.extend(create_card_from_name(deck_order[-1]) for _ in range(100))
+    
+    # 整体替换牌堆（通过 Deck.cards 赋值，同时更新对局的状态哈希）
+    deck.cards = cards
     
     # 设置初始手牌（初始手牌不在牌堆中，是独立的）
     for player_id_str, hand_cards in initial_hands.items():
@@ -203,13 +197,8 @@ def set_initial_hand_cards_and_deck_order(game_controller: GameController,
         if player is None:
             continue
         
-        # 清空手牌
-        player.hand_cards.clear()
-        
-        # 添加初始手牌（创建新的Card对象，不引用牌堆中的牌）
-        for card_char in hand_cards:
-            card = create_card_from_name(card_char)
-            player.hand_cards.append(card)
+        # 替换手牌（创建新的Card对象，不引用牌堆中的牌；通过赋值同时更新状态哈希）
+        player.hand_cards = [create_card_from_name(card_char) for card_char in hand_cards]
 
 
 def fix_lord_max_hp_for_zhuguosha(game_controller: GameController) -> None:
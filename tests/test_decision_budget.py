@@ -0,0 +1,115 @@
+# 决策时间预算测试
+import random
+import threading
+import time
+import unittest
+from unittest import mock
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.control.decision_budget import DecisionToken, run_with_deadline
+from backend.control.simple_control import SimpleControl
+from backend.game_controller.game_controller import GameController
+from backend.utils.event_sender import event_routing
+from tests.test_ismcts_control import create_game
+
+
+class SlowControl(SimpleControl):
+    """出牌阶段选牌很慢且不理会取消的规则操控"""
+
+    def select_card(self, available_cards, context="", available_targets=None):
+        time.sleep(0.2)
+        return super().select_card(available_cards, context, available_targets)
+
+
+class TestDecisionBudget(unittest.TestCase):
+    """DecisionBudget与ControlManager.decide测试"""
+
+    def test_run_with_deadline(self):
+        """测试按时完成返回结果，超时则取消令牌"""
+        token = DecisionToken(time.perf_counter() + 1.0)
+        self.assertEqual(run_with_deadline(lambda: 42, token, 0.0), (True, 42))
+        self.assertFalse(token.cancelled)
+
+        token = DecisionToken(time.perf_counter() + 0.01)
+        finished, result = run_with_deadline(lambda: time.sleep(0.2), token, 0.0)
+        self.assertFalse(finished)
+        self.assertIsNone(result)
+        self.assertTrue(token.cancelled)
+        self.assertTrue(token.expired())
+
+    def test_timeout_falls_back_to_rule_control(self):
+        """测试超时改用规则操控，本局时间用完后直接使用规则操控"""
+        game_controller = create_game(2)
+        control_manager = game_controller.player_controller.control_manager
+        player = game_controller.player_controller.get_player(0)
+        slow_control = SlowControl(0)
+        slow_control.apply_state(player.control.capture_state())
+        slow_control.set_knowledge_board(control_manager.knowledge_board)
+        player.control = slow_control
+        control_manager.controls[0] = slow_control
+        budget = control_manager.set_decision_budget(per_decision=0.02, per_game=0.1, grace=0.0)
+
+        start = time.perf_counter()
+        with event_routing(control_manager):
+            game_controller.start_game()
+
+        self.assertTrue(game_controller.game_ended)
+        self.assertGreater(budget.timeouts.get(0, 0), 0)
+        # 本局时间用完后不再等待慢操控
+        self.assertLess(budget.used[0], 0.1 + 0.1)
+        self.assertLess(time.perf_counter() - start, 5.0)
+
+    def test_search_control_honors_deadline(self):
+        """测试搜索AI按决策截止时间提前停止搜索"""
+        game_controller = create_game(1)
+        control_manager = game_controller.player_controller.control_manager
+        control = game_controller.player_controller.get_player(1).control
+        control.params.iterations = 1000
+        control.params.time_budget = 1.0
+        control.rng.seed(1)
+        budget = control_manager.set_decision_budget(per_decision=0.03, grace=0.2)
+
+        with event_routing(control_manager):
+            game_controller.start_game()
+
+        self.assertTrue(game_controller.game_ended)
+        self.assertEqual(budget.timeouts.get(1, 0), 0)
+        self.assertIsNotNone(control.last_root)
+        self.assertGreater(control.last_root.visits, 0)
+
+    def test_abandoned_search_leaves_game_alone(self):
+        """测试超时后仍在后台运行的搜索线程不读取实际对局、不修改全局random"""
+        game_controller = create_game(1)
+        control_manager = game_controller.player_controller.control_manager
+        control = game_controller.player_controller.get_player(1).control
+        control.params.iterations = 1000
+        control.params.time_budget = 1.0
+        budget = control_manager.set_decision_budget(per_decision=0.02, grace=0.0)
+
+        live_clone_threads = []
+        clone = GameController.clone
+
+        def recording_clone(game, *args, **kwargs):
+            if game is game_controller:
+                live_clone_threads.append(threading.current_thread())
+            return clone(game, *args, **kwargs)
+
+        with mock.patch.object(GameController, "clone", recording_clone), \
+                mock.patch.object(random, "setstate", wraps=random.setstate) as setstate:
+            with event_routing(control_manager):
+                game_controller.start_game()
+            for thread in threading.enumerate():
+                if thread.name == "control-decision":
+                    thread.join(5.0)
+
+        self.assertTrue(game_controller.game_ended)
+        self.assertGreater(budget.timeouts.get(1, 0), 0)
+        self.assertTrue(live_clone_threads)
+        self.assertTrue(all(thread is threading.main_thread() for thread in live_clone_threads))
+        setstate.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+# 猪国杀环境测试
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.env import ZhuGuoShaEnv, VectorEnv, OBSERVATION_SIZE, MAX_ACTIONS
+from backend.control.agent_control import DecisionKind
+from config.simple_card_config import SimpleGameConfig, SimpleCardConfig, SimplePlayerConfig
+from config.enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName
+
+
+def create_config() -> SimpleGameConfig:
+    """三人局：主公（外部智能体）、反贼、忠臣"""
+    deck_config = [
+        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1, count=20),
+        SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 2, count=10),
+        SimpleCardConfig(CardName.TAO, CardSuit.HEARTS, 3, count=5),
+        SimpleCardConfig(CardName.JUE_DOU, CardSuit.SPADES, 4, count=5),
+    ]
+    players_config = [
+        SimplePlayerConfig("主公", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LORD, ControlType.SIMPLE_AI),
+        SimplePlayerConfig("反贼", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.REBEL, ControlType.SIMPLE_AI),
+        SimplePlayerConfig("忠臣", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LOYALIST, ControlType.SIMPLE_AI),
+    ]
+    return SimpleGameConfig(deck_config=deck_config, players_config=players_config, shuffle_deck=True)
+
+
+def create_duel_config(deck_config) -> SimpleGameConfig:
+    """三人局：主公、反贼、忠臣（外部智能体坐在最后，由牌堆决定是否轮到它之前对局就结束）"""
+    players_config = [
+        SimplePlayerConfig("主公", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LORD, ControlType.SIMPLE_AI),
+        SimplePlayerConfig("反贼", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.REBEL, ControlType.SIMPLE_AI),
+        SimplePlayerConfig("忠臣", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LOYALIST, ControlType.SIMPLE_AI),
+    ]
+    return SimpleGameConfig(deck_config=deck_config, players_config=players_config, shuffle_deck=True)
+
+
+def create_env() -> ZhuGuoShaEnv:
+    return ZhuGuoShaEnv(create_config(), agent_player_id=0)
+
+
+def play_episode(env: ZhuGuoShaEnv, seed: int, max_steps: int = 2000):
+    """总是选择第一个合法选项，返回 (动作序列, 最终奖励)"""
+    observation, info = env.reset(seed)
+    actions = []
+    for _ in range(max_steps):
+        assert len(observation) == OBSERVATION_SIZE
+        assert len(info["action_mask"]) == MAX_ACTIONS
+        assert info["action_mask"][0] == 1
+        actions.append(info["decision_kind"])
+        observation, reward, terminated, truncated, info = env.step(0)
+        if terminated or truncated:
+            return actions, reward
+    raise AssertionError("对局没有结束")
+
+
+class TestZhuGuoShaEnv(unittest.TestCase):
+    """ZhuGuoShaEnv测试"""
+
+    def test_episode_is_reproducible(self):
+        """测试相同种子和动作得到相同的对局"""
+        env = create_env()
+        try:
+            actions, reward = play_episode(env, seed=7)
+            self.assertIn(DecisionKind.SELECT_CARD, actions)
+            self.assertIn(reward, (-1.0, 0.0, 1.0))
+            self.assertEqual(play_episode(env, seed=7), (actions, reward))
+        finally:
+            env.close()
+
+    def test_reset_mid_game(self):
+        """测试对局进行中可以重新开始"""
+        env = create_env()
+        try:
+            env.reset(1)
+            env.step(0)
+            observation, info = env.reset(2)
+            self.assertEqual(len(observation), OBSERVATION_SIZE)
+            self.assertIsNotNone(info["decision_kind"])
+        finally:
+            env.close()
+
+    def test_reset_skips_games_ended_before_agent_acts(self):
+        """测试对局在智能体第一次决策前就结束时，reset 重新开局直到有决策点"""
+        deck_config = [
+            SimpleCardConfig(CardName.JUE_DOU, CardSuit.SPADES, 4, count=30),
+            SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1, count=10),
+        ]
+        env = ZhuGuoShaEnv(create_duel_config(deck_config), agent_player_id=2)
+        try:
+            # 该种子的前两局都在智能体第一次决策前分出胜负
+            observation, info = env.reset(2)
+            self.assertEqual(env.skipped_games, 2)
+            self.assertIsNotNone(info["decision_kind"])
+            self.assertEqual(len(observation), OBSERVATION_SIZE)
+            _, _, terminated, truncated, _ = env.step(0)
+            self.assertIsInstance(terminated, bool)
+        finally:
+            env.close()
+
+        # 每一局都在智能体决策前结束时抛出异常，而不是返回已结束的对局
+        deck_config = [SimpleCardConfig(CardName.JUE_DOU, CardSuit.SPADES, 4, count=40)]
+        env = ZhuGuoShaEnv(create_duel_config(deck_config), agent_player_id=2, max_reset_attempts=3)
+        try:
+            with self.assertRaises(RuntimeError):
+                env.reset(0)
+            self.assertEqual(env.skipped_games, 3)
+        finally:
+            env.close()
+
+    def test_vector_env(self):
+        """测试向量化环境在子进程中推进并自动开始新的一局"""
+        vector_env = VectorEnv([create_env, create_env])
+        try:
+            observations, infos = vector_env.reset([3, 4])
+            self.assertEqual(len(observations), 2)
+            finished = False
+            for _ in range(2000):
+                observations, rewards, terminated, truncated, infos = vector_env.step([0, 0])
+                for i in range(2):
+                    if terminated[i] or truncated[i]:
+                        finished = True
+                        self.assertIn("final_observation", infos[i])
+                if finished:
+                    break
+            self.assertTrue(finished)
+        finally:
+            vector_env.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
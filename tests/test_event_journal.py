@@ -0,0 +1,139 @@
+# 事件日志测试
+import os
+import pickle
+import random
+import tempfile
+import unittest
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.game_controller.game_controller import GameController
+from backend.utils.event_sender import event_routing, get_event_journal
+from communicator.comm_event import (DrawCardEvent, PlayCardEvent, HPChangeEvent, EquipChangeEvent, DeathEvent,
+                                     GameOverEvent, KeyframeEvent, DebugEvent)
+from communicator.event_journal import (EventJournal, read_journal, find_keyframe, encode_event, decode_event,
+                                        MAGIC, _RECORD_HEADER, _BLOB_HEADER)
+from config.enums import EquipmentType
+from config.simple_card_config import SimpleGameConfig, SimpleCardConfig, SimplePlayerConfig
+from config.enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName
+
+
+def create_config() -> SimpleGameConfig:
+    deck_config = [
+        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1, count=20),
+        SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 2, count=10),
+        SimpleCardConfig(CardName.TAO, CardSuit.HEARTS, 3, count=5),
+        SimpleCardConfig(CardName.ZHU_GE_LIAN_NU, CardSuit.CLUBS, 1, count=2),
+    ]
+    identities = [PlayerIdentity.LORD, PlayerIdentity.REBEL, PlayerIdentity.LOYALIST, PlayerIdentity.REBEL]
+    players_config = [
+        SimplePlayerConfig(f"玩家{i}", CharacterName.BAI_BAN_WU_JIANG, identity, ControlType.SIMPLE_AI)
+        for i, identity in enumerate(identities)
+    ]
+    return SimpleGameConfig(deck_config=deck_config, players_config=players_config, shuffle_deck=True)
+
+
+class TestEventJournal(unittest.TestCase):
+    """EventJournal测试"""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".zgsj")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def record_game(self, keyframe_interval: int = 3) -> GameController:
+        random.seed(0)
+        config = create_config()
+        game_controller = GameController(config)
+        with EventJournal(self.path, config, keyframe_interval) as journal:
+            with event_routing(None, journal=journal):
+                game_controller.initialize()
+            with event_routing(game_controller.player_controller.control_manager, journal=journal):
+                self.assertIs(get_event_journal(), journal)
+                # 模拟对局（如搜索AI的推演）的事件不写入日志
+                with event_routing(None):
+                    self.assertIsNone(get_event_journal())
+                game_controller.start_game()
+        return game_controller
+
+    def test_record_and_read(self):
+        """测试录制整局事件并读回（序号、回合、关键帧、对局配置）"""
+        game_controller = self.record_game()
+        config, records = read_journal(self.path)
+
+        self.assertEqual(len(config.players_config), 4)
+        self.assertEqual([record.seq for record in records], list(range(1, len(records) + 1)))
+        self.assertIsInstance(records[0].event, DrawCardEvent)
+        self.assertEqual(records[0].turn, 0)
+        self.assertIsInstance(records[-1].event, GameOverEvent)
+        turns = [record.turn for record in records]
+        self.assertEqual(turns, sorted(turns))
+        times = [record.time for record in records]
+        self.assertEqual(times, sorted(times))
+
+        keyframes = [record for record in records if isinstance(record.event, KeyframeEvent)]
+        self.assertEqual([record.turn for record in keyframes][:3], [1, 4, 7])
+        first = keyframes[0].event
+        self.assertEqual(len(first.players), 4)
+        self.assertEqual(sum(len(state["hand"]) for state in first.players), 16)
+        self.assertLessEqual(records[-1].turn, game_controller.turn_number)
+
+    def test_find_keyframe_and_truncated_file(self):
+        """测试按回合查找关键帧，以及文件末尾不完整时忽略最后一条记录"""
+        self.record_game()
+        _, records = read_journal(self.path)
+        index = find_keyframe(records, 5)
+        self.assertEqual(records[index].turn, 4)
+        self.assertIsNone(find_keyframe(records, 0))
+
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+        _, truncated = read_journal(self.path)
+        self.assertEqual(len(truncated), len(records) - 1)
+
+    def test_event_round_trip(self):
+        """测试事件按显式字段编码后原样读回，不在日志格式中的事件不记录"""
+        events = [
+            DrawCardEvent(None, 2),
+            PlayCardEvent(SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1), 0, 3, response_type="响应杀",
+                          response_target=1, original_card_name="杀", conversion_display=None, is_effective=False),
+            HPChangeEvent(1, -1, source_player_id=0, damage_type="决斗"),
+            EquipChangeEvent(0, CardName.ZHU_GE_LIAN_NU, EquipmentType.WEAPON),
+            DeathEvent(3),
+            GameOverEvent(winner_info="主公和忠臣胜利"),
+            KeyframeEvent(4, [{"player_id": 0, "hp": 3, "hand": [SimpleCardConfig(CardName.TAO, CardSuit.HEARTS, 3)],
+                               "equipment": {EquipmentType.WEAPON: CardName.ZHU_GE_LIAN_NU}, "dead": False}]),
+        ]
+        for event in events:
+            decoded = decode_event(encode_event(event))
+            self.assertIs(type(decoded), type(event))
+            self.assertEqual(vars(decoded), vars(event))
+        self.assertIsNone(encode_event(DebugEvent("win")))
+
+    def test_pickled_record_not_loaded(self):
+        """测试日志中的记录不会被 unpickle：伪造的 pickle 数据被拒绝，其中的代码不会执行"""
+        marker = self.path + ".pwned"
+        payload = pickle.dumps(PickleBomb(marker))
+        config_blob = b"null"
+        with open(self.path, "wb") as f:
+            f.write(MAGIC + _BLOB_HEADER.pack(len(config_blob)) + config_blob)
+            f.write(_RECORD_HEADER.pack(1, 0, 0.0, len(payload)) + payload)
+        with self.assertRaises(ValueError):
+            read_journal(self.path)
+        self.assertFalse(os.path.exists(marker))
+
+
+class PickleBomb:
+    """被 unpickle 时创建标记文件"""
+
+    def __init__(self, marker: str):
+        self.marker = marker
+
+    def __reduce__(self):
+        return (open, (self.marker, "w"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,234 @@
+# 游戏控制盘测试
+import unittest
+from unittest import mock
+import sys
+import os
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.game_controller.game_controller import GameController
+from backend.game_controller.card_effect_handler import ShaCardHandler, EquipmentCardHandler
+from backend.card.card import Card
+from backend.utils.event_sender import event_routing
+from campaign.flow import start_chapter_one_headless, start_chapter_two_headless
+from config.simple_card_config import SimpleGameConfig, SimpleCardConfig, SimplePlayerConfig
+from config.enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName
+from main_zhuguosha import (
+    parse_input_file, create_game_config, set_initial_hand_cards_and_deck_order, fix_lord_max_hp_for_zhuguosha
+)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def create_homework_game(input_file: Path) -> GameController:
+    """按 main_zhuguosha.py 的流程创建对局"""
+    players_config, initial_hands, deck_order = parse_input_file(str(input_file))
+    game_controller = GameController(create_game_config(players_config, deck_order))
+    with event_routing(None):
+        game_controller.initialize()
+    set_initial_hand_cards_and_deck_order(game_controller, initial_hands, deck_order)
+    fix_lord_max_hp_for_zhuguosha(game_controller)
+    return game_controller
+
+
+class TestGameController(unittest.TestCase):
+    """GameController测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        deck_config = [
+            SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1, count=20),
+            SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 2, count=10),
+            SimpleCardConfig(CardName.TAO, CardSuit.HEARTS, 3, count=5),
+        ]
+        players_config = [
+            SimplePlayerConfig("主公", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LORD, ControlType.SIMPLE_AI),
+            SimplePlayerConfig("反贼", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.REBEL, ControlType.SIMPLE_AI),
+        ]
+        self.config = SimpleGameConfig(deck_config=deck_config, players_config=players_config, shuffle_deck=False)
+        self.game_controller = GameController(self.config)
+        self.game_controller.initialize()
+
+    def test_card_effect_handlers_reused(self):
+        """测试牌效果处理器在整局游戏中复用"""
+        handlers = self.game_controller.card_effect_handlers
+        self.assertIsInstance(handlers[CardName.SHA], ShaCardHandler)
+        self.assertIsInstance(handlers[CardName.REN_WANG_DUN], EquipmentCardHandler)
+        self.assertIs(handlers[CardName.REN_WANG_DUN], handlers[CardName.FANG_YU_MA])
+
+        # 处理器按当前回合上下文读取出牌玩家
+        target = self.game_controller.player_controller.get_player(1)
+        target.hand_cards.clear()
+        hp_before = target.current_hp
+        self.game_controller.current_player_id = 0
+        self.game_controller._handle_card_effect(Card(CardSuit.HEARTS, 1, CardName.SHA), [1])
+        self.assertEqual(target.current_hp, hp_before - 1)
+        self.assertEqual(handlers[CardName.SHA].current_player_id, 0)
+
+    def test_chongzhen_hook(self):
+        """测试冲阵钩子：赵云2用龙胆转化的牌从主要目标处夺牌"""
+        player_controller = self.game_controller.player_controller
+        attacker = player_controller.get_player(0)
+        target = player_controller.get_player(1)
+        attacker.character_name = CharacterName.ZHAO_YUN_2
+        attacker.control.ask_steal_from_target = lambda target_id, count, context="": 0
+        target.hand_cards = [Card(CardSuit.HEARTS, 3, CardName.TAO)]
+        stolen = target.hand_cards[0]
+        hand_before = len(attacker.hand_cards)
+
+        card = Card(CardSuit.HEARTS, 2, CardName.SHA)
+        card.converted_from = CardName.SHAN
+        for hook in self.game_controller.card_effect_hooks:
+            hook.after_effect(card, [1], 0)
+
+        self.assertEqual(len(target.hand_cards), 0)
+        self.assertEqual(len(attacker.hand_cards), hand_before + 1)
+        self.assertIn(stolen, attacker.hand_cards)
+
+    def test_snapshot_restore(self):
+        """测试快照恢复后手牌、血量、牌堆和牌面与快照时一致"""
+        game_controller = self.game_controller
+        player_controller = game_controller.player_controller
+        for player in player_controller.players:
+            player._draw_initial_cards()
+        lord = player_controller.get_player(0)
+        rebel = player_controller.get_player(1)
+        snapshot = game_controller.snapshot()
+        hand_before = list(rebel.hand_cards)
+        deck_before = list(game_controller.deck.cards)
+        hp_before = lord.current_hp
+        card = hand_before[0]
+        name_before = card.name_enum
+
+        # 修改局面：摸牌、掉血、改牌面、装备
+        rebel.draw_card(2)
+        lord.current_hp -= 2
+        lord.sha_used_this_turn = True
+        card.name_enum = CardName.TAO
+        lord.equipment_manager.weapon = Card(CardSuit.HEARTS, 1, CardName.ZHU_GE_LIAN_NU)
+        game_controller.turn_number = 5
+
+        game_controller.restore(snapshot)
+        self.assertEqual(list(rebel.hand_cards), hand_before)
+        self.assertTrue(rebel.hand_cards.has_card(name_before))
+        self.assertEqual(game_controller.deck.cards, deck_before)
+        self.assertEqual(lord.current_hp, hp_before)
+        self.assertFalse(lord.sha_used_this_turn)
+        self.assertIsNone(lord.weapon)
+        self.assertIs(card.name_enum, name_before)
+        self.assertEqual(game_controller.turn_number, 1)
+        self.assertEqual(game_controller.snapshot(), snapshot)
+
+    def test_clone_independent(self):
+        """测试复制的对局与原对局互不影响"""
+        game_controller = self.game_controller
+        for player in game_controller.player_controller.players:
+            player._draw_initial_cards()
+        clone = game_controller.clone()
+        self.assertEqual(clone.snapshot(), game_controller.snapshot())
+
+        clone_player = clone.player_controller.get_player(1)
+        original_player = game_controller.player_controller.get_player(1)
+        self.assertIsNot(clone_player, original_player)
+        self.assertIs(clone_player.deck, clone.deck)
+        self.assertIs(clone_player.player_controller, clone.player_controller)
+        self.assertIs(clone.card_effect_handlers[CardName.SHA].deck, clone.deck)
+
+        deck_size = len(game_controller.deck.cards)
+        hand_size = len(original_player.hand_cards)
+        clone_player.draw_card(2)
+        clone_player.hand_cards[0].name_enum = CardName.TAO
+        clone_player.current_hp -= 1
+        self.assertEqual(len(game_controller.deck.cards), deck_size)
+        self.assertEqual(len(original_player.hand_cards), hand_size)
+        self.assertEqual(original_player.current_hp, original_player.max_hp)
+        self.assertIs(original_player.hand_cards[0].name_enum, CardName.SHA)
+
+    def test_compact_state(self):
+        """测试紧凑状态的座位视图、可见状态和写回快照"""
+        game_controller = self.game_controller
+        player_controller = game_controller.player_controller
+        for player in player_controller.players:
+            player._draw_initial_cards()
+        state = game_controller.compact_state()
+
+        rebel = player_controller.get_player(1)
+        seat = state.get_player(1)
+        self.assertEqual(list(state.hp), [5, 4])
+        self.assertEqual(seat.hand_cards, list(rebel.hand_cards))
+        self.assertEqual(seat.identity, PlayerIdentity.REBEL)
+        self.assertTrue(seat.is_alive())
+        self.assertEqual(state.visible_state(1), player_controller.control_manager._get_visible_state(1))
+
+        # 修改数组后写回对局
+        copied = state.copy()
+        copied.hp[1] = 0
+        copied.alive[1] = 0
+        self.assertNotEqual(copied.key(), state.key())
+        self.assertEqual(state.hp[1], 4)
+        game_controller.restore(copied.to_snapshot())
+        self.assertFalse(rebel.is_alive())
+        self.assertEqual(rebel.current_hp, 0)
+        self.assertEqual(game_controller.compact_state().key(), copied.key())
+
+    def test_state_hash(self):
+        """测试状态哈希随修改增量更新，与整体重新计算的结果一致，局面还原后哈希也还原"""
+        game_controller = self.game_controller
+        player_controller = game_controller.player_controller
+        for player in player_controller.players:
+            player._draw_initial_cards()
+        lord = player_controller.get_player(0)
+        rebel = player_controller.get_player(1)
+        initial = game_controller.state_hash.value
+        snapshot = game_controller.snapshot()
+
+        rebel.draw_card(2)
+        lord.current_hp -= 2
+        lord.sha_used_this_turn = True
+        lord.equip(Card(CardSuit.HEARTS, 1, CardName.ZHU_GE_LIAN_NU))
+        game_controller.deck.discard_card(rebel.hand_cards[0])
+        rebel.hand_cards.remove(rebel.hand_cards[0])
+        game_controller.current_player_id = 1
+        changed = game_controller.state_hash.value
+        self.assertNotEqual(changed, initial)
+        self.assertEqual(game_controller.rehash_state(), changed)
+
+        # 回合数不计入哈希
+        game_controller.restore(snapshot)
+        game_controller.turn_number = 7
+        self.assertEqual(game_controller.state_hash.value, initial)
+        self.assertEqual(game_controller.clone().state_hash.value, initial)
+
+    def test_homework_setup_keeps_state_hash(self):
+        """测试按HomeWork输入设置手牌和牌堆后，增量维护的状态哈希与整体重新计算一致"""
+        for input_file in sorted((PROJECT_ROOT / "HomeWork" / "inputs").glob("*.in")):
+            game_controller = create_homework_game(input_file)
+            value = game_controller.state_hash.value
+            self.assertEqual(value, game_controller.rehash_state(), input_file.name)
+
+            # 对局进行若干回合后仍一致
+            with event_routing(game_controller.player_controller.control_manager):
+                game_controller._deal_initial_cards()
+                for _ in range(5):
+                    if not game_controller.play_turn():
+                        break
+            value = game_controller.state_hash.value
+            self.assertEqual(value, game_controller.rehash_state(), input_file.name)
+
+    def test_campaign_players_keep_state_hash(self):
+        """测试战役章节替换玩家后，状态哈希包含新玩家的状态并随修改增量更新"""
+        for start in (start_chapter_one_headless, start_chapter_two_headless):
+            started = []
+            with mock.patch.object(GameController, "start_game", lambda gc: started.append(gc)):
+                start(human_control=False)
+            game_controller = started[0]
+            value = game_controller.state_hash.value
+            self.assertEqual(value, game_controller.rehash_state(), start.__name__)
+
+            game_controller.player_controller.get_player(0).current_hp -= 1
+            self.assertNotEqual(game_controller.state_hash.value, value, start.__name__)
+            self.assertEqual(game_controller.state_hash.value, game_controller.rehash_state(), start.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,16 @@
 # 游戏结束逻辑测试
 import unittest
+from unittest import mock
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.player_controller.player_controller import PlayerController
+from backend.game_controller.game_controller import GameController
 from backend.deck.deck import Deck
+from backend.utils.event_sender import event_routing
 from config.simple_card_config import SimpleGameConfig, SimpleCardConfig, SimplePlayerConfig
-from config.enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName, PlayerStatus
+from config.enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName, PlayerStatus, GameOutcome
 
 
 class TestGameEnd(unittest.TestCase):
@@ -117,6 +120,54 @@ class TestGameEnd(unittest.TestCase):
         
         winner = player_controller.get_winner()
         self.assertIsNone(winner)
+    
+    def _create_stalemate(self) -> GameController:
+        """牌堆只有闪：谁也无法攻击，每回合摸牌、弃牌，局面不断重复"""
+        players_config = [
+            SimplePlayerConfig("主公", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LORD, ControlType.SIMPLE_AI),
+            SimplePlayerConfig("反贼", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.REBEL, ControlType.SIMPLE_AI),
+        ]
+        config = SimpleGameConfig(deck_config=[SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 2, count=12)],
+                                  players_config=players_config, shuffle_deck=False)
+        game_controller = GameController(config)
+        with event_routing(None):
+            game_controller.initialize()
+        return game_controller
+    
+    def test_repetition_ends_stalemate(self):
+        """测试开启局面重复检测后，局面循环时提前结束，给出不同于分出胜负的结果并通知前端"""
+        game_controller = self._create_stalemate()
+        # 局面重复不能证明对局循环，默认不检测；这局是确定性的，可以开启
+        self.assertIsNone(game_controller.repetition_limit)
+        game_controller.repetition_limit = 3
+        with mock.patch("backend.game_controller.game_controller.send_game_over_event") as send_game_over:
+            with event_routing(game_controller.player_controller.control_manager):
+                game_controller.start_game()
+        
+        self.assertTrue(game_controller.game_ended)
+        self.assertEqual(game_controller.outcome, GameOutcome.REPETITION)
+        self.assertLess(game_controller.turn_number, 50)
+        self.assertIsNone(game_controller.player_controller.get_winner())
+        send_game_over.assert_called_once()
+        self.assertIn(GameOutcome.REPETITION.value, send_game_over.call_args[0][0])
+    
+    def test_turn_and_time_limits(self):
+        """测试回合数上限和时间上限"""
+        game_controller = self._create_stalemate()
+        game_controller.max_turns = 20
+        with mock.patch("backend.game_controller.game_controller.send_game_over_event") as send_game_over:
+            with event_routing(game_controller.player_controller.control_manager):
+                game_controller.start_game()
+        self.assertEqual(game_controller.outcome, GameOutcome.TURN_LIMIT)
+        self.assertEqual(game_controller.turn_number, 21)
+        send_game_over.assert_called_once()
+        
+        game_controller = self._create_stalemate()
+        game_controller.max_turns = None
+        game_controller.time_limit = 0.0
+        with event_routing(game_controller.player_controller.control_manager):
+            game_controller.start_game()
+        self.assertEqual(game_controller.outcome, GameOutcome.TIME_LIMIT)
 
 
 if __name__ == '__main__':
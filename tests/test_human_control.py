@@ -0,0 +1,87 @@
+# HumanControl测试（前端请求/回复协议）
+import threading
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.control.human_control import HumanControl
+from communicator.communicator import communicator
+from communicator.comm_event import (AskTargetEvent, AskPlayCardEvent, TargetResponseEvent,
+                                     PlayCardResponseEvent, CancelRequestEvent, DebugEvent, AckEvent)
+
+
+def drain_queues():
+    while communicator.receive_from_backend() is not None:
+        pass
+    while communicator.receive_from_frontend() is not None:
+        pass
+    communicator.pending_requests.clear()
+
+
+class FakeFrontend(threading.Thread):
+    """收到请求后先发一条调试指令，再按 request_id 回复"""
+
+    def __init__(self, make_response):
+        super().__init__(daemon=True)
+        self.make_response = make_response
+
+    def run(self):
+        event = communicator.get_from_backend(timeout=5)
+        communicator.send_to_backend(DebugEvent("win"))
+        communicator.send_to_backend(self.make_response(event))
+
+
+class TestHumanControl(unittest.TestCase):
+    """HumanControl测试"""
+
+    def setUp(self):
+        drain_queues()
+        self.control = HumanControl(player_id=0)
+
+    def tearDown(self):
+        drain_queues()
+
+    def test_response_matched_by_request_id(self):
+        """测试回复按 request_id 交给请求，等待期间的其他事件不被吞掉"""
+        frontend = FakeFrontend(lambda event: TargetResponseEvent(target_ids=[2, 5], request_id=event.request_id))
+        frontend.start()
+        targets = self.control._ask_frontend_for_targets([1, 2, 3])
+        frontend.join()
+        self.assertEqual(targets, [2])
+        self.assertIsNone(self.control.pending_request)
+        self.assertEqual(communicator.pending_requests, {})
+
+        # 调试指令仍在队列中，回复不进入队列
+        event = communicator.receive_from_frontend()
+        self.assertIsInstance(event, DebugEvent)
+        self.assertIsNone(communicator.receive_from_frontend())
+
+    def test_timeout_cancels_request(self):
+        """测试等待超时：取消请求、通知前端并采用默认动作，之后到达的回复被丢弃"""
+        self.control.response_timeout = 0.05
+        self.assertIsNone(self.control._ask_frontend_for_card([]))
+
+        ask = communicator.receive_from_backend()
+        self.assertIsInstance(ask, AskPlayCardEvent)
+        self.assertEqual(ask.timeout, 0.05)
+        cancel = communicator.receive_from_backend()
+        self.assertIsInstance(cancel, CancelRequestEvent)
+        self.assertEqual(cancel.request_id, ask.request_id)
+        self.assertEqual(communicator.pending_requests, {})
+
+        communicator.send_to_backend(PlayCardResponseEvent(card_index=0, request_id=ask.request_id))
+        self.assertIsNone(communicator.receive_from_frontend())
+
+    def test_acks_not_queued_for_backend(self):
+        """测试前端的 ACK 只交给 ACK 线程，不在 ftb_queue 中堆积"""
+        for event_id in range(5):
+            communicator.send_to_backend(AckEvent(original_event_id=event_id, success=True))
+        communicator.send_to_backend(DebugEvent("win"))
+        self.assertEqual(communicator.ftb_queue.qsize(), 1)
+        self.assertIsInstance(communicator.receive_from_frontend(), DebugEvent)
+        self.assertTrue(communicator.ftb_queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+# ISMCTS操控测试
+import random
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.game_controller.game_controller import GameController
+from backend.control.control_factory import ControlFactory
+from backend.control.ismcts_control import ISMCTSControl
+from backend.utils.event_sender import event_routing
+from campaign.flow import start_chapter_one_headless, start_chapter_two_headless
+from communicator.communicator import communicator
+from config.simple_card_config import SimpleGameConfig, SimpleCardConfig, SimplePlayerConfig
+from config.enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName
+
+
+def create_game(seed: int) -> GameController:
+    """三人局：主公（规则）、反贼（搜索AI）、忠臣（规则）"""
+    deck_config = [
+        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1, count=20),
+        SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 2, count=10),
+        SimpleCardConfig(CardName.TAO, CardSuit.HEARTS, 3, count=5),
+        SimpleCardConfig(CardName.JUE_DOU, CardSuit.SPADES, 4, count=5),
+    ]
+    players_config = [
+        SimplePlayerConfig("主公", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LORD, ControlType.SIMPLE_AI),
+        SimplePlayerConfig("反贼", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.REBEL, ControlType.ISMCTS_AI),
+        SimplePlayerConfig("忠臣", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LOYALIST, ControlType.SIMPLE_AI),
+    ]
+    config = SimpleGameConfig(deck_config=deck_config, players_config=players_config, shuffle_deck=True)
+    random.seed(seed)
+    game_controller = GameController(config)
+    with event_routing(None):
+        game_controller.initialize()
+    return game_controller
+
+
+class TestISMCTSControl(unittest.TestCase):
+    """ISMCTSControl测试"""
+
+    def test_factory_and_binding(self):
+        """测试工厂创建并在初始化时绑定对局"""
+        self.assertIsInstance(ControlFactory.create_control(ControlType.ISMCTS_AI, 1), ISMCTSControl)
+        game_controller = create_game(0)
+        control = game_controller.player_controller.get_player(1).control
+        self.assertIs(control.game, game_controller)
+
+    def test_plays_full_game_within_budget(self):
+        """测试搜索只选择合法的牌，且每次决策不超过时间预算"""
+        game_controller = create_game(1)
+        control = game_controller.player_controller.get_player(1).control
+        control.params.iterations = 1000
+        control.params.time_budget = 0.05
+        control.rng.seed(1)
+
+        decisions = []
+        search = control._search
+
+        def timed_search(snapshot):
+            start = time.perf_counter()
+            statistics = search(snapshot)
+            decisions.append(time.perf_counter() - start)
+            return statistics
+
+        control._search = timed_search
+        with event_routing(game_controller.player_controller.control_manager):
+            game_controller.start_game()
+
+        self.assertTrue(game_controller.game_ended)
+        self.assertTrue(decisions)
+        # 单次模拟可能略超出预算
+        self.assertLess(max(decisions), 0.05 + 0.1)
+        self.assertIsNotNone(control.last_root)
+        self.assertGreater(control.last_root.visits, 0)
+
+    def test_worker_pool_closed_when_game_ends(self):
+        """测试并行搜索的进程池在对局结束时关闭"""
+        pools = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        game_controller = create_game(2)
+        control = game_controller.player_controller.get_player(1).control
+        control.workers = 2
+        control.params.iterations = 4
+        control.params.time_budget = 0.05
+        with mock.patch("backend.control.ismcts_control.ProcessPoolExecutor", RecordingPool):
+            with event_routing(game_controller.player_controller.control_manager):
+                game_controller.start_game()
+
+        self.assertTrue(game_controller.game_ended)
+        self.assertEqual(len(pools), 1)
+        self.assertIsNone(control._pool)
+        with self.assertRaises(RuntimeError):
+            pools[0].submit(int)
+
+    def test_control_params_from_config(self):
+        """测试搜索参数可以通过玩家配置设置，并随配置字典保存和读取"""
+        config = create_game(0).config
+        config.players_config[1].control_params = {"iterations": 7, "time_budget": 0.01}
+        config = SimpleGameConfig.from_dict(config.to_dict())
+        self.assertEqual(config.players_config[1].control_params, {"iterations": 7, "time_budget": 0.01})
+
+        game_controller = GameController(config)
+        with event_routing(None):
+            game_controller.initialize()
+        control = game_controller.player_controller.get_player(1).control
+        self.assertIsInstance(control, ISMCTSControl)
+        self.assertEqual((control.params.iterations, control.params.time_budget), (7, 0.01))
+        self.assertIs(control.game, game_controller)
+
+    def test_campaign_enemies_search(self):
+        """测试战役章节替换玩家后，搜索AI敌人重新绑定对局并使用指定的参数搜索"""
+        searched = []
+        search = ISMCTSControl._search
+
+        def recording_search(control, snapshot):
+            searched.append(control.params.iterations)
+            return search(control, snapshot)
+
+        random.seed(0)
+        try:
+            with mock.patch.object(ISMCTSControl, "_search", recording_search):
+                start_chapter_one_headless(human_control=False, enemy_control_type=ControlType.ISMCTS_AI,
+                                           enemy_control_params={"iterations": 5, "time_budget": 0.02})
+        finally:
+            while communicator.receive_from_backend() is not None:
+                pass
+        self.assertTrue(searched)
+        self.assertEqual(set(searched), {5})
+
+    def test_headless_chapters_build_search_enemies(self):
+        """测试无交互启动第一、二章时，指定的搜索AI敌人和参数生效（主界面的 --enemy-ai 走这条路径）"""
+        for start, enemy_ids in ((start_chapter_one_headless, [1, 2, 3, 4]), (start_chapter_two_headless, [2, 3, 4])):
+            started = []
+            with mock.patch.object(GameController, "start_game", lambda gc: started.append(gc)):
+                start(human_control=False, enemy_control_type=ControlType.ISMCTS_AI,
+                      enemy_control_params={"iterations": 7})
+            self.assertEqual(len(started), 1)
+            player_controller = started[0].player_controller
+            for pid in enemy_ids:
+                control = player_controller.get_player(pid).control
+                self.assertIsInstance(control, ISMCTSControl, start.__name__)
+                self.assertEqual(control.params.iterations, 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
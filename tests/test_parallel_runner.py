@@ -0,0 +1,60 @@
+# 并行对局测试
+import random
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.game_controller.parallel_runner import run_parallel
+from backend.utils.event_sender import event_routing, get_control_manager
+from config.simple_card_config import SimpleGameConfig, SimpleCardConfig, SimplePlayerConfig
+from config.enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName
+
+
+def create_random_config() -> SimpleGameConfig:
+    """洗牌的4人局（结果由随机种子决定）"""
+    deck_config = [
+        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1, count=20),
+        SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 2, count=10),
+        SimpleCardConfig(CardName.TAO, CardSuit.HEARTS, 3, count=5),
+    ]
+    identities = [PlayerIdentity.LORD, PlayerIdentity.REBEL, PlayerIdentity.LOYALIST, PlayerIdentity.REBEL]
+    players_config = [
+        SimplePlayerConfig(f"玩家{i}", CharacterName.BAI_BAN_WU_JIANG, identity, ControlType.SIMPLE_AI)
+        for i, identity in enumerate(identities)
+    ]
+    return SimpleGameConfig(deck_config=deck_config, players_config=players_config, shuffle_deck=True)
+
+
+class TestParallelRunner(unittest.TestCase):
+    """run_parallel测试"""
+
+    def test_run_parallel_matches_sequential(self):
+        """测试分片到多个进程的结果只取决于每局的种子，与逐局运行一致"""
+        configs = [create_random_config() for _ in range(4)]
+        seeds = [3, 1, 4, 1]
+        sequential = run_parallel(configs, seeds, processes=1)
+        self.assertEqual(run_parallel(configs, seeds, processes=2), sequential)
+        self.assertEqual(sequential[1], sequential[3])
+        for result in sequential:
+            self.assertIsNotNone(result.outcome)
+
+    def test_caller_rng_untouched(self):
+        """测试在当前进程中运行时，对局不改变调用方的全局random状态"""
+        random.seed(42)
+        expected = random.random()
+        random.seed(42)
+        run_parallel([create_random_config()], [7], processes=1)
+        self.assertEqual(random.random(), expected)
+
+    def test_event_routing_restored(self):
+        """测试事件分发范围退出后恢复原来的ControlManager"""
+        previous = get_control_manager()
+        marker = object()
+        with event_routing(marker):
+            self.assertIs(get_control_manager(), marker)
+        self.assertIs(get_control_manager(), previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -86,6 +86,83 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(len(discarded_cards), 0)
         self.assertEqual(len(player.hand_cards), 4)
 
+    def test_hand_cards_index(self):
+        """测试手牌按牌名索引与从左往右的顺序保持一致"""
+        player = Player(1, "测试玩家", ControlType.AI, self.deck, PlayerIdentity.REBEL, CharacterName.BAI_BAN_WU_JIANG)
+        sha1 = Card(CardSuit.HEARTS, 1, CardName.SHA)
+        shan = Card(CardSuit.HEARTS, 2, CardName.SHAN)
+        sha2 = Card(CardSuit.HEARTS, 3, CardName.SHA)
+        player.hand_cards = [sha1, shan]
+        player.hand_cards.append(sha2)
+
+        self.assertTrue(player.hand_cards.has_card(CardName.SHA))
+        self.assertFalse(player.hand_cards.has_card(CardName.TAO))
+        self.assertEqual(player.hand_cards.cards_of(CardName.SHA), [sha1, sha2])
+
+        # 牌在手中被临时改名（如龙胆闪当杀）后仍能正确移除
+        shan.name_enum = CardName.SHA
+        player.hand_cards.remove(shan)
+        self.assertNotIn(shan, player.hand_cards)
+        self.assertEqual(player.hand_cards.cards_of(CardName.SHA), [sha1, sha2])
+        self.assertFalse(player.hand_cards.has_card(CardName.SHAN))
+
+        # 按下标夺牌/清空后索引同步
+        player.hand_cards.pop(0)
+        self.assertEqual(player.hand_cards.cards_of(CardName.SHA), [sha2])
+        player.hand_cards.clear()
+        self.assertFalse(player.hand_cards.has_card(CardName.SHA))
+        self.assertIsNone(player.ask_use_sha("响应决斗"))
+
+    def test_playable_cards_follow_state(self):
+        """测试可出牌缓存随出杀标记、血量和目标变化而更新"""
+        player = Player(1, "测试玩家", ControlType.AI, self.deck, PlayerIdentity.REBEL, CharacterName.BAI_BAN_WU_JIANG)
+        sha = Card(CardSuit.HEARTS, 1, CardName.SHA)
+        tao = Card(CardSuit.HEARTS, 2, CardName.TAO)
+        player.hand_cards = [sha, tao]
+        targets = {"attackable": [2], "all": [2], "dis1": [2], "self": [1]}
+
+        self.assertEqual(player._get_playable_cards(targets), [sha])
+
+        player.current_hp -= 1
+        self.assertEqual(player._get_playable_cards(targets), [sha, tao])
+
+        player.sha_used_this_turn = True
+        self.assertEqual(player._get_playable_cards(targets), [tao])
+
+        # 新入手的同种牌复用已有判定
+        tao2 = Card(CardSuit.HEARTS, 3, CardName.TAO)
+        player.hand_cards.append(tao2)
+        self.assertEqual(player._get_playable_cards(targets), [tao, tao2])
+
+        player.sha_used_this_turn = False
+        self.assertEqual(player._get_playable_cards({"attackable": [], "all": [2], "dis1": [], "self": [1]}), [tao, tao2])
+
+    def test_legal_actions(self):
+        """测试合法动作枚举及其缓存"""
+        player = Player(1, "测试玩家", ControlType.AI, self.deck, PlayerIdentity.REBEL, CharacterName.BAI_BAN_WU_JIANG)
+        player.control.filter_attackable_targets = lambda targets, available=None: targets
+        sha = Card(CardSuit.HEARTS, 1, CardName.SHA)
+        shan = Card(CardSuit.HEARTS, 2, CardName.SHAN)
+        tao = Card(CardSuit.HEARTS, 3, CardName.TAO)
+        nan_man = Card(CardSuit.SPADES, 4, CardName.NAN_MAN_RU_QIN)
+        player.hand_cards = [sha, shan, tao, nan_man]
+        player.current_hp -= 1
+        targets = {"attackable": [2, 3], "all": [2, 3, 4], "dis1": [2], "self": [1]}
+
+        actions = player.legal_actions(targets)
+        self.assertEqual(actions, (
+            (0, CardName.SHA, (2,)),
+            (0, CardName.SHA, (3,)),
+            (2, CardName.TAO, (1,)),
+            (3, CardName.NAN_MAN_RU_QIN, (2, 3, 4)),
+        ))
+        # 状态未变化时返回缓存的结果
+        self.assertIs(player.legal_actions(targets), actions)
+
+        player.sha_used_this_turn = True
+        player.hand_cards.remove(tao)
+        self.assertEqual(player.legal_actions(targets), ((2, CardName.NAN_MAN_RU_QIN, (2, 3, 4)),))
+
 
 if __name__ == '__main__':
     unittest.main()
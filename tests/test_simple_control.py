@@ -0,0 +1,71 @@
+# SimpleControl测试
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.player_controller.player_controller import PlayerController
+from backend.deck.deck import Deck
+from communicator.comm_event import PlayCardEvent
+from config.simple_card_config import SimpleGameConfig, SimpleCardConfig, SimplePlayerConfig
+from config.enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName
+
+
+class TestSimpleControl(unittest.TestCase):
+    """SimpleControl测试"""
+
+    def setUp(self):
+        """测试前准备"""
+        deck_config = [
+            SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1, count=20),
+            SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 2, count=10),
+        ]
+        players_config = [
+            SimplePlayerConfig("主公", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LORD, ControlType.SIMPLE_AI),
+            SimplePlayerConfig("反贼", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.REBEL, ControlType.SIMPLE_AI),
+            SimplePlayerConfig("忠臣", CharacterName.BAI_BAN_WU_JIANG, PlayerIdentity.LOYALIST, ControlType.SIMPLE_AI),
+        ]
+        config = SimpleGameConfig(deck_config=deck_config, players_config=players_config, shuffle_deck=False)
+        self.player_controller = PlayerController(config, Deck(config))
+        self.control_manager = self.player_controller.control_manager
+
+    def test_knowledge_board_shared(self):
+        """测试所有SimpleControl共享同一个公开信息板"""
+        board = self.control_manager.knowledge_board
+        for control in self.control_manager.controls.values():
+            self.assertIs(control.knowledge_board, board)
+
+        # 反贼对主公出杀 -> 跳反，所有观察者都能看到
+        sha = SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1)
+        self.control_manager.notify_event(PlayCardEvent(sha, 1, 0))
+        for control in self.control_manager.controls.values():
+            self.assertIn(1, control.jumped_rebel)
+            self.assertNotIn(1, control.jumped_loyal)
+
+        # 忠臣对已跳反的猪出杀 -> 跳忠
+        self.control_manager.notify_event(PlayCardEvent(sha, 2, 1))
+        self.assertEqual(list(board.jumped_loyal), [2])
+        self.assertEqual(list(board.jumped_rebel), [1])
+
+        # 响应类事件不算表敌意
+        self.control_manager.notify_event(PlayCardEvent(sha, 0, 2, response_type="响应决斗"))
+        self.assertFalse(board.has_jumped(0))
+
+    def test_class_rebel_cleared_for_every_observer(self):
+        """测试跳反时主猪的类反判断被清除，与观察者的通知顺序无关"""
+        controls = self.control_manager.controls
+        lord = controls[0]
+        lord.class_rebel.add(1)
+
+        # 其他观察者先收到事件并完成推断，主猪之后收到同一事件
+        sha = SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1)
+        event = PlayCardEvent(sha, 1, 0)
+        for observer in (controls[2], controls[1], lord):
+            observer.knowledge_board.observe_play_card(event, observer)
+        self.assertIn(1, lord.jumped_rebel)
+        self.assertNotIn(1, lord.class_rebel)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -148,6 +148,19 @@ class TestZhaoyunBasicSkills:
         spades = Card(name=CardName.WU_XIE_KE_JI, suit=CardSuit.SPADES, rank=10)
         assert zhaoyun_player._get_longhun_card_type(spades) == CardName.WU_XIE_KE_JI
 
+    def test_longhun_can_use_wu_xie_ke_ji(self, zhaoyun_player):
+        """测试龙魂黑桃牌计入无懈可击持有判断"""
+        from backend.card.card import Card
+
+        zhaoyun_player.hand_cards = [Card(name=CardName.SHA, suit=CardSuit.SPADES, rank=7)]
+        assert zhaoyun_player.can_use_wu_xie_ke_ji() == False
+
+        zhaoyun_player.set_longhun_evolved(True)
+        assert zhaoyun_player.can_use_wu_xie_ke_ji() == True
+
+        zhaoyun_player.hand_cards = [Card(name=CardName.SHA, suit=CardSuit.HEARTS, rank=7)]
+        assert zhaoyun_player.can_use_wu_xie_ke_ji() == False
+
     def test_juejiang_hand_card_limit(self, zhaoyun_player):
         """测试绝境手牌上限+2（在绝境已解锁的情况下）"""
         # 首先解锁绝境